@@ -0,0 +1,13 @@
+-- ---------------------------------------------------------------------------
+-- Indexes for the set-based "sessions missing results" checks in data-services
+-- ---------------------------------------------------------------------------
+
+-- Past events of a season: seasons(series_id, year) -> events(season_id, end_date).
+CREATE INDEX IF NOT EXISTS idx_events_season_id_end_date
+    ON events(season_id, end_date);
+
+-- Result-bearing sessions of those events, filtered by type.
+CREATE INDEX IF NOT EXISTS idx_sessions_event_id_type
+    ON sessions(event_id, type);
+
+-- The NOT EXISTS probe on results is served by idx_results_session_id.
@@ -0,0 +1,69 @@
+"""Benchmark: FIA race-classification parsing, full-page parse vs restricted <table> parse.
+
+Pass saved classification pages (e.g. curl -o le-mans.html <race-classification URL>),
+or run without arguments to use a synthetic page padded with navigation and scripts:
+
+    python -m benchmarks.classification_parser saved/*.html --number 50
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from ingestion.wec_ingestion import CLASSIFICATION_PARSER, _extract_wec_race_rows
+
+
+def build_classification_page(cars: int = 60) -> str:
+    nav = "".join(f'<li><a href="/section-{i}">Section {i}</a><ul><li>Item</li></ul></li>' for i in range(400))
+    scripts = "".join(f"<script>var config{i} = {{a: {i}, b: '{'x' * 200}'}};</script>" for i in range(60))
+    rows = "".join(
+        f"<tr><td>Classified</td><td>{i}</td><td>{i + 1} TEAM {i}</td><td>A.Driver/B.Driver/C.Driver</td>"
+        f"<td>HYPERCAR</td><td>{380 - i}</td><td>24:00:{i:02d}.000</td><td>+{i} laps</td></tr>"
+        for i in range(1, cars + 1)
+    )
+    table = (
+        "<table><tr><td>Status</td><td>Pos</td><td>Team</td><td>Drivers</td><td>Class</td>"
+        f"<td>Laps</td><td>Total time</td><td>Gap first</td></tr>{rows}</table>"
+    )
+    return f"<html><head>{scripts}</head><body><nav><ul>{nav}</ul></nav><table><tr><td>Ad</td></tr></table>{table}</body></html>"
+
+
+def full_page_tables(html: str) -> int:
+    """The previous approach: build the whole document, then scan every table."""
+    soup = BeautifulSoup(html, "html.parser")
+    return sum(len(table.find_all("tr")) for table in soup.find_all("table"))
+
+
+def _peak_kib(fn, html: str) -> float:
+    tracemalloc.start()
+    fn(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="saved FIA race-classification HTML files")
+    parser.add_argument("--number", type=int, default=20, help="parses per timing run")
+    args = parser.parse_args()
+
+    pages = {}
+    for path in args.pages:
+        with open(path, encoding="utf-8") as f:
+            pages[path] = f.read()
+    if not pages:
+        pages["synthetic"] = build_classification_page()
+
+    print(f"restricted parser: {CLASSIFICATION_PARSER}")
+    for name, html in pages.items():
+        full = min(timeit.repeat(lambda: full_page_tables(html), number=args.number, repeat=3)) / args.number
+        restricted = min(timeit.repeat(lambda: _extract_wec_race_rows(html), number=args.number, repeat=3)) / args.number
+        print(f"{name} ({len(html) / 1024:.0f} KiB, {len(_extract_wec_race_rows(html))} rows)")
+        print(f"  full page:  {full * 1000:7.2f} ms  peak {_peak_kib(full_page_tables, html):8.0f} KiB")
+        print(f"  restricted: {restricted * 1000:7.2f} ms  peak {_peak_kib(_extract_wec_race_rows, html):8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Micro-benchmark: Alkamel/Apache index-page link extraction, regex fast path vs BeautifulSoup.
+
+    python -m benchmarks.directory_parser --entries 40 --number 2000
+"""
+import argparse
+import timeit
+
+from bs4 import BeautifulSoup
+
+from ingestion.imsa_crawler import _extract_index_links
+
+
+def build_index_page(entries: int) -> str:
+    rows = [
+        '<tr><td valign="top"><img src="/icons/back.gif" alt="[PARENTDIR]"></td>'
+        '<td><a href="/Results/">Parent Directory</a></td><td>&nbsp;</td><td align="right">  - </td></tr>'
+    ]
+    for i in range(entries):
+        name = f"{i:02d}_Hour%20{i}/" if i % 2 else f"{i:02d}_Results_Race_Official.JSON"
+        rows.append(
+            f'<tr><td valign="top"><img src="/icons/folder.gif" alt="[DIR]"></td>'
+            f'<td><a href="{name}">{name}</a></td>'
+            f'<td align="right">2025-01-26 14:40  </td><td align="right">  - </td><td>&nbsp;</td></tr>'
+        )
+    return (
+        "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 3.2 Final//EN\">\n<html><head><title>Index of /Results</title>"
+        "</head><body><h1>Index of /Results</h1><table>"
+        '<tr><th><a href="?C=N;O=D">Name</a></th><th><a href="?C=M;O=A">Last modified</a></th></tr>'
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+
+
+def soup_links(page: str) -> list[str]:
+    return [a["href"] for a in BeautifulSoup(page, "html.parser").find_all("a", href=True)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=40, help="directory entries per page")
+    parser.add_argument("--number", type=int, default=2000, help="pages parsed per timing run")
+    args = parser.parse_args()
+
+    page = build_index_page(args.entries)
+    assert _extract_index_links(page) == soup_links(page)
+
+    fast = min(timeit.repeat(lambda: _extract_index_links(page), number=args.number, repeat=3))
+    soup = min(timeit.repeat(lambda: soup_links(page), number=args.number, repeat=3))
+    print(f"{args.entries} entries x {args.number} pages")
+    print(f"  regex fast path: {fast * 1e6 / args.number:8.1f} us/page")
+    print(f"  BeautifulSoup:   {soup * 1e6 / args.number:8.1f} us/page")
+    print(f"  speedup:         {soup / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark: lap_telemetry loading, per-row upsert vs COPY into staging + one merge.
+
+Needs a scratch Postgres (DATABASE_URL) and an existing sessions row to attach laps to.
+Each run happens in a transaction that is rolled back, so the table is left untouched:
+
+    python -m benchmarks.lap_telemetry_load --session-id 42 --cars 60 --laps 800
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from ingestion.config import SessionLocal
+from ingestion.imsa_ingestion import ImsaIngestion
+from ingestion.lap_telemetry_loader import LAP_TELEMETRY_COLUMNS, LAP_TELEMETRY_UPDATE_SET, copy_lap_telemetry
+
+# The per-lap statement sync_lap_telemetry_for_year used to execute.
+PER_ROW_UPSERT_SQL = text(
+    f"""
+    INSERT INTO lap_telemetry ({", ".join(LAP_TELEMETRY_COLUMNS)})
+    VALUES ({", ".join(f":{column}" for column in LAP_TELEMETRY_COLUMNS)})
+    ON CONFLICT (session_id, car_number, lap_number) DO UPDATE SET
+        {LAP_TELEMETRY_UPDATE_SET}
+    """
+)
+
+
+def build_laps(session_id: int, cars: int, laps: int) -> list[dict]:
+    start = datetime(2025, 1, 25, 13, 40, tzinfo=timezone.utc)
+    return [
+        {
+            "session_id": session_id,
+            "driver_id": None,
+            "car_number": str(car),
+            "lap_number": lap,
+            "position": car,
+            "lap_time": "1:36.512",
+            "sector1_time": "31.201",
+            "sector2_time": "33.877",
+            "sector3_time": "31.434",
+            "sector4_time": None,
+            "average_speed_kph": "212.4",
+            "top_speed_kph": "301.9",
+            "session_elapsed": f"{lap * 96}.512",
+            "lap_timestamp": start + timedelta(seconds=lap * 96.5),
+            "is_valid": True,
+            "crossing_pit_finish_lane": lap % 30 == 0,
+        }
+        for car in range(1, cars + 1)
+        for lap in range(1, laps + 1)
+    ]
+
+
+def per_row(db, rows: list[dict]) -> None:
+    for row in rows:
+        db.execute(PER_ROW_UPSERT_SQL, row)
+
+
+def copy_merge(db, rows: list[dict]) -> None:
+    copy_lap_telemetry(db, iter(rows))
+
+
+def _time(loader, rows: list[dict]) -> float:
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        loader(db, rows)
+        return time.perf_counter() - started
+    finally:
+        db.rollback()
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session-id", type=int, required=True, help="existing sessions.id to attach laps to")
+    parser.add_argument("--cars", type=int, default=60)
+    parser.add_argument("--laps", type=int, default=800)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        ImsaIngestion()._ensure_lap_telemetry_table(db)
+        db.commit()
+
+    rows = build_laps(args.session_id, args.cars, args.laps)
+    print(f"{len(rows)} laps ({args.cars} cars x {args.laps} laps), best of {args.repeat}")
+    for name, loader in (("per-row upsert", per_row), ("copy + merge", copy_merge)):
+        best = min(_time(loader, rows) for _ in range(args.repeat))
+        print(f"  {name:15s} {best:8.2f} s  {len(rows) / best:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Time an ingestion entry point end to end, typically against a recorded cassette.
+
+Record once with network access, then replay offline as often as needed:
+
+    HTTP_CASSETTE_MODE=record python -m benchmarks.replay_sync initial
+    HTTP_CASSETTE_MODE=replay python -m benchmarks.replay_sync initial --repeat 3
+
+Targets: initial, historical START-END, wec-backfill START-END, imsa-backfill START-END.
+A database is still required; point DATABASE_URL at a scratch Postgres.
+"""
+import argparse
+import logging
+import time
+
+from ingestion import http_client
+from ingestion.main import (
+    configure_fastf1,
+    run_historical_sync,
+    run_initial_sync,
+    run_series_calendar_backfill,
+)
+
+logger = logging.getLogger("benchmarks.replay_sync")
+
+
+def _parse_years(value: str) -> tuple[int, int]:
+    start_str, end_str = value.split("-", 1)
+    return int(start_str), int(end_str)
+
+
+def _run(target: str, years: str) -> None:
+    if target == "initial":
+        run_initial_sync()
+    elif target == "historical":
+        run_historical_sync(*_parse_years(years))
+    elif target in ("wec-backfill", "imsa-backfill"):
+        run_series_calendar_backfill(target.split("-", 1)[0], *_parse_years(years))
+    else:
+        raise SystemExit(f"Unknown target {target!r}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("target", choices=["initial", "historical", "wec-backfill", "imsa-backfill"])
+    parser.add_argument("years", nargs="?", default="", help="START-END for historical/backfill targets")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    configure_fastf1()
+
+    timings = []
+    for run in range(1, args.repeat + 1):
+        started = time.perf_counter()
+        _run(args.target, args.years)
+        timings.append(time.perf_counter() - started)
+        logger.info("Run %d/%d: %.2fs", run, args.repeat, timings[-1])
+
+    http_client.get_client().log_stats()
+    logger.info(
+        "%s: best %.2fs, mean %.2fs over %d runs",
+        args.target,
+        min(timings),
+        sum(timings) / len(timings),
+        len(timings),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import fastf1
+import requests
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+MODES = (RECORD, REPLAY)
+
+# Headers that change how a replayed body is decoded; transfer headers no longer apply once stored.
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+@dataclass
+class CassetteStats:
+    recorded: int = 0
+    replayed: int = 0
+    misses: int = 0
+
+
+class Cassette:
+    """Gzip-compressed recordings of provider responses, one file per request URL.
+
+    In record mode every final response is written to disk; in replay mode responses
+    are served from disk and the network is never touched."""
+
+    def __init__(self, directory: str, mode: str) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {MODES}")
+        self.directory = directory
+        self.mode = mode
+        self.stats = CassetteStats()
+        self._lock = threading.Lock()
+        os.makedirs(self._http_dir, exist_ok=True)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def _http_dir(self) -> str:
+        return os.path.join(self.directory, "http")
+
+    @property
+    def fastf1_dir(self) -> str:
+        return os.path.join(self.directory, "fastf1")
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._http_dir, f"{key}.gz")
+
+    def record(self, url: str, response: requests.Response) -> None:
+        meta = {
+            "url": url,
+            "status": response.status_code,
+            "headers": {h: response.headers[h] for h in RECORDED_HEADERS if h in response.headers},
+            "encoding": response.encoding,
+        }
+        path = self._path(url)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8") + b"\n")
+            f.write(response.content)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.stats.recorded += 1
+
+    def replay(self, url: str) -> requests.Response:
+        try:
+            with gzip.open(self._path(url), "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.stats.misses += 1
+            raise CassetteMissError(f"No recorded response for {url}")
+
+        with self._lock:
+            self.stats.replayed += 1
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response.url = url
+        response.headers.update(meta["headers"])
+        response.encoding = meta.get("encoding")
+        response._content = body
+        return response
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"mode": self.mode, **asdict(self.stats)}
+
+
+def open_cassette(directory: str, mode: str) -> Optional[Cassette]:
+    """Return a cassette for a configured mode, or None when record/replay is off."""
+    if not mode:
+        return None
+    return Cassette(directory, mode.lower())
+
+
+def enable_fastf1_cassette(cassette: Cassette) -> None:
+    """Point FastF1's own HTTP cache at the cassette and forbid network access on replay."""
+    os.makedirs(cassette.fastf1_dir, exist_ok=True)
+    fastf1.Cache.enable_cache(cassette.fastf1_dir)
+    fastf1.Cache.offline_mode(cassette.replaying)
+    logger.info("FastF1 cache %s at %s", cassette.mode, cassette.fastf1_dir)
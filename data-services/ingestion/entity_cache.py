@@ -0,0 +1,98 @@
+import logging
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import Session as DbSession
+
+from ingestion.models import Circuit, Driver, Season, Team
+
+logger = logging.getLogger(__name__)
+
+
+def find_or_create(db: DbSession, model, filters: dict, defaults: dict):
+    """Generic find-or-create helper."""
+    instance = db.query(model).filter_by(**filters).first()
+    if not instance:
+        instance = model(**filters, **defaults)
+        db.add(instance)
+        db.flush()
+    return instance
+
+
+class EntityCache:
+    """Natural-key lookups for one series within one database session.
+
+    Seasons, teams and the drivers attached to those teams are preloaded with one query
+    each; later lookups are served from memory and new rows are written through, so a
+    sync only queries for entities it has never seen."""
+
+    def __init__(self, db: DbSession, series_id: int) -> None:
+        self.db = db
+        self.series_id = series_id
+        self.queries = 0
+        self.created = 0
+        self._seasons: dict[int, Season] = {
+            season.year: season for season in self._query(Season).filter(Season.series_id == series_id)
+        }
+        self._teams: dict[str, Team] = {
+            team.name: team for team in self._query(Team).filter(Team.series_id == series_id)
+        }
+        self._drivers: dict[str, Driver] = {
+            driver.slug: driver
+            for driver in self._query(Driver).join(Team, Driver.team_id == Team.id).filter(Team.series_id == series_id)
+        }
+        self._circuits: dict[str, Circuit] = {}
+
+    def _query(self, model):
+        self.queries += 1
+        return self.db.query(model)
+
+    def _create(self, instance):
+        self.db.add(instance)
+        self.db.flush()
+        self.created += 1
+        return instance
+
+    def season(self, year: int) -> Season:
+        season = self._seasons.get(year)
+        if season is None:
+            season = self._create(Season(series_id=self.series_id, year=year))
+            self._seasons[year] = season
+        return season
+
+    def circuit(self, name: str, defaults: dict) -> Circuit:
+        circuit = self._circuits.get(name)
+        if circuit is None:
+            self.queries += 1
+            circuit = find_or_create(self.db, Circuit, {"name": name}, defaults)
+            self._circuits[name] = circuit
+        return circuit
+
+    def team(self, name: str, defaults: dict) -> Team:
+        team = self._teams.get(name)
+        if team is None:
+            team = self._create(Team(series_id=self.series_id, name=name, **defaults))
+            self._teams[name] = team
+        return team
+
+    def prefetch_drivers(self, slugs: Iterable[str]) -> None:
+        """Load drivers not attached to this series' teams (e.g. unassigned ones) in a single query."""
+        missing = {slug for slug in slugs if slug not in self._drivers}
+        if not missing:
+            return
+        for driver in self._query(Driver).filter(Driver.slug.in_(missing)):
+            self._drivers[driver.slug] = driver
+        # Remember misses so driver() creates them without asking the database again.
+        for slug in missing:
+            self._drivers.setdefault(slug, None)
+
+    def driver(self, slug: str, name: str, number: Optional[int], team_id: Optional[int]) -> Driver:
+        if slug in self._drivers:
+            driver = self._drivers[slug]
+        else:
+            driver = self._query(Driver).filter(Driver.slug == slug).first()
+        if driver is None:
+            driver = self._create(Driver(name=name, slug=slug, number=number, team_id=team_id))
+        elif team_id and driver.team_id != team_id:
+            driver.team_id = team_id
+        self._drivers[slug] = driver
+        return driver
@@ -0,0 +1,74 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import and_, exists, or_, update
+from sqlalchemy.orm import Session as DbSession
+
+from ingestion.models import Event, Session
+
+logger = logging.getLogger(__name__)
+
+# Sessions without an end_time are assumed to run this long.
+DEFAULT_SESSION_DURATION = timedelta(hours=3)
+
+
+@dataclass
+class StatusChanges:
+    """Ids of the events each transition touched."""
+
+    completed: list[int] = field(default_factory=list)
+    live: list[int] = field(default_factory=list)
+    upcoming: list[int] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.completed) + len(self.live) + len(self.upcoming)
+
+
+def session_window_covers(now: datetime):
+    """SQL predicate: `now` falls in the session's half-open window [start, end), end possibly assumed."""
+    return and_(
+        Session.start_time <= now,
+        or_(
+            Session.end_time > now,
+            and_(Session.end_time.is_(None), Session.start_time > now - DEFAULT_SESSION_DURATION),
+        ),
+    )
+
+
+def _ids(db: DbSession, stmt) -> list[int]:
+    return [event_id for (event_id,) in db.execute(stmt.execution_options(synchronize_session=False))]
+
+
+def apply_status_transitions(db: DbSession, now: datetime, today: Optional[date] = None) -> StatusChanges:
+    """Move events upcoming -> live -> completed with three set-based UPDATE ... RETURNING statements."""
+    today = today or now.date()
+    changes = StatusChanges()
+
+    changes.completed = _ids(
+        db,
+        update(Event)
+        .where(Event.end_date < today, Event.status != "completed")
+        .values(status="completed")
+        .returning(Event.id),
+    )
+    changes.live = _ids(
+        db,
+        update(Event)
+        .where(Event.id == Session.event_id, Event.status == "upcoming", session_window_covers(now))
+        .values(status="live")
+        .returning(Event.id),
+    )
+    changes.upcoming = _ids(
+        db,
+        update(Event)
+        .where(
+            Event.status == "live",
+            ~exists().where(Session.event_id == Event.id, session_window_covers(now)),
+        )
+        .values(status="upcoming")
+        .returning(Event.id),
+    )
+    return changes
@@ -1,20 +1,29 @@
 import logging
-import time
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 import fastf1
 import pandas as pd
-import requests
 from sqlalchemy.orm import Session as DbSession
 
-from ingestion.config import db_session
+from ingestion import http_client
+from ingestion.config import F1_SCHEDULE_CACHE_TTL_SECONDS, F1_SESSION_LOAD_WORKERS, FASTF1_CACHE_DIR, db_session
+from ingestion.entity_cache import EntityCache, find_or_create as _find_or_create
 from ingestion.models import Series, Season, Circuit, Event, Session, Team, Driver, Result
+from ingestion.results_writer import UpsertCounts, upsert_results
+from ingestion.ttl_cache import TtlCache
 
 logger = logging.getLogger(__name__)
 
 SERIES_SLUG = "f1"
 
+# Largest page size the Jolpica API accepts.
+JOLPICA_PAGE_SIZE = 100
+
 # Maps FastF1 session names (from schedule) to our DB session types
 SESSION_TYPE_MAP = {
     "Practice 1": "practice",
@@ -35,6 +44,18 @@ FASTF1_SESSION_CODES = {
     "SQ": "qualifying",
 }
 
+# FastF1 session codes by schedule session name; sprint weekends hold two "qualifying" sessions.
+FASTF1_SESSION_NAME_CODES = {
+    "Sprint Shootout": "SQ",
+    "Sprint Qualifying": "SQ",
+    "Sprint": "S",
+    "Qualifying": "Q",
+    "Race": "R",
+}
+
+# Columns of a FastF1 classification that _create_results reads; workers ship only these.
+RESULT_RECORD_COLUMNS = ["FirstName", "LastName", "TeamName", "DriverNumber", "Position", "Status"]
+
 SESSION_COLUMNS = [
     ("Session1", "Session1Date"),
     ("Session2", "Session2Date"),
@@ -48,6 +69,67 @@ def slugify(text: str) -> str:
     return text.lower().replace(" ", "-").replace(".", "").replace("'", "")
 
 
+def configure_fastf1_cache(directory: str = FASTF1_CACHE_DIR) -> None:
+    """Give FastF1 a persistent on-disk cache so schedule and session data survive restarts."""
+    if not directory:
+        return
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fastf1.Cache.enable_cache(directory)
+    except Exception:
+        logger.warning("FastF1 cache disabled: cannot use %s", directory, exc_info=True)
+        return
+    logger.info("FastF1 cache at %s", directory)
+
+
+@dataclass(frozen=True)
+class F1Schedule:
+    """A season's FastF1 event schedule with slug and round lookups precomputed."""
+
+    year: int
+    frame: pd.DataFrame
+    rounds_by_slug: dict[str, int]
+    names_by_round: dict[int, str]
+
+    def round_for_slug(self, event_slug: str) -> Optional[int]:
+        return self.rounds_by_slug.get(event_slug) or None
+
+    def event_name(self, round_number: int) -> Optional[str]:
+        return self.names_by_round.get(round_number)
+
+
+def _build_schedule(year: int, frame: pd.DataFrame) -> F1Schedule:
+    rounds_by_slug: dict[str, int] = {}
+    names_by_round: dict[int, str] = {}
+    for _, row in frame.iterrows():
+        event_name = str(row.get("EventName", ""))
+        if not event_name or event_name == "nan":
+            continue
+        round_number = int(row.get("RoundNumber", 0))
+        rounds_by_slug.setdefault(slugify(f"{year}-{event_name}"), round_number)
+        names_by_round.setdefault(round_number, event_name)
+    return F1Schedule(year=year, frame=frame, rounds_by_slug=rounds_by_slug, names_by_round=names_by_round)
+
+
+class F1ScheduleProvider:
+    """Loads each season's FastF1 event schedule at most once per TTL."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = F1_SCHEDULE_CACHE_TTL_SECONDS,
+        loader: Optional[Callable[[int], pd.DataFrame]] = None,
+    ) -> None:
+        self._loader = loader
+        self._cache: TtlCache[F1Schedule] = TtlCache(ttl_seconds)
+
+    def get(self, year: int) -> F1Schedule:
+        return self._cache.get_or_load(year, lambda: self._load(year))
+
+    def _load(self, year: int) -> F1Schedule:
+        loader = self._loader or fastf1.get_event_schedule
+        return _build_schedule(year, loader(year))
+
+
 def _get_series(db: DbSession) -> Optional[Series]:
     series = db.query(Series).filter(Series.slug == SERIES_SLUG).first()
     if not series:
@@ -55,40 +137,40 @@ def _get_series(db: DbSession) -> Optional[Series]:
     return series
 
 
-def _find_or_create(db: DbSession, model, filters: dict, defaults: dict):
-    """Generic find-or-create helper."""
-    instance = db.query(model).filter_by(**filters).first()
-    if not instance:
-        instance = model(**filters, **defaults)
-        db.add(instance)
-        db.flush()
-    return instance
+def _find_or_create_circuit(
+    db: DbSession, name: str, country: str, cache: Optional[EntityCache] = None
+) -> Circuit:
+    defaults = {"country": country, "city": "", "timezone": "UTC"}
+    if cache is not None:
+        return cache.circuit(name, defaults)
+    return _find_or_create(db, Circuit, {"name": name}, defaults)
 
 
-def _find_or_create_circuit(db: DbSession, name: str, country: str) -> Circuit:
-    circuit = _find_or_create(db, Circuit, {"name": name}, {"country": country, "city": "", "timezone": "UTC"})
-    return circuit
+def _find_or_create_season(db: DbSession, series_id: int, year: int, cache: Optional[EntityCache] = None) -> Season:
+    if cache is not None:
+        return cache.season(year)
+    return _find_or_create(db, Season, {"series_id": series_id, "year": year}, {})
 
 
-def _find_or_create_season(db: DbSession, series_id: int, year: int) -> Season:
-    return _find_or_create(db, Season, {"series_id": series_id, "year": year}, {})
+def _find_or_create_team(db: DbSession, series_id: int, team_name: str, cache: Optional[EntityCache] = None) -> Team:
+    defaults = {"short_name": team_name[:50], "color": "#888888"}
+    if cache is not None:
+        return cache.team(team_name, defaults)
+    return _find_or_create(db, Team, {"series_id": series_id, "name": team_name}, defaults)
 
 
-def _find_or_create_team(db: DbSession, series_id: int, team_name: str) -> Team:
-    short_name = team_name[:50]
-    return _find_or_create(
-        db, Team,
-        {"series_id": series_id, "name": team_name},
-        {"short_name": short_name, "color": "#888888"},
-    )
+def _driver_slug(first_name: str, last_name: str) -> str:
+    return slugify(f"{first_name} {last_name}")
 
 
 def _find_or_create_driver(
     db: DbSession, first_name: str, last_name: str,
-    number: Optional[int], team_id: Optional[int]
+    number: Optional[int], team_id: Optional[int], cache: Optional[EntityCache] = None
 ) -> Driver:
     full_name = f"{first_name} {last_name}"
-    slug = slugify(full_name)
+    slug = _driver_slug(first_name, last_name)
+    if cache is not None:
+        return cache.driver(slug, full_name, number, team_id)
     driver = db.query(Driver).filter(Driver.slug == slug).first()
     if not driver:
         driver = Driver(name=full_name, slug=slug, number=number, team_id=team_id)
@@ -99,6 +181,69 @@ def _find_or_create_driver(
     return driver
 
 
+@dataclass(frozen=True)
+class LoadProfile:
+    """The FastF1 datasets an ingestion path needs; everything else is skipped by Session.load()."""
+
+    name: str
+    laps: bool = False
+    telemetry: bool = False
+    weather: bool = False
+    messages: bool = False
+
+    def load(self, f1_session) -> None:
+        logger.debug("Loading FastF1 %s with profile %s", f1_session, self.name)
+        f1_session.load(laps=self.laps, telemetry=self.telemetry, weather=self.weather, messages=self.messages)
+
+
+RESULTS_ONLY = LoadProfile("results")
+# Lap timing without car telemetry, used to derive positions when the classification lacks them.
+RESULTS_WITH_LAPS = LoadProfile("results+laps", laps=True)
+
+
+def _load_session_results(f1_session) -> Optional[pd.DataFrame]:
+    """Load a session's classification, pulling lap data only when positions must be derived."""
+    RESULTS_ONLY.load(f1_session)
+    results_df = f1_session.results
+    if results_df is None or results_df.empty:
+        return None
+    if not results_df["Position"].isna().all():
+        return results_df
+
+    RESULTS_WITH_LAPS.load(f1_session)
+    return _derive_positions_from_laps(f1_session, f1_session.results)
+
+
+@dataclass(frozen=True)
+class SessionResultJob:
+    event_slug: str
+    round_number: int
+    session_code: str
+    session_id: int
+
+
+def _init_session_worker(cache_dir: str, offline: bool) -> None:
+    """Process-pool initializer: spawned workers start without the parent's FastF1 cache settings."""
+    configure_fastf1_cache(cache_dir)
+    fastf1.Cache.offline_mode(offline)
+
+
+def _fastf1_worker_settings() -> tuple[str, bool]:
+    cassette = http_client.get_client().cassette
+    if cassette is not None:
+        return cassette.fastf1_dir, cassette.replaying
+    return FASTF1_CACHE_DIR, False
+
+
+def _load_session_records(year: int, round_number: int, session_code: str) -> Optional[list[dict]]:
+    """Load one FastF1 session and reduce it to the compact result records the parent writes."""
+    f1_session = fastf1.get_session(year, round_number, session_code)
+    results_df = _load_session_results(f1_session)
+    if results_df is None:
+        return None
+    return results_df.reindex(columns=RESULT_RECORD_COLUMNS).to_dict("records")
+
+
 def _derive_positions_from_laps(f1_session, results_df: pd.DataFrame) -> pd.DataFrame:
     """When Position is all NaN (post-Ergast shutdown), derive from lap data."""
     if not results_df["Position"].isna().all():
@@ -127,7 +272,7 @@ def _fetch_jolpica_results(year: int, round_number: int) -> Optional[list]:
     """Fetch official race results from the Jolpica API (Ergast successor)."""
     url = f"https://api.jolpi.ca/ergast/f1/{year}/{round_number}/results.json"
     try:
-        resp = requests.get(url, timeout=30)
+        resp = http_client.get(url, conditional=True)
         resp.raise_for_status()
         data = resp.json()
         races = data["MRData"]["RaceTable"]["Races"]
@@ -139,11 +284,33 @@ def _fetch_jolpica_results(year: int, round_number: int) -> Optional[list]:
         return None
 
 
+def _fetch_jolpica_season_results(year: int) -> Optional[dict[int, list]]:
+    """Fetch every race classification of a season, paging through /{year}/results.json."""
+    results_by_round: dict[int, list] = {}
+    offset = 0
+    try:
+        while True:
+            url = f"https://api.jolpi.ca/ergast/f1/{year}/results.json?limit={JOLPICA_PAGE_SIZE}&offset={offset}"
+            resp = http_client.get(url, conditional=True)
+            resp.raise_for_status()
+            data = resp.json()["MRData"]
+            # Pages are cut by result row, so one race can continue on the next page.
+            for race in data["RaceTable"]["Races"]:
+                results_by_round.setdefault(int(race["round"]), []).extend(race.get("Results", []))
+            offset += int(data.get("limit", JOLPICA_PAGE_SIZE))
+            if offset >= int(data.get("total", 0)):
+                break
+    except Exception:
+        logger.exception("Failed to fetch Jolpica season results for %d", year)
+        return None
+    return results_by_round or None
+
+
 def _fetch_jolpica_schedule(year: int) -> Optional[list]:
     """Fetch the full season schedule from the Jolpica API."""
     url = f"https://api.jolpi.ca/ergast/f1/{year}.json"
     try:
-        resp = requests.get(url, timeout=30)
+        resp = http_client.get(url, conditional=True)
         resp.raise_for_status()
         data = resp.json()
         races = data["MRData"]["RaceTable"]["Races"]
@@ -155,6 +322,12 @@ def _fetch_jolpica_schedule(year: int) -> Optional[list]:
 
 class F1Ingestion:
 
+    def __init__(
+        self, schedules: Optional[F1ScheduleProvider] = None, max_workers: int = F1_SESSION_LOAD_WORKERS
+    ) -> None:
+        self.schedules = schedules or F1ScheduleProvider()
+        self.max_workers = max_workers
+
     def sync_calendar(self, year: int) -> None:
         logger.info("Syncing F1 %d calendar...", year)
         with db_session() as db:
@@ -163,7 +336,7 @@ class F1Ingestion:
                 return
 
             season = _find_or_create_season(db, series.id, year)
-            schedule = fastf1.get_event_schedule(year)
+            schedule = self.schedules.get(year).frame
 
             for _, event_row in schedule.iterrows():
                 self._sync_event(db, season, event_row, year)
@@ -235,34 +408,139 @@ class F1Ingestion:
 
     def resolve_round_number(self, year: int, event_slug: str) -> Optional[int]:
         """Look up the FastF1 round number for a given event slug."""
-        schedule = fastf1.get_event_schedule(year)
-        for _, row in schedule.iterrows():
-            event_name = str(row.get("EventName", ""))
-            if not event_name or event_name == "nan":
-                continue
-            if slugify(f"{year}-{event_name}") == event_slug:
-                return int(row.get("RoundNumber", 0)) or None
-        return None
+        return self.schedules.get(year).round_for_slug(event_slug)
+
+    def sync_missing_results(self, year: int, event_slugs: list[str]) -> None:
+        """Sync every session lacking results for the given events, loading FastF1 sessions in parallel
+        worker processes and writing all results in one transaction."""
+        rounds: dict[str, int] = {}
+        for event_slug in event_slugs:
+            round_number = self.resolve_round_number(year, event_slug)
+            if round_number:
+                rounds[event_slug] = round_number
+            else:
+                logger.warning("Could not resolve round number for %s", event_slug)
 
-    def sync_all_session_results_by_slug(self, year: int, event_slug: str) -> None:
-        """Sync results for all session types, looking up round number from slug."""
-        round_number = self.resolve_round_number(year, event_slug)
-        if not round_number:
-            logger.warning("Could not resolve round number for %s", event_slug)
+        jobs = self._pending_session_jobs(rounds)
+        if not jobs:
             return
-        self.sync_all_session_results(year, round_number)
-
-    def sync_all_session_results(self, year: int, round_number: int) -> None:
-        """Sync results for all available session types."""
-        for code, session_type in FASTF1_SESSION_CODES.items():
-            try:
-                self._sync_session_results(year, round_number, code, session_type)
-            except Exception:
-                logger.debug("No %s data for F1 %d Round %d", code, year, round_number)
-
-    def _sync_session_results(
-        self, year: int, round_number: int, session_code: str, session_type: str
+
+        race_results: dict[SessionResultJob, list] = {}
+        for job in jobs:
+            if job.session_code == "R":
+                # Use Jolpica API for race results (correct official classifications)
+                results = _fetch_jolpica_results(year, job.round_number)
+                if results:
+                    race_results[job] = results
+                else:
+                    logger.warning("No Jolpica results for F1 %d Round %d", year, job.round_number)
+
+        session_records = self._load_session_records(year, [job for job in jobs if job.session_code != "R"])
+        self._write_session_results(year, race_results, session_records)
+
+    def _pending_session_jobs(self, rounds: dict[str, int]) -> list[SessionResultJob]:
+        if not rounds:
+            return []
+        with db_session() as db:
+            events = db.query(Event).filter(Event.slug.in_(list(rounds))).all()
+            # Keyed by FastF1 code from the session name: sprint weekends hold two "qualifying" sessions.
+            sessions: dict[tuple[int, str], Session] = {}
+            for s in (
+                db.query(Session)
+                .filter(Session.event_id.in_([e.id for e in events]))
+                .order_by(Session.id)
+                .all()
+            ):
+                code = FASTF1_SESSION_NAME_CODES.get(s.name)
+                if code is not None:
+                    sessions.setdefault((s.event_id, code), s)
+            completed = {
+                session_id
+                for (session_id,) in db.query(Result.session_id)
+                .filter(Result.session_id.in_([s.id for s in sessions.values()]))
+                .distinct()
+                .all()
+            }
+
+            jobs: list[SessionResultJob] = []
+            for event in events:
+                for code in FASTF1_SESSION_CODES:
+                    target = sessions.get((event.id, code))
+                    if target is None or target.id in completed:
+                        continue
+                    jobs.append(SessionResultJob(event.slug, rounds[event.slug], code, target.id))
+            return jobs
+
+    def _load_session_records(
+        self, year: int, jobs: list[SessionResultJob]
+    ) -> dict[SessionResultJob, list[dict]]:
+        """Load FastF1 sessions, in worker processes when more than one is configured and needed."""
+        loaded: dict[SessionResultJob, list[dict]] = {}
+        if not jobs:
+            return loaded
+
+        if self.max_workers <= 1 or len(jobs) == 1:
+            for job in jobs:
+                try:
+                    records = _load_session_records(year, job.round_number, job.session_code)
+                except Exception:
+                    logger.debug("No %s data for F1 %d Round %d", job.session_code, year, job.round_number)
+                    continue
+                if records:
+                    loaded[job] = records
+            return loaded
+
+        # spawn: forked children would inherit the parent's HTTP pools, locks and DB connections.
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(jobs)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_session_worker,
+            initargs=_fastf1_worker_settings(),
+        ) as pool:
+            futures = {
+                job: pool.submit(_load_session_records, year, job.round_number, job.session_code) for job in jobs
+            }
+            for job, future in futures.items():
+                try:
+                    records = future.result()
+                except Exception:
+                    logger.debug("No %s data for F1 %d Round %d", job.session_code, year, job.round_number)
+                    continue
+                if records:
+                    loaded[job] = records
+        return loaded
+
+    def _write_session_results(
+        self,
+        year: int,
+        race_results: dict[SessionResultJob, list],
+        session_records: dict[SessionResultJob, list[dict]],
     ) -> None:
+        if not race_results and not session_records:
+            return
+        with db_session() as db:
+            series = _get_series(db)
+            if not series:
+                return
+
+            cache = EntityCache(db, series.id)
+            for job, results in race_results.items():
+                target = db.get(Session, job.session_id)
+                self._create_results_from_jolpica(db, series, results, target, cache)
+                target.status = "completed"
+                db.get(Event, target.event_id).status = "completed"
+
+            for job, records in session_records.items():
+                target = db.get(Session, job.session_id)
+                frame = pd.DataFrame.from_records(records, columns=RESULT_RECORD_COLUMNS)
+                self._create_results(db, series, frame, target, cache)
+                target.status = "completed"
+
+        logger.info(
+            "F1 %d results sync complete (%d races, %d other sessions).", year, len(race_results), len(session_records)
+        )
+
+    def _sync_session_results(self, year: int, round_number: int, session_code: str, session_id: int) -> None:
         logger.info("Syncing F1 %d Round %d %s results...", year, round_number, session_code)
 
         with db_session() as db:
@@ -270,21 +548,19 @@ class F1Ingestion:
             if not series:
                 return
 
-            schedule = fastf1.get_event_schedule(year)
-            round_row = schedule[schedule["RoundNumber"] == round_number]
-            if round_row.empty:
+            event_name = self.schedules.get(year).event_name(round_number)
+            if event_name is None:
                 return
 
-            event_name = str(round_row.iloc[0]["EventName"])
             event_slug = slugify(f"{year}-{event_name}")
 
             target_event = db.query(Event).filter(Event.slug == event_slug).first()
             if not target_event:
                 return
 
+            # By id: sprint weekends hold two "qualifying" sessions, so the type alone is ambiguous.
             db_session_obj = db.query(Session).filter(
-                Session.event_id == target_event.id,
-                Session.type == session_type,
+                Session.event_id == target_event.id, Session.id == session_id
             ).first()
             if not db_session_obj:
                 return
@@ -303,11 +579,9 @@ class F1Ingestion:
             else:
                 # Use FastF1 for non-race sessions (qualifying, sprint)
                 f1_session = fastf1.get_session(year, round_number, session_code)
-                f1_session.load()
-                results_df = f1_session.results
-                if results_df is None or results_df.empty:
+                results_df = _load_session_results(f1_session)
+                if results_df is None:
                     return
-                results_df = _derive_positions_from_laps(f1_session, results_df)
                 self._create_results(db, series, results_df, db_session_obj)
 
             db_session_obj.status = "completed"
@@ -318,8 +592,11 @@ class F1Ingestion:
         logger.info("F1 %d Round %d %s sync complete.", year, round_number, session_code)
 
     def _create_results(
-        self, db: DbSession, series: Series, results_df: pd.DataFrame, session: Session
-    ) -> None:
+        self, db: DbSession, series: Series, results_df: pd.DataFrame, session: Session,
+        cache: Optional[EntityCache] = None,
+    ) -> UpsertCounts:
+        cache = cache or EntityCache(db, series.id)
+        rows = []
         for _, row in results_df.iterrows():
             first_name = str(row.get("FirstName", ""))
             last_name = str(row.get("LastName", ""))
@@ -332,20 +609,24 @@ class F1Ingestion:
             if position is None:
                 position = 0
 
-            team = _find_or_create_team(db, series.id, team_name)
-            driver = _find_or_create_driver(db, first_name, last_name, driver_number, team.id)
+            team = _find_or_create_team(db, series.id, team_name, cache)
+            driver = _find_or_create_driver(db, first_name, last_name, driver_number, team.id, cache)
 
-            db.add(Result(
-                session_id=session.id,
-                driver_id=driver.id,
-                position=position,
-                status=status,
-                class_name="Overall",
-            ))
+            rows.append({
+                "session_id": session.id,
+                "driver_id": driver.id,
+                "position": position,
+                "status": status,
+                "class_name": "Overall",
+            })
+        return upsert_results(db, rows)
 
     def _create_results_from_jolpica(
-        self, db: DbSession, series: Series, jolpica_results: list, session: Session
-    ) -> None:
+        self, db: DbSession, series: Series, jolpica_results: list, session: Session,
+        cache: Optional[EntityCache] = None,
+    ) -> UpsertCounts:
+        cache = cache or EntityCache(db, series.id)
+        rows = []
         for entry in jolpica_results:
             driver_data = entry["Driver"]
             first_name = driver_data.get("givenName", "")
@@ -364,23 +645,25 @@ class F1Ingestion:
             time_info = entry.get("Time", {})
             gap = time_info.get("time") if time_info else None
 
-            team = _find_or_create_team(db, series.id, team_name)
-            driver = _find_or_create_driver(db, first_name, last_name, driver_number, team.id)
-
-            db.add(Result(
-                session_id=session.id,
-                driver_id=driver.id,
-                position=position,
-                gap=gap,
-                laps=laps,
-                status=status,
-                class_name="Overall",
-            ))
-
-    def sync_calendar_from_jolpica(self, year: int) -> None:
+            team = _find_or_create_team(db, series.id, team_name, cache)
+            driver = _find_or_create_driver(db, first_name, last_name, driver_number, team.id, cache)
+
+            rows.append({
+                "session_id": session.id,
+                "driver_id": driver.id,
+                "position": position,
+                "gap": gap,
+                "laps": laps,
+                "status": status,
+                "class_name": "Overall",
+            })
+        return upsert_results(db, rows)
+
+    def sync_calendar_from_jolpica(self, year: int, races: Optional[list] = None) -> None:
         """Sync calendar for a season using the Jolpica API (works for all years 1950+)."""
         logger.info("Syncing F1 %d calendar from Jolpica...", year)
-        races = _fetch_jolpica_schedule(year)
+        if races is None:
+            races = _fetch_jolpica_schedule(year)
         if not races:
             logger.warning("No Jolpica schedule data for %d", year)
             return
@@ -445,57 +728,60 @@ class F1Ingestion:
 
         logger.info("F1 %d Jolpica calendar sync complete.", year)
 
-    def sync_race_results(self, year: int, round_number: int, race_name: str) -> None:
-        """Sync race results for a single round using Jolpica. Requires the race name to find the event."""
-        event_slug = slugify(f"{year}-{race_name}")
-
-        with db_session() as db:
-            series = _get_series(db)
-            if not series:
-                return
-
-            event = db.query(Event).filter(Event.slug == event_slug).first()
-            if not event:
-                logger.warning("Event not found for slug: %s", event_slug)
-                return
-
-            race_session = db.query(Session).filter(
-                Session.event_id == event.id, Session.type == "race"
-            ).first()
-            if not race_session:
-                logger.warning("No race session for event: %s", event_slug)
-                return
-
-            existing_count = db.query(Result).filter(Result.session_id == race_session.id).count()
-            if existing_count > 0:
-                return
-
-            jolpica_results = _fetch_jolpica_results(year, round_number)
-            if not jolpica_results:
-                logger.warning("No Jolpica results for %d Round %d", year, round_number)
-                return
-
-            self._create_results_from_jolpica(db, series, jolpica_results, race_session)
-            race_session.status = "completed"
-            event.status = "completed"
-
-        logger.info("F1 %d Round %d results sync complete.", year, round_number)
-
     def sync_historical_season(self, year: int) -> None:
         """Sync calendar and all race results for a historical season."""
         logger.info("Syncing historical season: %d", year)
 
-        self.sync_calendar_from_jolpica(year)
-
         races = _fetch_jolpica_schedule(year)
         if not races:
             return
 
-        for race in races:
-            round_number = int(race["round"])
-            race_name = race["raceName"]
-            try:
-                self.sync_race_results(year, round_number, race_name)
-            except Exception:
-                logger.exception("Failed to sync results for %d Round %d", year, round_number)
-            time.sleep(2)
+        self.sync_calendar_from_jolpica(year, races=races)
+
+        results_by_round = _fetch_jolpica_season_results(year)
+        if not results_by_round:
+            logger.warning("No Jolpica season results for %d", year)
+            return
+
+        self._sync_season_results(year, races, results_by_round)
+
+    def _sync_season_results(self, year: int, races: list, results_by_round: dict[int, list]) -> None:
+        """Write a whole season's race classifications in one transaction."""
+        slugs = {slugify(f"{year}-{race['raceName']}"): int(race["round"]) for race in races}
+
+        with db_session() as db:
+            series = _get_series(db)
+            if not series:
+                return
+
+            events = db.query(Event).filter(Event.slug.in_(list(slugs))).all()
+            race_sessions = {
+                s.event_id: s
+                for s in db.query(Session).filter(
+                    Session.event_id.in_([e.id for e in events]), Session.type == "race"
+                ).all()
+            }
+            sessions_with_results = {
+                session_id
+                for (session_id,) in db.query(Result.session_id)
+                .filter(Result.session_id.in_([s.id for s in race_sessions.values()]))
+                .distinct()
+                .all()
+            }
+
+            cache = EntityCache(db, series.id)
+            synced = 0
+            for event in events:
+                race_session = race_sessions.get(event.id)
+                if not race_session or race_session.id in sessions_with_results:
+                    continue
+                round_results = results_by_round.get(slugs[event.slug])
+                if not round_results:
+                    continue
+
+                self._create_results_from_jolpica(db, series, round_results, race_session, cache)
+                race_session.status = "completed"
+                event.status = "completed"
+                synced += 1
+
+        logger.info("F1 %d season results sync complete (%d rounds).", year, synced)
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Response headers kept with the body so a revalidated response decodes the same way.
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+
+
+class HttpCache:
+    """On-disk store of response bodies and validators, keyed by URL and bounded by size."""
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = self._key(url)
+        return os.path.join(self.directory, f"{key}.json"), os.path.join(self.directory, f"{key}.body")
+
+    def _scan(self) -> list[tuple[str, int, float]]:
+        """Return (key, size, last_used) for every stored entry."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".body"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((name[: -len(".body")], st.st_size, st.st_mtime))
+        return entries
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+            os.utime(body_path)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(
+            url=url,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            headers=meta.get("headers", {}),
+            body=body,
+        )
+
+    def store(self, url: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {h: response.headers[h] for h in STORED_HEADERS if h in response.headers},
+            "stored_at": time.time(),
+        }
+        with self._lock:
+            previous = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+            _write_atomic(body_path, body)
+            _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+            self._total_bytes += len(body) - previous
+            self.stats.stores += 1
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def invalidate(self, url: str) -> None:
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            self._remove(meta_path, body_path)
+
+    def _remove(self, meta_path: str, body_path: str) -> None:
+        try:
+            self._total_bytes -= os.path.getsize(body_path)
+            os.remove(body_path)
+        except FileNotFoundError:
+            pass
+        try:
+            os.remove(meta_path)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is back under 90% of its budget."""
+        target = int(self.max_bytes * 0.9)
+        for key, _, _ in sorted(self._scan(), key=lambda e: e[2]):
+            if self._total_bytes <= target:
+                break
+            self._remove(
+                os.path.join(self.directory, f"{key}.json"),
+                os.path.join(self.directory, f"{key}.body"),
+            )
+            self.stats.evictions += 1
+
+    def record_hit(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_saved += len(entry.body)
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.stats.misses += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**asdict(self.stats), "size_bytes": self._total_bytes}
+
+
+def conditional_headers(entry: CacheEntry) -> dict[str, str]:
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def response_from_entry(entry: CacheEntry, not_modified: requests.Response) -> requests.Response:
+    """Rebuild a 200 response from a cached body after the server answered 304."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = entry.url
+    response.headers.update(entry.headers)
+    response.headers.update(not_modified.headers)
+    response.headers.pop("Content-Encoding", None)
+    response.headers.pop("Content-Length", None)
+    response._content = entry.body
+    response.request = not_modified.request
+    response.elapsed = not_modified.elapsed
+    return response
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
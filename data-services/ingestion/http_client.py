@@ -0,0 +1,436 @@
+import io
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ingestion.config import (
+    HTTP_BREAKER_COOLDOWN_SECONDS,
+    HTTP_BREAKER_FAILURE_THRESHOLD,
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_MAX_MB,
+    HTTP_CASSETTE_DIR,
+    HTTP_CASSETTE_MODE,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_RATE_LIMIT_RETRIES,
+    HTTP_RATE_LIMITS,
+    HTTP_READ_TIMEOUT_SECONDS,
+    HTTP_RETRY_AFTER_MAX_SECONDS,
+    HTTP_RETRY_ATTEMPTS,
+    HTTP_RETRY_BASE_DELAY_SECONDS,
+    HTTP_RETRY_MAX_DELAY_SECONDS,
+    HTTP_REVALIDATION_MAX_URLS,
+    HTTP_USER_AGENT,
+)
+from ingestion.cassette import Cassette, open_cassette
+from ingestion.http_cache import HttpCache, conditional_headers, response_from_entry
+from ingestion.rate_limit import RateLimiter, parse_rate_limits, parse_retry_after
+from ingestion.resilience import (
+    TRANSIENT_EXCEPTIONS,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_transient_failure,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROVIDER = "other"
+
+# Maps upstream hosts to the provider name used for pooling and accounting.
+PROVIDER_HOSTS = {
+    "api.jolpi.ca": "jolpica",
+    "api.fia.com": "fia",
+    "www.fia.com": "fia",
+    "imsa.results.alkamelcloud.com": "alkamel",
+}
+
+
+@dataclass
+class RequestStats:
+    requests: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    elapsed_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+    rate_limited: int = 0
+    retries: int = 0
+
+
+def provider_for_url(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return PROVIDER_HOSTS.get(host, DEFAULT_PROVIDER)
+
+
+class HttpClient:
+    """Pooled keep-alive HTTP client shared by all provider fetchers."""
+
+    def __init__(
+        self,
+        max_connections_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = HTTP_READ_TIMEOUT_SECONDS,
+        cache: Optional[HttpCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_retries: int = HTTP_RATE_LIMIT_RETRIES,
+        retry_after_max_seconds: float = HTTP_RETRY_AFTER_MAX_SECONDS,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker_failure_threshold: Optional[int] = None,
+        breaker_cooldown_seconds: float = HTTP_BREAKER_COOLDOWN_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        cassette: Optional[Cassette] = None,
+        max_tracked_urls: int = HTTP_REVALIDATION_MAX_URLS,
+    ) -> None:
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.rate_limit_retries = rate_limit_retries
+        self.retry_after_max_seconds = retry_after_max_seconds
+        self.retry_policy = retry_policy
+        self.breaker_failure_threshold = breaker_failure_threshold
+        self.breaker_cooldown_seconds = breaker_cooldown_seconds
+        self._sleep = sleep
+        self.cassette = cassette
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._sessions: dict[str, requests.Session] = {}
+        self._stats: dict[str, RequestStats] = {}
+        # URLs whose latest fetch was a 304, and the consumers that finished processing their body.
+        # Both are LRU-bounded; a forgotten URL only costs its consumers one extra parse.
+        self.max_tracked_urls = max_tracked_urls
+        self._not_modified: OrderedDict[str, None] = OrderedDict()
+        self._processed: OrderedDict[str, set[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _session_for(self, provider: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(provider)
+            if session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = HTTP_USER_AGENT
+                # pool_block caps concurrent connections per host instead of opening throwaway ones.
+                adapter = HTTPAdapter(
+                    pool_connections=len(PROVIDER_HOSTS),
+                    pool_maxsize=self.max_connections_per_host,
+                    pool_block=True,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[provider] = session
+            return session
+
+    def _breaker_for(self, provider: str) -> Optional[CircuitBreaker]:
+        if not self.breaker_failure_threshold:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(provider)
+            if breaker is None:
+                breaker = CircuitBreaker(self.breaker_failure_threshold, self.breaker_cooldown_seconds)
+                self._breakers[provider] = breaker
+            return breaker
+
+    def _record_throttle(self, provider: str, waited: float, rate_limited: bool = False) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(provider, RequestStats())
+            stats.throttled_seconds += waited
+            if rate_limited:
+                stats.rate_limited += 1
+
+    def _record(self, provider: str, elapsed: float, size: int, failed: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(provider, RequestStats())
+            stats.requests += 1
+            stats.elapsed_seconds += elapsed
+            stats.bytes_received += size
+            if failed:
+                stats.errors += 1
+
+    def get(
+        self, url: str, timeout: Optional[float] = None, conditional: bool = False, **kwargs
+    ) -> requests.Response:
+        """GET a URL. With conditional=True, revalidate against the on-disk cache and
+        serve the cached body when the provider answers 304 Not Modified.
+
+        Raises CircuitOpenError without touching the network while the provider's breaker is open."""
+        provider = provider_for_url(url)
+        if self.cassette is not None and self.cassette.replaying:
+            return self._replay(provider, url)
+
+        session = self._session_for(provider)
+        breaker = self._breaker_for(provider)
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"{provider} circuit is open; skipping {url}")
+
+        entry = None
+        if conditional and self.cache is not None:
+            entry = self.cache.get(url)
+            if entry is not None:
+                kwargs["headers"] = {**conditional_headers(entry), **kwargs.get("headers", {})}
+
+        response = self._send_with_retries(provider, session, url, timeout or self.timeout, kwargs, breaker)
+        if self.cassette is not None and self.cassette.recording:
+            self.cassette.record(url, response)
+
+        if not conditional or self.cache is None:
+            return response
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.record_hit(entry)
+            with self._lock:
+                self._not_modified[url] = None
+                self._touch(self._not_modified, url)
+            return response_from_entry(entry, response)
+
+        self.cache.record_miss()
+        with self._lock:
+            self._not_modified.pop(url, None)
+            self._processed.pop(url, None)
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def _replay(self, provider: str, url: str) -> requests.Response:
+        try:
+            response = self.cassette.replay(url)
+        except Exception:
+            self._record(provider, 0.0, 0, failed=True)
+            raise
+        self._record(provider, 0.0, len(response.content), failed=response.status_code >= 400)
+        return response
+
+    def _send_with_retries(
+        self,
+        provider: str,
+        session: requests.Session,
+        url: str,
+        timeout,
+        kwargs: dict,
+        breaker: Optional[CircuitBreaker],
+    ) -> requests.Response:
+        """Retry connection errors, timeouts and 5xx with jittered backoff, feeding the breaker."""
+        attempts = max(self.retry_policy.max_attempts, 1) if self.retry_policy else 1
+        attempt = 0
+        while True:
+            try:
+                response = self._send(provider, session, url, timeout, kwargs)
+            except TRANSIENT_EXCEPTIONS:
+                if breaker is not None:
+                    breaker.record_failure()
+                if attempt + 1 >= attempts:
+                    raise
+                logger.warning("Transient error fetching %s (attempt %d/%d)", url, attempt + 1, attempts)
+            except Exception:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            else:
+                if not is_transient_failure(response):
+                    if breaker is not None:
+                        breaker.record_success()
+                    return response
+                if breaker is not None:
+                    breaker.record_failure()
+                if attempt + 1 >= attempts:
+                    return response
+                logger.warning(
+                    "HTTP %d from %s (attempt %d/%d)", response.status_code, url, attempt + 1, attempts
+                )
+                response.close()
+
+            self._sleep(self.retry_policy.delay(attempt))
+            attempt += 1
+            with self._lock:
+                self._stats.setdefault(provider, RequestStats()).retries += 1
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(f"{provider} circuit opened while retrying {url}")
+
+    def _send(self, provider: str, session: requests.Session, url: str, timeout, kwargs: dict) -> requests.Response:
+        """Issue the request through the provider's token bucket, waiting out 429 Retry-After."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self._record_throttle(provider, self.rate_limiter.acquire(provider))
+
+            started = time.monotonic()
+            try:
+                response = session.get(url, timeout=timeout, **kwargs)
+            except Exception:
+                self._record(provider, time.monotonic() - started, 0, failed=True)
+                raise
+
+            size = 0 if kwargs.get("stream") else len(response.content)
+            self._record(provider, time.monotonic() - started, size, failed=response.status_code >= 400)
+
+            if response.status_code != 429 or self.rate_limiter is None or attempt >= self.rate_limit_retries:
+                return response
+
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = float(2 ** attempt)
+            if delay > self.retry_after_max_seconds:
+                logger.warning("%s asked for a %.0fs back-off; giving up on %s", provider, delay, url)
+                return response
+
+            self._record_throttle(provider, 0.0, rate_limited=True)
+            self.rate_limiter.defer(provider, delay)
+            response.close()
+            attempt += 1
+
+    @contextmanager
+    def open_stream(self, url: str, **kwargs) -> Iterator[io.BufferedReader]:
+        """GET url and yield its decoded body as a buffered binary stream, read as it arrives."""
+        response = self.get(url, stream=True, **kwargs)
+        try:
+            response.raise_for_status()
+            if response.raw is None or response._content_consumed:
+                # Replayed or recorded responses are already in memory.
+                yield io.BufferedReader(io.BytesIO(response.content))
+            else:
+                response.raw.decode_content = True
+                yield io.BufferedReader(response.raw)
+        finally:
+            if response.raw is not None:
+                response.close()
+
+    def is_unchanged(self, url: str, consumer: str) -> bool:
+        """True when the latest fetch of url was a 304 and consumer already processed that body."""
+        with self._lock:
+            return url in self._not_modified and consumer in self._processed.get(url, set())
+
+    def mark_processed(self, url: str, consumer: str) -> None:
+        """Record that consumer finished its parse/DB work for the current body of url."""
+        with self._lock:
+            self._processed.setdefault(url, set()).add(consumer)
+            self._touch(self._processed, url)
+
+    def _touch(self, entries: OrderedDict, url: str) -> None:
+        """Mark url most recently used and forget the oldest URLs past the cap (caller holds the lock)."""
+        entries.move_to_end(url)
+        while len(entries) > self.max_tracked_urls:
+            entries.popitem(last=False)
+
+    def stats(self) -> dict[str, dict]:
+        with self._lock:
+            stats = {provider: asdict(stats) for provider, stats in self._stats.items()}
+            breakers = dict(self._breakers)
+        for provider, breaker in breakers.items():
+            stats.setdefault(provider, asdict(RequestStats()))["circuit"] = breaker.snapshot()
+        return stats
+
+    def log_stats(self) -> None:
+        for provider, stats in sorted(self.stats().items()):
+            logger.info(
+                "HTTP %s: %d requests, %d errors, %.1f KiB in %.1fs, %.1fs throttled, %d rate-limited",
+                provider,
+                stats["requests"],
+                stats["errors"],
+                stats["bytes_received"] / 1024,
+                stats["elapsed_seconds"],
+                stats["throttled_seconds"],
+                stats["rate_limited"],
+            )
+            circuit = stats.get("circuit")
+            if circuit and (circuit["state"] != "closed" or circuit["trips"]):
+                logger.warning(
+                    "HTTP %s circuit %s: %d trips, %d requests skipped",
+                    provider,
+                    circuit["state"],
+                    circuit["trips"],
+                    circuit["rejected"],
+                )
+        if self.cassette is not None:
+            cassette_stats = self.cassette.snapshot()
+            logger.info(
+                "HTTP cassette (%s): %d recorded, %d replayed, %d missing",
+                cassette_stats["mode"],
+                cassette_stats["recorded"],
+                cassette_stats["replayed"],
+                cassette_stats["misses"],
+            )
+        if self.cache is not None:
+            cache_stats = self.cache.snapshot()
+            logger.info(
+                "HTTP cache: %d hits, %d misses, %d evictions, %.1f KiB saved, %.1f KiB on disk",
+                cache_stats["hits"],
+                cache_stats["misses"],
+                cache_stats["evictions"],
+                cache_stats["bytes_saved"] / 1024,
+                cache_stats["size_bytes"] / 1024,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            cassette = open_cassette(HTTP_CASSETTE_DIR, HTTP_CASSETTE_MODE)
+            if cassette is not None:
+                # Recordings must hold full bodies, so the conditional cache stays out of the way.
+                logger.info("HTTP cassette %s mode at %s", cassette.mode, cassette.directory)
+                _client = HttpClient(
+                    rate_limiter=None if cassette.replaying else _build_rate_limiter(),
+                    retry_policy=_build_retry_policy(),
+                    cassette=cassette,
+                )
+            else:
+                _client = HttpClient(
+                    cache=_open_cache(),
+                    rate_limiter=_build_rate_limiter(),
+                    retry_policy=_build_retry_policy(),
+                    breaker_failure_threshold=HTTP_BREAKER_FAILURE_THRESHOLD,
+                )
+        return _client
+
+
+def _open_cache() -> Optional[HttpCache]:
+    if not HTTP_CACHE_DIR:
+        return None
+    try:
+        return HttpCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_MB * 1024 * 1024)
+    except OSError:
+        logger.warning("HTTP cache disabled: cannot use %s", HTTP_CACHE_DIR, exc_info=True)
+        return None
+
+
+def _build_retry_policy() -> RetryPolicy:
+    return RetryPolicy(HTTP_RETRY_ATTEMPTS, HTTP_RETRY_BASE_DELAY_SECONDS, HTTP_RETRY_MAX_DELAY_SECONDS)
+
+
+def _build_rate_limiter() -> RateLimiter:
+    limits = parse_rate_limits(HTTP_RATE_LIMITS)
+    return RateLimiter(limits, default=limits.get(DEFAULT_PROVIDER, (4.0, 4.0)))
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return get_client().get(url, **kwargs)
+
+
+def open_stream(url: str, **kwargs):
+    return get_client().open_stream(url, **kwargs)
+
+
+def is_unchanged(url: str, consumer: str) -> bool:
+    return get_client().is_unchanged(url, consumer)
+
+
+def mark_processed(url: str, consumer: str) -> None:
+    get_client().mark_processed(url, consumer)
@@ -0,0 +1,232 @@
+import asyncio
+import html
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Callable, Optional
+from urllib.parse import unquote, urljoin, urlsplit
+
+from bs4 import BeautifulSoup
+
+from ingestion import http_client
+from ingestion.config import HTTP_MAX_CONNECTIONS_PER_HOST
+
+logger = logging.getLogger(__name__)
+
+IMSA_RESULTS_BASE_URL = "https://imsa.results.alkamelcloud.com"
+WEATHERTECH_DIR_MARKER = "IMSA%20WeatherTech%20SportsCar%20Championship"
+DIRECTORY_CONSUMER = "imsa-directory"
+
+RESULT_FILE_EXCLUDED_TOKENS = ["grid", "fastest lap", "analysis", "weather", "leadersequence"]
+
+# Apache-style index pages are flat lists of anchors, so a single regex pass recovers every href.
+_ANCHOR_OPEN_RE = re.compile(r"<a\b", re.IGNORECASE)
+_ANCHOR_HREF_RE = re.compile(
+    r"""<a\b[^>]*?\shref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
+
+
+def _extract_index_links(page: str) -> list[str]:
+    """Collect anchor hrefs in document order, falling back to BeautifulSoup for unusual markup."""
+    links = []
+    for match in _ANCHOR_HREF_RE.finditer(page):
+        href = match.group(1) if match.group(1) is not None else match.group(2) or match.group(3) or ""
+        links.append(html.unescape(href) if "&" in href else href)
+
+    # Any anchor the regex could not read (no href, or markup it does not expect) means the page is
+    # not a plain index; let the full parser decide.
+    if len(links) != len(_ANCHOR_OPEN_RE.findall(page)):
+        soup = BeautifulSoup(page, "html.parser")
+        return [a["href"] for a in soup.find_all("a", href=True)]
+    return links
+
+
+def _fetch_directory_links(url: str, parsed: dict[str, list[str]]) -> list[str]:
+    """List a directory's links; `parsed` holds earlier listings, reused while the index page answers 304."""
+    response = http_client.get(url, conditional=True)
+    if url in parsed and http_client.is_unchanged(url, DIRECTORY_CONSUMER):
+        return list(parsed[url])
+
+    links: list[str] = []
+    for href in _extract_index_links(response.text):
+        if href.startswith("?"):
+            continue
+        if href.startswith("/Results/"):
+            continue
+        links.append(href)
+    parsed[url] = links
+    http_client.mark_processed(url, DIRECTORY_CONSUMER)
+    return list(links)
+
+
+def _parse_event_name_from_dir(track_dir: str) -> str:
+    decoded = unquote(track_dir).strip("/")
+    return re.sub(r"^\d+_", "", decoded).strip()
+
+
+def year_dir_url(year: int) -> str:
+    yy = str(year)[-2:]
+    return f"{IMSA_RESULTS_BASE_URL}/Results/{yy}_{year}/"
+
+
+def _result_candidate_rank(decoded: str) -> int:
+    lowered = decoded.lower()
+    if "official" in lowered:
+        rank = 0
+    elif "provisional" in lowered:
+        rank = 1
+    elif "unofficial" in lowered:
+        rank = 2
+    else:
+        rank = 3
+
+    # Hourly snapshots are valid but lower priority than explicit race result files.
+    if "by hour" in lowered:
+        rank += 10
+    if "by class" in lowered:
+        rank += 20
+    return rank
+
+
+def _hour_dir_sort_key(href: str) -> int:
+    m = re.match(r"^(\d+)_", unquote(href))
+    return int(m.group(1)) if m else 0
+
+
+def _collect_artifacts(
+    base_url: str, links: list[str], artifacts: dict[str, str], result_candidates: list[tuple[int, str]]
+) -> None:
+    for href in links:
+        decoded = unquote(href)
+        lowered = decoded.lower()
+        full = urljoin(base_url, href)
+        is_results_file = (lowered.endswith(".json") or lowered.endswith(".csv")) and "results" in lowered
+
+        if is_results_file and any(token in lowered for token in RESULT_FILE_EXCLUDED_TOKENS):
+            is_results_file = False
+
+        if is_results_file:
+            result_candidates.append((_result_candidate_rank(decoded), full))
+
+        if decoded.endswith("23_Time Cards_Race.JSON"):
+            artifacts.setdefault("timecards", full)
+        elif decoded.endswith("12_Lap Chart_Race.JSON"):
+            artifacts.setdefault("lapchart", full)
+
+
+class ImsaCrawler:
+    """Walks the Alkamel year -> track -> series -> race -> hour tree, fetching siblings concurrently."""
+
+    def __init__(
+        self,
+        fetch_links: Optional[Callable[[str], list[str]]] = None,
+        max_concurrency_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+    ) -> None:
+        self._fetch_links = fetch_links
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        # Parsed listings live as long as the crawler, i.e. one ingester's sync cycle.
+        self._directory_links: dict[str, list[str]] = {}
+        # Listings that could not be fetched; a crawl that saw any is incomplete and must not be memoized.
+        self.failed_listings = 0
+
+    def _fetch_directory_links(self, url: str) -> list[str]:
+        return _fetch_directory_links(url, self._directory_links)
+
+    async def _links(self, url: str) -> list[str]:
+        # Semaphores belong to one event loop; start fresh for every asyncio.run().
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphores = {}
+        host = urlsplit(url).netloc
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.max_concurrency_per_host))
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(self._fetch_links or self._fetch_directory_links, url)
+            except Exception:
+                logger.warning("Failed to fetch IMSA directory listing: %s", url, exc_info=True)
+                self.failed_listings += 1
+                return []
+
+    async def discover_events(self, year: int, known: Optional[dict[str, dict]] = None) -> list[dict]:
+        """Discover a season's events; track folders present in known are reused without fetching."""
+        known = known or {}
+        year_url = year_dir_url(year)
+        track_dirs = [h for h in await self._links(year_url) if h.endswith("/") and re.match(r"^\d+_.+/$", h)]
+        events = await asyncio.gather(
+            *(self._discover_event(year, year_url, track_dir, known.get(track_dir)) for track_dir in sorted(track_dirs))
+        )
+        return [event for event in events if event]
+
+    async def _discover_event(
+        self, year: int, year_url: str, track_dir: str, known: Optional[dict] = None
+    ) -> Optional[dict]:
+        if known is not None:
+            return known
+
+        event_name = _parse_event_name_from_dir(track_dir)
+        track_url = urljoin(year_url, track_dir)
+        series_dirs = await self._links(track_url)
+        weathertech_dir = next(
+            (d for d in series_dirs if d.endswith("/") and WEATHERTECH_DIR_MARKER in d),
+            None,
+        )
+        if not weathertech_dir:
+            return None
+
+        series_url = urljoin(track_url, weathertech_dir)
+        race_dirs = [d for d in await self._links(series_url) if d.endswith("/") and "_Race/" in d]
+        if not race_dirs:
+            return None
+
+        race_dir = sorted(race_dirs)[0]
+        date_match = re.match(r"^(\d{8})", race_dir)
+        if date_match:
+            start_date = datetime.strptime(date_match.group(1), "%Y%m%d").date()
+        else:
+            start_date = datetime(year, 1, 1, tzinfo=timezone.utc).date()
+
+        return {
+            "name": event_name,
+            "track_dir": track_dir,
+            "start_date": start_date,
+            "end_date": start_date,
+            "circuit_name": event_name,
+            "series_url": series_url,
+            "race_dir": race_dir,
+        }
+
+    async def find_race_artifacts(self, series_url: str, race_dir: str) -> dict[str, str]:
+        race_url = urljoin(series_url, race_dir)
+        top_links = await self._links(race_url)
+
+        # Endurance events typically store official files in the final hour folder.
+        subdirs = sorted((h for h in top_links if h.endswith("/")), key=_hour_dir_sort_key, reverse=True)
+        sub_urls = [urljoin(race_url, sub) for sub in subdirs]
+        sub_links = await asyncio.gather(*(self._links(url) for url in sub_urls))
+
+        artifacts: dict[str, str] = {}
+        result_candidates: list[tuple[int, str]] = []
+        # Some events expose files directly in the race folder.
+        _collect_artifacts(race_url, top_links, artifacts, result_candidates)
+        for sub_url, links in zip(sub_urls, sub_links):
+            _collect_artifacts(sub_url, links, artifacts, result_candidates)
+
+        if result_candidates:
+            artifacts["results"] = sorted(result_candidates, key=lambda r: r[0])[0][1]
+
+        return artifacts
+
+    async def attach_artifacts(self, events: list[dict]) -> list[dict]:
+        """Return copies of discovered events with their race artifacts under "artifacts"."""
+        artifacts = await asyncio.gather(
+            *(self.find_race_artifacts(event["series_url"], event["race_dir"]) for event in events)
+        )
+        return [{**event, "artifacts": found} for event, found in zip(events, artifacts)]
+
+    async def crawl_year(self, year: int) -> list[dict]:
+        """Discover a season's events together with their race artifacts."""
+        return await self.attach_artifacts(await self.discover_events(year))
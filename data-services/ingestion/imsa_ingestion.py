@@ -1,24 +1,36 @@
+import asyncio
+import codecs
 import json
 import logging
 import re
 import csv
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
-from urllib.parse import unquote, urljoin
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+from urllib.parse import unquote
 
+import ijson
 import requests
-from bs4 import BeautifulSoup
+import urllib3
 from sqlalchemy.orm import Session as DbSession
 from sqlalchemy import text
 
-from ingestion.config import db_session
-from ingestion.models import Circuit, Driver, Event, Result, Season, Series, Session, Team
+from ingestion import http_client
+from ingestion.config import IMSA_CRAWL_CACHE_TTL_SECONDS, db_session
+from ingestion.entity_cache import EntityCache, find_or_create as _find_or_create
+from ingestion.imsa_crawler import ImsaCrawler
+from ingestion.lap_telemetry_loader import copy_lap_telemetry
+from ingestion.models import Circuit, Driver, Event, Season, Series, Session, Team
+from ingestion.results_queries import sessions_missing_results
+from ingestion.results_writer import upsert_results
+from ingestion.ttl_cache import TtlCache
 
 logger = logging.getLogger(__name__)
 
 SERIES_SLUG = "imsa"
-IMSA_RESULTS_BASE_URL = "https://imsa.results.alkamelcloud.com"
+
+# Failures while reading an artifact stream; database errors still propagate.
+TELEMETRY_STREAM_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError)
 
 
 @dataclass(frozen=True)
@@ -56,30 +68,6 @@ def _normalize_class_name(raw: object) -> str:
     return value if value else "Overall"
 
 
-def _parse_event_name_from_dir(track_dir: str) -> str:
-    decoded = unquote(track_dir).strip("/")
-    return re.sub(r"^\d+_", "", decoded).strip()
-
-
-def _fetch_directory_links(url: str) -> list[str]:
-    try:
-        html = requests.get(url, timeout=30).text
-    except Exception:
-        logger.exception("Failed to fetch IMSA directory listing: %s", url)
-        return []
-
-    soup = BeautifulSoup(html, "html.parser")
-    links: list[str] = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if href.startswith("?"):
-            continue
-        if href.startswith("/Results/"):
-            continue
-        links.append(href)
-    return links
-
-
 def _extract_imsa_result_rows_from_json(payload: dict) -> list[dict]:
     rows = payload.get("classification")
     if not isinstance(rows, list):
@@ -189,12 +177,7 @@ def _parse_hour_timestamp(raw: str) -> Optional[datetime]:
         return None
 
 
-def _extract_imsa_lap_telemetry_from_json(timecards_payload: dict, lapchart_payload: dict) -> list[dict]:
-    participants = timecards_payload.get("participants")
-    lap_rows = lapchart_payload.get("laps")
-    if not isinstance(participants, list) or not isinstance(lap_rows, list):
-        return []
-
+def _imsa_lapchart_positions(lap_rows: Iterable[dict]) -> dict[tuple[str, int], int]:
     position_map: dict[tuple[str, int], int] = {}
     for lap in lap_rows:
         lap_number = lap.get("lap_number")
@@ -206,8 +189,13 @@ def _extract_imsa_lap_telemetry_from_json(timecards_payload: dict, lapchart_payl
             pos = item.get("position")
             if car_number and isinstance(pos, int):
                 position_map[(car_number, lap_number)] = pos
+    return position_map
 
-    parsed: list[dict] = []
+
+def _iter_imsa_lap_telemetry(
+    participants: Iterable[dict], position_map: dict[tuple[str, int], int]
+) -> Iterator[dict]:
+    """Yield one lap_telemetry row per time-card lap, one participant at a time."""
     for p in participants:
         car_number = str(p.get("number", "")).strip()
         if not car_number:
@@ -239,28 +227,51 @@ def _extract_imsa_lap_telemetry_from_json(timecards_payload: dict, lapchart_payl
                 if isinstance(idx, int) and idx in sectors:
                     sectors[idx] = str(s.get("time", "")).strip() or None
 
-            parsed.append(
-                {
-                    "car_number": car_number,
-                    "team_name": team_name,
-                    "driver_name": driver_name,
-                    "lap_number": lap_number,
-                    "position": position_map.get((car_number, lap_number)),
-                    "lap_time": str(lap.get("time", "")).strip() or None,
-                    "sector1_time": sectors[1],
-                    "sector2_time": sectors[2],
-                    "sector3_time": sectors[3],
-                    "sector4_time": sectors[4],
-                    "average_speed_kph": str(lap.get("average_speed_kph", "")).strip() or None,
-                    "top_speed_kph": str(lap.get("top_speed_kph", "")).strip() or None,
-                    "session_elapsed": str(lap.get("session_elapsed", "")).strip() or None,
-                    "lap_timestamp": _parse_hour_timestamp(str(lap.get("hour", ""))),
-                    "is_valid": bool(lap.get("is_valid", False)),
-                    "crossing_pit_finish_lane": bool(lap.get("crossing_pit_finish_lane", False)),
-                }
-            )
+            yield {
+                "car_number": car_number,
+                "team_name": team_name,
+                "driver_name": driver_name,
+                "lap_number": lap_number,
+                "position": position_map.get((car_number, lap_number)),
+                "lap_time": str(lap.get("time", "")).strip() or None,
+                "sector1_time": sectors[1],
+                "sector2_time": sectors[2],
+                "sector3_time": sectors[3],
+                "sector4_time": sectors[4],
+                "average_speed_kph": str(lap.get("average_speed_kph", "")).strip() or None,
+                "top_speed_kph": str(lap.get("top_speed_kph", "")).strip() or None,
+                "session_elapsed": str(lap.get("session_elapsed", "")).strip() or None,
+                "lap_timestamp": _parse_hour_timestamp(str(lap.get("hour", ""))),
+                "is_valid": bool(lap.get("is_valid", False)),
+                "crossing_pit_finish_lane": bool(lap.get("crossing_pit_finish_lane", False)),
+            }
 
-    return parsed
+
+def _with_lap_telemetry_ids(
+    db: DbSession, series_id: int, session_id: int, laps: Iterable[dict], cache: EntityCache
+) -> Iterator[dict]:
+    """Attach session and driver ids to parsed time-card laps, creating unseen teams and drivers."""
+    for row in laps:
+        team = _find_or_create_team(db, series_id, row["team_name"], cache)
+        car_number_int = int(row["car_number"]) if row["car_number"].isdigit() else None
+        driver = _find_or_create_driver(db, row["driver_name"], car_number_int, team.id, cache)
+        yield {**row, "session_id": session_id, "driver_id": driver.id}
+
+
+def _extract_imsa_lap_telemetry_from_json(timecards_payload: dict, lapchart_payload: dict) -> list[dict]:
+    participants = timecards_payload.get("participants")
+    lap_rows = lapchart_payload.get("laps")
+    if not isinstance(participants, list) or not isinstance(lap_rows, list):
+        return []
+    return list(_iter_imsa_lap_telemetry(participants, _imsa_lapchart_positions(lap_rows)))
+
+
+def _iter_json_items(stream: BinaryIO, prefix: str) -> Iterator:
+    """Yield the items under prefix (e.g. "laps.item") from a JSON byte stream without loading it whole."""
+    # Alkamel exports start with a UTF-8 BOM, which the incremental parser rejects.
+    if stream.peek(len(codecs.BOM_UTF8))[: len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+        stream.read(len(codecs.BOM_UTF8))
+    return ijson.items(stream, prefix, use_float=True)
 
 
 def _get_series(db: DbSession) -> Optional[Series]:
@@ -270,16 +281,9 @@ def _get_series(db: DbSession) -> Optional[Series]:
     return series
 
 
-def _find_or_create(db: DbSession, model, filters: dict, defaults: dict):
-    instance = db.query(model).filter_by(**filters).first()
-    if not instance:
-        instance = model(**filters, **defaults)
-        db.add(instance)
-        db.flush()
-    return instance
-
-
-def _find_or_create_season(db: DbSession, series_id: int, year: int) -> Season:
+def _find_or_create_season(db: DbSession, series_id: int, year: int, cache: Optional[EntityCache] = None) -> Season:
+    if cache is not None:
+        return cache.season(year)
     return _find_or_create(db, Season, {"series_id": series_id, "year": year}, {})
 
 
@@ -298,19 +302,24 @@ def _find_or_create_circuit(db: DbSession, circuit_name: str) -> Circuit:
     )
 
 
-def _find_or_create_team(db: DbSession, series_id: int, team_name: str) -> Team:
-    short_name = team_name[:50]
-    return _find_or_create(
-        db,
-        Team,
-        {"series_id": series_id, "name": team_name},
-        {"short_name": short_name, "color": "#4D4D4D"},
-    )
+def _find_or_create_team(db: DbSession, series_id: int, team_name: str, cache: Optional[EntityCache] = None) -> Team:
+    defaults = {"short_name": team_name[:50], "color": "#4D4D4D"}
+    if cache is not None:
+        return cache.team(team_name, defaults)
+    return _find_or_create(db, Team, {"series_id": series_id, "name": team_name}, defaults)
 
 
-def _find_or_create_driver(db: DbSession, display_name: str, number: Optional[int], team_id: int) -> Driver:
+def _driver_slug(display_name: str, number: Optional[int]) -> str:
     number_part = str(number) if number is not None else "na"
-    slug = _slugify(f"imsa-{display_name}-{number_part}")
+    return _slugify(f"imsa-{display_name}-{number_part}")
+
+
+def _find_or_create_driver(
+    db: DbSession, display_name: str, number: Optional[int], team_id: int, cache: Optional[EntityCache] = None
+) -> Driver:
+    slug = _driver_slug(display_name, number)
+    if cache is not None:
+        return cache.driver(slug, display_name, number, team_id)
     driver = db.query(Driver).filter(Driver.slug == slug).first()
     if not driver:
         driver = Driver(name=display_name, slug=slug, number=number, team_id=team_id)
@@ -321,123 +330,203 @@ def _find_or_create_driver(db: DbSession, display_name: str, number: Optional[in
     return driver
 
 
-class ImsaIngestion:
-    def _year_dir_url(self, year: int) -> str:
-        yy = str(year)[-2:]
-        return f"{IMSA_RESULTS_BASE_URL}/Results/{yy}_{year}/"
+def _has_final_artifacts(artifacts: dict[str, str]) -> bool:
+    """Official results plus both telemetry files mean the race folder will not change again."""
+    results_url = unquote(artifacts.get("results") or "").lower()
+    return (
+        "official" in results_url
+        and "unofficial" not in results_url
+        and bool(artifacts.get("timecards"))
+        and bool(artifacts.get("lapchart"))
+    )
 
-    def _discover_weathertech_events(self, year: int) -> list[dict]:
-        year_url = self._year_dir_url(year)
-        track_dirs = [h for h in _fetch_directory_links(year_url) if h.endswith("/") and re.match(r"^\d+_.+/$", h)]
-        events: list[dict] = []
 
-        for track_dir in sorted(track_dirs):
-            event_name = _parse_event_name_from_dir(track_dir)
-            track_url = urljoin(year_url, track_dir)
-            series_dirs = _fetch_directory_links(track_url)
-            weathertech_dir = next(
-                (
-                    d
-                    for d in series_dirs
-                    if d.endswith("/") and "IMSA%20WeatherTech%20SportsCar%20Championship" in d
-                ),
-                None,
-            )
-            if not weathertech_dir:
-                continue
+def _is_sealed_season(year: int, indexed: list[dict]) -> bool:
+    """A past season whose every indexed event has final artifacts and was crawled after the season ended.
 
-            series_url = urljoin(track_url, weathertech_dir)
-            race_dirs = [d for d in _fetch_directory_links(series_url) if d.endswith("/") and "_Race/" in d]
-            if not race_dirs:
-                continue
+    A folder that failed to list yields no artifacts, so it keeps the season open to be crawled again."""
+    if not indexed or year >= datetime.now(timezone.utc).year:
+        return False
+    season_end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    return all(item["crawled_at"] >= season_end and _has_final_artifacts(item["artifacts"]) for item in indexed)
 
-            race_dir = sorted(race_dirs)[0]
-            date_match = re.match(r"^(\d{8})", race_dir)
-            if date_match:
-                start_date = datetime.strptime(date_match.group(1), "%Y%m%d").date()
-            else:
-                start_date = datetime(year, 1, 1, tzinfo=timezone.utc).date()
 
+class ImsaArtifactIndex:
+    """Postgres manifest of discovered Alkamel event folders and race artifact URLs."""
+
+    def _ensure_table(self, db: DbSession) -> None:
+        db.execute(
+            text(
+                """
+                CREATE TABLE IF NOT EXISTS imsa_artifact_index (
+                    id BIGSERIAL PRIMARY KEY,
+                    year INT NOT NULL,
+                    track_dir TEXT NOT NULL,
+                    event_name VARCHAR(200) NOT NULL,
+                    start_date DATE NOT NULL,
+                    series_url TEXT NOT NULL,
+                    race_dir TEXT NOT NULL,
+                    results_url TEXT,
+                    timecards_url TEXT,
+                    lapchart_url TEXT,
+                    crawled_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    UNIQUE (year, track_dir)
+                );
+                """
+            )
+        )
+
+    def load(self, year: int) -> list[dict]:
+        try:
+            with db_session() as db:
+                self._ensure_table(db)
+                rows = db.execute(
+                    text(
+                        """
+                        SELECT track_dir, event_name, start_date, series_url, race_dir,
+                               results_url, timecards_url, lapchart_url, crawled_at
+                        FROM imsa_artifact_index
+                        WHERE year = :year
+                        ORDER BY track_dir
+                        """
+                    ),
+                    {"year": year},
+                ).mappings().all()
+        except Exception:
+            logger.warning("Could not load IMSA artifact index for %d", year, exc_info=True)
+            return []
+
+        events: list[dict] = []
+        for row in rows:
+            artifacts = {
+                key: row[column]
+                for key, column in (("results", "results_url"), ("timecards", "timecards_url"), ("lapchart", "lapchart_url"))
+                if row[column]
+            }
             events.append(
                 {
-                    "name": event_name,
-                    "slug": _slugify(f"{year}-{event_name}"),
-                    "start_date": start_date,
-                    "end_date": start_date,
-                    "circuit_name": event_name,
-                    "series_url": series_url,
-                    "race_dir": race_dir,
+                    "name": row["event_name"],
+                    "track_dir": row["track_dir"],
+                    "start_date": row["start_date"],
+                    "end_date": row["start_date"],
+                    "circuit_name": row["event_name"],
+                    "series_url": row["series_url"],
+                    "race_dir": row["race_dir"],
+                    "artifacts": artifacts,
+                    "crawled_at": row["crawled_at"],
                 }
             )
-
         return events
 
-    def _find_race_artifacts(self, series_url: str, race_dir: str) -> dict[str, str]:
-        race_url = urljoin(series_url, race_dir)
-        top_links = _fetch_directory_links(race_url)
-
-        artifacts: dict[str, str] = {}
-        result_candidates: list[tuple[int, str]] = []
-
-        def candidate_rank(decoded: str) -> int:
-            lowered = decoded.lower()
-            if "official" in lowered:
-                rank = 0
-            elif "provisional" in lowered:
-                rank = 1
-            elif "unofficial" in lowered:
-                rank = 2
-            else:
-                rank = 3
-
-            # Hourly snapshots are valid but lower priority than explicit race result files.
-            if "by hour" in lowered:
-                rank += 10
-            if "by class" in lowered:
-                rank += 20
-            return rank
-
-        def pick_artifact(base_url: str, links: list[str]) -> None:
-            for href in links:
-                decoded = unquote(href)
-                lowered = decoded.lower()
-                full = urljoin(base_url, href)
-                is_results_file = (
-                    lowered.endswith(".json") or lowered.endswith(".csv")
-                ) and "results" in lowered
-
-                if is_results_file and any(
-                    token in lowered
-                    for token in ["grid", "fastest lap", "analysis", "weather", "leadersequence"]
-                ):
-                    is_results_file = False
-
-                if is_results_file:
-                    result_candidates.append((candidate_rank(decoded), full))
-
-                if decoded.endswith("23_Time Cards_Race.JSON"):
-                    artifacts.setdefault("timecards", full)
-                elif decoded.endswith("12_Lap Chart_Race.JSON"):
-                    artifacts.setdefault("lapchart", full)
+    def save(self, year: int, events: list[dict]) -> None:
+        if not events:
+            return
+        upsert_sql = text(
+            """
+            INSERT INTO imsa_artifact_index (
+                year, track_dir, event_name, start_date, series_url, race_dir,
+                results_url, timecards_url, lapchart_url, crawled_at
+            )
+            VALUES (
+                :year, :track_dir, :event_name, :start_date, :series_url, :race_dir,
+                :results_url, :timecards_url, :lapchart_url, now()
+            )
+            ON CONFLICT (year, track_dir) DO UPDATE SET
+                event_name = EXCLUDED.event_name,
+                start_date = EXCLUDED.start_date,
+                series_url = EXCLUDED.series_url,
+                race_dir = EXCLUDED.race_dir,
+                results_url = EXCLUDED.results_url,
+                timecards_url = EXCLUDED.timecards_url,
+                lapchart_url = EXCLUDED.lapchart_url,
+                crawled_at = EXCLUDED.crawled_at
+            """
+        )
+        try:
+            with db_session() as db:
+                self._ensure_table(db)
+                db.execute(
+                    upsert_sql,
+                    [
+                        {
+                            "year": year,
+                            "track_dir": item["track_dir"],
+                            "event_name": item["name"],
+                            "start_date": item["start_date"],
+                            "series_url": item["series_url"],
+                            "race_dir": item["race_dir"],
+                            "results_url": item["artifacts"].get("results"),
+                            "timecards_url": item["artifacts"].get("timecards"),
+                            "lapchart_url": item["artifacts"].get("lapchart"),
+                        }
+                        for item in events
+                    ],
+                )
+        except Exception:
+            logger.warning("Could not save IMSA artifact index for %d", year, exc_info=True)
 
-        # Some events expose files directly in the race folder.
-        pick_artifact(race_url, top_links)
 
-        # Endurance events typically store official files in the final hour folder.
-        subdirs = [h for h in top_links if h.endswith("/")]
+class ImsaIngestion:
+    def __init__(
+        self,
+        crawler: Optional[ImsaCrawler] = None,
+        crawl_ttl_seconds: float = IMSA_CRAWL_CACHE_TTL_SECONDS,
+        artifact_index: Optional[ImsaArtifactIndex] = None,
+    ) -> None:
+        self.crawler = crawler or ImsaCrawler()
+        self.artifact_index = artifact_index or ImsaArtifactIndex()
+        # Shared by calendar, results and telemetry so each year's tree is walked once per cycle.
+        self._crawl_cache: TtlCache[list[dict]] = TtlCache(crawl_ttl_seconds)
+
+    def _memoized_crawl(self, key: tuple, load: Callable[[], list[dict]]) -> list[dict]:
+        """Memoize a crawl for the TTL unless a directory listing failed while it ran."""
+        failures = self.crawler.failed_listings
+        events = self._crawl_cache.get_or_load(key, load)
+        if self.crawler.failed_listings != failures:
+            # A partial crawl should be retried on the next call rather than remembered.
+            self._crawl_cache.invalidate(key)
+        return events
 
-        def sort_key(h: str) -> int:
-            m = re.match(r"^(\d+)_", unquote(h))
-            return int(m.group(1)) if m else 0
+    def _indexed_events(self, year: int) -> list[dict]:
+        return self._crawl_cache.get_or_load(("index", year), lambda: self.artifact_index.load(year))
 
-        for sub in sorted(subdirs, key=sort_key, reverse=True):
-            sub_url = urljoin(race_url, sub)
-            pick_artifact(sub_url, _fetch_directory_links(sub_url))
+    def _discover_weathertech_events(self, year: int) -> list[dict]:
+        def load() -> list[dict]:
+            indexed = self._indexed_events(year)
+            if _is_sealed_season(year, indexed):
+                logger.info("IMSA %d served from artifact index (%d events)", year, len(indexed))
+                return [self._with_slug(year, event) for event in indexed]
+
+            # Event folders with final artifacts are reused; only the rest of the tree is walked.
+            known = {event["track_dir"]: event for event in indexed if _has_final_artifacts(event["artifacts"])}
+            events = asyncio.run(self.crawler.discover_events(year, known=known))
+            return [self._with_slug(year, event) for event in events]
+
+        return self._memoized_crawl(("events", year), load)
+
+    def _crawl_year(self, year: int) -> list[dict]:
+        """Discover events and their race artifacts, reusing any discovery done this cycle."""
+        def load() -> list[dict]:
+            events = self._discover_weathertech_events(year)
+            if _is_sealed_season(year, self._indexed_events(year)):
+                return events
+
+            pending = [event for event in events if "artifacts" not in event]
+            crawled = asyncio.run(self.crawler.attach_artifacts(pending)) if pending else []
+            by_track = {event["track_dir"]: event for event in crawled}
+            merged = [by_track.get(event["track_dir"], event) for event in events]
+            if year < datetime.now(timezone.utc).year:
+                # Reused folders already hold final artifacts; re-stamping them once the season is over
+                # lets it seal even when every event was first indexed while the season ran.
+                self.artifact_index.save(year, merged)
+            else:
+                self.artifact_index.save(year, crawled)
+            return merged
 
-        if result_candidates:
-            artifacts["results"] = sorted(result_candidates, key=lambda r: r[0])[0][1]
+        return self._memoized_crawl(("artifacts", year), load)
 
-        return artifacts
+    def _with_slug(self, year: int, event: dict) -> dict:
+        return {**event, "slug": _slugify(f"{year}-{event['name']}")}
 
     def _ensure_lap_telemetry_table(self, db: DbSession) -> None:
         db.execute(
@@ -525,12 +614,12 @@ class ImsaIngestion:
 
         logger.info("IMSA %d calendar sync complete (%d events).", year, len(events))
 
-    def sync_results_for_year(self, year: int) -> None:
+    def sync_results_for_year(self, year: int, event_slugs: Optional[Iterable[str]] = None) -> None:
         logger.info("Syncing IMSA %d race results from official results index...", year)
-        discovered = self._discover_weathertech_events(year)
+        discovered = self._crawl_year(year)
         event_to_json: dict[str, str] = {}
         for item in discovered:
-            json_url = self._find_race_artifacts(item["series_url"], item["race_dir"]).get("results")
+            json_url = item["artifacts"].get("results")
             if json_url:
                 event_to_json[item["slug"]] = json_url
 
@@ -547,20 +636,14 @@ class ImsaIngestion:
                 logger.warning("IMSA season %d not found; run calendar sync first", year)
                 return
 
-            events = db.query(Event).filter(Event.season_id == season.id).all()
-            for event in events:
-                race_session = db.query(Session).filter(Session.event_id == event.id, Session.type == "race").first()
-                if not race_session:
-                    continue
-                if db.query(Result).filter(Result.session_id == race_session.id).count() > 0:
-                    continue
-
+            cache = EntityCache(db, series.id)
+            for event, race_session in sessions_missing_results(db, SERIES_SLUG, year, ("race",), event_slugs):
                 json_url = event_to_json.get(event.slug)
                 if not json_url:
                     continue
 
                 try:
-                    raw = requests.get(json_url, timeout=30).content
+                    raw = http_client.get(json_url, conditional=True).content
                 except Exception:
                     logger.exception("Failed to fetch/parse IMSA race JSON for %s", event.slug)
                     continue
@@ -583,33 +666,38 @@ class ImsaIngestion:
                     logger.warning("No IMSA rows parsed for %s", event.slug)
                     continue
 
+                cache.prefetch_drivers(_driver_slug(row["driver_name"], row["car_number"]) for row in rows)
+                result_rows = []
                 for row in rows:
-                    team = _find_or_create_team(db, series.id, row["team_name"])
-                    driver = _find_or_create_driver(db, row["driver_name"], row["car_number"], team.id)
-                    db.add(
-                        Result(
-                            session_id=race_session.id,
-                            driver_id=driver.id,
-                            position=row["position"],
-                            laps=row["laps"],
-                            time=row["time"],
-                            gap=row["gap"],
-                            status=row["status"],
-                            class_name=row["class_name"],
-                        )
+                    team = _find_or_create_team(db, series.id, row["team_name"], cache)
+                    driver = _find_or_create_driver(db, row["driver_name"], row["car_number"], team.id, cache)
+                    result_rows.append(
+                        {
+                            "session_id": race_session.id,
+                            "driver_id": driver.id,
+                            "position": row["position"],
+                            "laps": row["laps"],
+                            "time": row["time"],
+                            "gap": row["gap"],
+                            "status": row["status"],
+                            "class_name": row["class_name"],
+                        }
                     )
+                counts = upsert_results(db, result_rows)
 
                 race_session.status = "completed"
                 if event.end_date and event.end_date <= datetime.now(timezone.utc).date():
                     event.status = "completed"
-                logger.info("Synced IMSA results for %s (%d rows)", event.slug, len(rows))
+                logger.info(
+                    "Synced IMSA results for %s (%d inserted, %d updated)", event.slug, counts.inserted, counts.updated
+                )
 
     def sync_lap_telemetry_for_year(self, year: int) -> None:
         logger.info("Syncing IMSA %d lap telemetry (time cards + lap chart)...", year)
-        discovered = self._discover_weathertech_events(year)
+        discovered = self._crawl_year(year)
         event_to_artifacts: dict[str, dict[str, str]] = {}
         for item in discovered:
-            artifacts = self._find_race_artifacts(item["series_url"], item["race_dir"])
+            artifacts = item["artifacts"]
             if artifacts.get("timecards") and artifacts.get("lapchart"):
                 event_to_artifacts[item["slug"]] = artifacts
 
@@ -627,6 +715,7 @@ class ImsaIngestion:
                 logger.warning("IMSA season %d not found; run calendar sync first", year)
                 return
 
+            cache = EntityCache(db, series.id)
             events = db.query(Event).filter(Event.season_id == season.id).all()
             for event in events:
                 artifacts = event_to_artifacts.get(event.slug)
@@ -638,74 +727,25 @@ class ImsaIngestion:
                     continue
 
                 try:
-                    timecards = json.loads(requests.get(artifacts["timecards"], timeout=30).content.decode("utf-8-sig"))
-                    lapchart = json.loads(requests.get(artifacts["lapchart"], timeout=30).content.decode("utf-8-sig"))
+                    with http_client.open_stream(artifacts["lapchart"]) as lapchart:
+                        position_map = _imsa_lapchart_positions(_iter_json_items(lapchart, "laps.item"))
                 except Exception:
-                    logger.exception("Failed to fetch IMSA telemetry artifacts for %s", event.slug)
+                    logger.exception("Failed to fetch IMSA lap chart for %s", event.slug)
                     continue
 
-                lap_rows = _extract_imsa_lap_telemetry_from_json(timecards, lapchart)
-                if not lap_rows:
-                    logger.warning("No IMSA lap telemetry rows parsed for %s", event.slug)
+                try:
+                    with http_client.open_stream(artifacts["timecards"]) as timecards:
+                        participants = _iter_json_items(timecards, "participants.item")
+                        laps = _iter_imsa_lap_telemetry(participants, position_map)
+                        upserted = copy_lap_telemetry(
+                            db, _with_lap_telemetry_ids(db, series.id, race_session.id, laps, cache)
+                        )
+                except TELEMETRY_STREAM_ERRORS:
+                    logger.exception("Failed to stream IMSA time cards for %s", event.slug)
                     continue
 
-                upsert_sql = text(
-                    """
-                    INSERT INTO lap_telemetry (
-                        session_id, driver_id, car_number, lap_number, position, lap_time,
-                        sector1_time, sector2_time, sector3_time, sector4_time,
-                        average_speed_kph, top_speed_kph, session_elapsed, lap_timestamp,
-                        is_valid, crossing_pit_finish_lane
-                    )
-                    VALUES (
-                        :session_id, :driver_id, :car_number, :lap_number, :position, :lap_time,
-                        :sector1_time, :sector2_time, :sector3_time, :sector4_time,
-                        :average_speed_kph, :top_speed_kph, :session_elapsed, :lap_timestamp,
-                        :is_valid, :crossing_pit_finish_lane
-                    )
-                    ON CONFLICT (session_id, car_number, lap_number) DO UPDATE SET
-                        driver_id = EXCLUDED.driver_id,
-                        position = EXCLUDED.position,
-                        lap_time = EXCLUDED.lap_time,
-                        sector1_time = EXCLUDED.sector1_time,
-                        sector2_time = EXCLUDED.sector2_time,
-                        sector3_time = EXCLUDED.sector3_time,
-                        sector4_time = EXCLUDED.sector4_time,
-                        average_speed_kph = EXCLUDED.average_speed_kph,
-                        top_speed_kph = EXCLUDED.top_speed_kph,
-                        session_elapsed = EXCLUDED.session_elapsed,
-                        lap_timestamp = EXCLUDED.lap_timestamp,
-                        is_valid = EXCLUDED.is_valid,
-                        crossing_pit_finish_lane = EXCLUDED.crossing_pit_finish_lane
-                    """
-                )
-
-                upserted = 0
-                for row in lap_rows:
-                    team = _find_or_create_team(db, series.id, row["team_name"])
-                    car_number_int = int(row["car_number"]) if row["car_number"].isdigit() else None
-                    driver = _find_or_create_driver(db, row["driver_name"], car_number_int, team.id)
-                    db.execute(
-                        upsert_sql,
-                        {
-                            "session_id": race_session.id,
-                            "driver_id": driver.id,
-                            "car_number": row["car_number"],
-                            "lap_number": row["lap_number"],
-                            "position": row["position"],
-                            "lap_time": row["lap_time"],
-                            "sector1_time": row["sector1_time"],
-                            "sector2_time": row["sector2_time"],
-                            "sector3_time": row["sector3_time"],
-                            "sector4_time": row["sector4_time"],
-                            "average_speed_kph": row["average_speed_kph"],
-                            "top_speed_kph": row["top_speed_kph"],
-                            "session_elapsed": row["session_elapsed"],
-                            "lap_timestamp": row["lap_timestamp"],
-                            "is_valid": row["is_valid"],
-                            "crossing_pit_finish_lane": row["crossing_pit_finish_lane"],
-                        },
-                    )
-                    upserted += 1
+                if not upserted:
+                    logger.warning("No IMSA lap telemetry rows parsed for %s", event.slug)
+                    continue
 
                 logger.info("Synced IMSA lap telemetry for %s (%d laps)", event.slug, upserted)
@@ -0,0 +1,125 @@
+import io
+import logging
+import tempfile
+from datetime import datetime
+from typing import IO, Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session as DbSession
+
+logger = logging.getLogger(__name__)
+
+LAP_TELEMETRY_COLUMNS = (
+    "session_id",
+    "driver_id",
+    "car_number",
+    "lap_number",
+    "position",
+    "lap_time",
+    "sector1_time",
+    "sector2_time",
+    "sector3_time",
+    "sector4_time",
+    "average_speed_kph",
+    "top_speed_kph",
+    "session_elapsed",
+    "lap_timestamp",
+    "is_valid",
+    "crossing_pit_finish_lane",
+)
+LAP_TELEMETRY_KEY_COLUMNS = ("session_id", "car_number", "lap_number")
+LAP_TELEMETRY_UPDATE_SET = ",\n        ".join(
+    f"{column} = EXCLUDED.{column}" for column in LAP_TELEMETRY_COLUMNS if column not in LAP_TELEMETRY_KEY_COLUMNS
+)
+
+# Rows are encoded in memory up to this size, then spill to a temporary file.
+LAP_TELEMETRY_SPOOL_BYTES = 8 * 1024 * 1024
+
+# Dropped at commit; ordinal lets the merge keep the last copy of a repeated lap.
+LAP_TELEMETRY_STAGING_DDL = text(
+    """
+    CREATE TEMP TABLE IF NOT EXISTS lap_telemetry_staging (
+        ordinal BIGSERIAL,
+        session_id BIGINT NOT NULL,
+        driver_id BIGINT,
+        car_number VARCHAR(16) NOT NULL,
+        lap_number INT NOT NULL,
+        position INT,
+        lap_time VARCHAR(20),
+        sector1_time VARCHAR(20),
+        sector2_time VARCHAR(20),
+        sector3_time VARCHAR(20),
+        sector4_time VARCHAR(20),
+        average_speed_kph VARCHAR(20),
+        top_speed_kph VARCHAR(20),
+        session_elapsed VARCHAR(20),
+        lap_timestamp TIMESTAMPTZ,
+        is_valid BOOLEAN,
+        crossing_pit_finish_lane BOOLEAN
+    ) ON COMMIT DROP
+    """
+)
+
+LAP_TELEMETRY_COPY_SQL = f"COPY lap_telemetry_staging ({', '.join(LAP_TELEMETRY_COLUMNS)}) FROM STDIN"
+
+LAP_TELEMETRY_MERGE_SQL = text(
+    f"""
+    INSERT INTO lap_telemetry ({", ".join(LAP_TELEMETRY_COLUMNS)})
+    SELECT DISTINCT ON ({", ".join(LAP_TELEMETRY_KEY_COLUMNS)}) {", ".join(LAP_TELEMETRY_COLUMNS)}
+    FROM lap_telemetry_staging
+    ORDER BY {", ".join(LAP_TELEMETRY_KEY_COLUMNS)}, ordinal DESC
+    ON CONFLICT ({", ".join(LAP_TELEMETRY_KEY_COLUMNS)}) DO UPDATE SET
+        {LAP_TELEMETRY_UPDATE_SET}
+    """
+)
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text_value(value) -> str:
+    """Render one field in COPY's text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def encode_lap_telemetry_rows(rows: Iterable[dict], out: IO[bytes]) -> int:
+    """Write rows to `out` as COPY text lines and return how many were written."""
+    writer = io.TextIOWrapper(out, encoding="utf-8", newline="\n", write_through=True)
+    count = 0
+    try:
+        for row in rows:
+            writer.write("\t".join(_copy_text_value(row.get(column)) for column in LAP_TELEMETRY_COLUMNS))
+            writer.write("\n")
+            count += 1
+    finally:
+        writer.detach()
+    return count
+
+
+def copy_lap_telemetry(db: DbSession, rows: Iterable[dict]) -> int:
+    """Load rows into lap_telemetry with COPY into a staging table and one set-based upsert.
+
+    Rows are fully encoded before COPY starts, so producing them may still query the database
+    (e.g. to create drivers). Returns the number of lap_telemetry rows inserted or updated."""
+    with tempfile.SpooledTemporaryFile(max_size=LAP_TELEMETRY_SPOOL_BYTES) as buffer:
+        staged = encode_lap_telemetry_rows(rows, buffer)
+        if not staged:
+            return 0
+        buffer.seek(0)
+
+        db.execute(LAP_TELEMETRY_STAGING_DDL)
+        db.execute(text("TRUNCATE lap_telemetry_staging"))
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(LAP_TELEMETRY_COPY_SQL, buffer)
+        finally:
+            cursor.close()
+
+    merged = db.execute(LAP_TELEMETRY_MERGE_SQL).rowcount
+    logger.debug("Merged %d of %d staged lap_telemetry rows", merged, staged)
+    return merged
@@ -1,17 +1,32 @@
 import logging
 import os
 import time
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, timezone
+from functools import partial
+from typing import Optional
 
 import schedule
 
-from ingestion.f1_ingestion import F1Ingestion
+from ingestion import http_client
+from ingestion.cassette import enable_fastf1_cassette
+from ingestion.f1_ingestion import FASTF1_SESSION_NAME_CODES, F1Ingestion, configure_fastf1_cache
 from ingestion.imsa_ingestion import ImsaIngestion
 from ingestion.wec_ingestion import WecIngestion
 from ingestion.standings_ingestion import StandingsIngestion
 from ingestion.feed_generator import FeedGenerator
-from ingestion.config import db_session
-from ingestion.models import Event, Session, Result, Season, Series
+from ingestion.config import STATUS_SAFETY_POLL_SECONDS, db_session
+from ingestion.event_status import StatusChanges, apply_status_transitions
+from ingestion.models import Event, Season, Series
+from ingestion.result_jobs import ResultJobQueue
+from ingestion.results_queries import (
+    describe_session,
+    events_missing_results,
+    season_has_results,
+    session_has_results,
+)
+from ingestion.series_pipelines import run_series_pipelines
+from ingestion.session_windows import SessionWindowIndex, refresh_session_windows, season_event_ids
+from ingestion.status_scheduler import TransitionScheduler
 
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +35,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Session windows of current events; status updates are timed to their boundaries.
+session_windows = SessionWindowIndex()
+
 
 def current_year() -> int:
     return datetime.now(timezone.utc).year
@@ -33,98 +51,42 @@ def next_year() -> int:
     return current_year() + 1
 
 
-def update_event_statuses() -> None:
+def update_event_statuses() -> Optional[StatusChanges]:
     """Update event statuses: upcoming -> live -> completed based on session times."""
     try:
-        now = datetime.now(timezone.utc)
-        today = now.date()
-
         with db_session() as db:
-            past_events = (
-                db.query(Event)
-                .filter(Event.end_date < today, Event.status != "completed")
-                .all()
-            )
-            for event in past_events:
-                event.status = "completed"
-
-            active_events = (
-                db.query(Event)
-                .filter(Event.status.in_(["upcoming", "live"]))
-                .all()
-            )
-            for event in active_events:
-                sessions = db.query(Session).filter(Session.event_id == event.id).all()
-                is_live = any(
-                    session.start_time and session.start_time <= now <= (session.end_time or session.start_time + timedelta(hours=3))
-                    for session in sessions
-                )
-
-                if is_live and event.status != "live":
-                    event.status = "live"
-                    logger.info("Event now LIVE: %s", event.name)
-                elif not is_live and event.status == "live":
-                    if event.end_date and event.end_date < today:
-                        event.status = "completed"
-                    else:
-                        event.status = "upcoming"
-
-            logger.info("Status update: %d events marked completed.", len(past_events))
+            changes = apply_status_transitions(db, datetime.now(timezone.utc))
+
+        if changes.live:
+            logger.info("Events now LIVE: %s", changes.live)
+        logger.info(
+            "Status update: %d completed, %d live, %d back to upcoming.",
+            len(changes.completed),
+            len(changes.live),
+            len(changes.upcoming),
+        )
+        return changes
 
     except Exception:
         logger.exception("Error updating event statuses")
+        return None
 
 
 def get_event_slugs_needing_results(year: int, series_slug: str = "f1") -> list[str]:
     """Find event slugs that have completed but don't have results in the DB yet."""
     try:
         with db_session() as db:
-            today = date.today()
-            events = (
-                db.query(Event)
-                .join(Event.season)
-                .join(Season.series)
-                .filter(
-                    Season.year == year,
-                    Series.slug == series_slug,
-                    Event.end_date < today,
-                )
-                .all()
-            )
-
-            slugs_needing_results = []
-            for event in events:
-                sessions = db.query(Session).filter(Session.event_id == event.id).all()
-                for session in sessions:
-                    if session.type in ("race", "qualifying", "sprint"):
-                        result_count = db.query(Result).filter(Result.session_id == session.id).count()
-                        if result_count == 0:
-                            slugs_needing_results.append(event.slug)
-                            break
-
-            return slugs_needing_results
-
+            return events_missing_results(db, series_slug, year, ended_before=date.today())
     except Exception:
         logger.exception("Error checking events needing results")
         return []
 
 
-def _season_has_results(year: int) -> bool:
+def _season_has_results(year: int, series_slug: str = "f1") -> bool:
     """Check if a season already has events with results in the DB."""
     try:
         with db_session() as db:
-            season = db.query(Season).filter(Season.year == year).first()
-            if not season:
-                return False
-            events = db.query(Event).filter(Event.season_id == season.id).all()
-            if not events:
-                return False
-            for event in events:
-                sessions = db.query(Session).filter(Session.event_id == event.id).all()
-                for session in sessions:
-                    if db.query(Result).filter(Result.session_id == session.id).count() > 0:
-                        return True
-            return False
+            return season_has_results(db, series_slug, year)
     except Exception:
         logger.exception("Error checking season %d", year)
         return False
@@ -154,6 +116,21 @@ def _sync_calendar_safely(ingester, series_slug: str, year: int) -> None:
         ingester.sync_calendar(year)
     except Exception:
         logger.warning("Could not sync %s %d calendar", series_slug.upper(), year, exc_info=True)
+    else:
+        _refresh_session_windows(series_slug, year)
+
+
+def _refresh_session_windows(series_slug: Optional[str] = None, year: Optional[int] = None) -> None:
+    """Reload in-memory session windows for one season, or for every current event."""
+    now = datetime.now(timezone.utc)
+    # The refresh drops windows that ended before `now`; queue their result fetches first.
+    result_jobs.enqueue_ended(session_windows, now)
+    try:
+        with db_session() as db:
+            event_ids = season_event_ids(db, series_slug, year) if series_slug else None
+            refresh_session_windows(session_windows, db, now, event_ids)
+    except Exception:
+        logger.warning("Could not refresh session windows", exc_info=True)
 
 
 def run_historical_sync(start_year: int, end_year: int) -> None:
@@ -169,7 +146,6 @@ def run_historical_sync(start_year: int, end_year: int) -> None:
             f1.sync_historical_season(year)
         except Exception:
             logger.exception("Failed to sync historical season %d", year)
-        time.sleep(5)
 
     logger.info("Historical sync complete.")
 
@@ -194,11 +170,57 @@ def run_series_calendar_backfill(series_slug: str, start_year: int, end_year: in
             ingester.sync_calendar(year)
         except Exception:
             logger.exception("Failed to backfill %s %d calendar", series_slug.upper(), year)
-        time.sleep(2)
 
     logger.info("%s calendar backfill complete.", series_slug.upper())
 
 
+def _f1_results_pipeline(f1: F1Ingestion, standings: StandingsIngestion, years: list[int]) -> None:
+    for year in years:
+        missing_slugs = get_event_slugs_needing_results(year, series_slug="f1")
+        if not missing_slugs:
+            logger.info("F1 %d: all results up to date", year)
+            continue
+        logger.info("F1 %d: syncing results for %d events", year, len(missing_slugs))
+        try:
+            f1.sync_missing_results(year, missing_slugs)
+        except Exception:
+            logger.warning("Could not sync F1 %d results for %s", year, ", ".join(missing_slugs), exc_info=True)
+    for year in years:
+        standings.sync_series_for_year("f1", year)
+
+
+def _wec_results_pipeline(
+    wec: WecIngestion, standings: StandingsIngestion, years: list[int], standings_years: list[int]
+) -> None:
+    for year in years:
+        wec.sync_results_for_year(year)
+    for year in standings_years:
+        standings.sync_series_for_year("wec", year)
+
+
+def _imsa_results_pipeline(imsa: ImsaIngestion, standings: StandingsIngestion, years: list[int]) -> None:
+    for year in years:
+        imsa.sync_results_for_year(year)
+    for year in years:
+        imsa.sync_lap_telemetry_for_year(year)
+    for year in years:
+        standings.sync_series_for_year("imsa", year)
+
+
+def _run_results_pipelines(f1: F1Ingestion, wec: WecIngestion, imsa: ImsaIngestion, wec_years: list[int]) -> None:
+    """Results, telemetry and standings for each series, with the series running concurrently.
+
+    The ingesters are the caller's, so crawl, calendar page and schedule memos built by a calendar
+    sync are reused; each series still gets its own instance and thread."""
+    years = [previous_year(), current_year()]
+    standings = StandingsIngestion()
+    run_series_pipelines({
+        "f1": partial(_f1_results_pipeline, f1, standings, years),
+        "wec": partial(_wec_results_pipeline, wec, standings, wec_years, years),
+        "imsa": partial(_imsa_results_pipeline, imsa, standings, years),
+    })
+
+
 def run_initial_sync() -> None:
     """Run the initial data sync on startup."""
     logger.info("Starting initial data sync...")
@@ -206,70 +228,29 @@ def run_initial_sync() -> None:
     f1 = F1Ingestion()
     imsa = ImsaIngestion()
     wec = WecIngestion()
-    feed = FeedGenerator()
-    standings = StandingsIngestion()
 
     prev = previous_year()
     curr = current_year()
     nxt = next_year()
 
+    # Calendars run one series at a time: every series finds or creates rows in the shared circuits table.
     for year in [prev, curr, nxt]:
         _sync_calendar_safely(f1, "f1", year)
         _sync_calendar_safely(imsa, "imsa", year)
         _sync_calendar_safely(wec, "wec", year)
 
     update_event_statuses()
+    _run_results_pipelines(f1, wec, imsa, wec_years=[prev, curr])
 
-    for year in [prev, curr]:
-        missing_slugs = get_event_slugs_needing_results(year, series_slug="f1")
-        if missing_slugs:
-            logger.info("F1 %d: syncing results for %d events", year, len(missing_slugs))
-            for slug in missing_slugs:
-                try:
-                    f1.sync_all_session_results_by_slug(year, slug)
-                except Exception:
-                    logger.warning("Could not sync F1 %d %s results", year, slug)
-        else:
-            logger.info("F1 %d: all results up to date", year)
-
-    wec.sync_results_for_year(prev)
-    wec.sync_results_for_year(curr)
-    imsa.sync_results_for_year(prev)
-    imsa.sync_results_for_year(curr)
-    imsa.sync_lap_telemetry_for_year(prev)
-    imsa.sync_lap_telemetry_for_year(curr)
-    standings.sync_all_for_year(prev)
-    standings.sync_all_for_year(curr)
-
-    feed.generate_upcoming_previews()
+    FeedGenerator().generate_upcoming_previews()
+    http_client.get_client().log_stats()
     logger.info("Initial data sync complete.")
 
 
-def scheduled_status_check() -> None:
-    """Runs every 5 minutes to detect live events and update statuses."""
-    update_event_statuses()
-
-
 def scheduled_results_check() -> None:
     """Runs hourly to sync any missing results."""
-    f1 = F1Ingestion()
-    wec = WecIngestion()
-    imsa = ImsaIngestion()
-    standings = StandingsIngestion()
-    for year in [previous_year(), current_year()]:
-        missing_slugs = get_event_slugs_needing_results(year, series_slug="f1")
-        for slug in missing_slugs:
-            try:
-                f1.sync_all_session_results_by_slug(year, slug)
-            except Exception:
-                logger.warning("Could not sync F1 %d %s results", year, slug)
-    wec.sync_results_for_year(current_year())
-    imsa.sync_results_for_year(previous_year())
-    imsa.sync_results_for_year(current_year())
-    imsa.sync_lap_telemetry_for_year(previous_year())
-    imsa.sync_lap_telemetry_for_year(current_year())
-    standings.sync_all_for_year(previous_year())
-    standings.sync_all_for_year(current_year())
+    _run_results_pipelines(F1Ingestion(), WecIngestion(), ImsaIngestion(), wec_years=[current_year()])
+    http_client.get_client().log_stats()
 
 
 def scheduled_generate_previews() -> None:
@@ -291,8 +272,59 @@ def scheduled_calendar_refresh() -> None:
         _sync_calendar_safely(imsa, "imsa", year)
 
 
+def fetch_session_results(session_id: int) -> bool:
+    """Targeted result sync for one finished session; True once it has results or never will."""
+    with db_session() as db:
+        described = describe_session(db, session_id)
+        if described is None or session_has_results(db, session_id):
+            return True
+    series_slug, year, event_slug, session_type, session_name = described
+
+    if series_slug == "f1" and session_name in FASTF1_SESSION_NAME_CODES:
+        f1 = F1Ingestion()
+        round_number = f1.resolve_round_number(year, event_slug)
+        if not round_number:
+            logger.warning("Could not resolve round number for %s", event_slug)
+            return False
+        f1._sync_session_results(year, round_number, FASTF1_SESSION_NAME_CODES[session_name], session_id)
+    elif series_slug == "wec" and session_type == "race":
+        WecIngestion().sync_results_for_year(year, event_slugs=[event_slug])
+    elif series_slug == "imsa" and session_type == "race":
+        ImsaIngestion().sync_results_for_year(year, event_slugs=[event_slug])
+    else:
+        return True
+
+    with db_session() as db:
+        return session_has_results(db, session_id)
+
+
+result_jobs = ResultJobQueue(fetch_session_results)
+
+
+def handle_session_boundary() -> None:
+    """Runs at each session boundary: move event statuses along and queue result fetches for ended sessions."""
+    update_event_statuses()
+    result_jobs.enqueue_ended(session_windows)
+
+
+def _idle_seconds(status_scheduler: TransitionScheduler) -> float:
+    """Sleep until the next scheduled job, status boundary or result retry, whichever comes first."""
+    waits = [schedule.idle_seconds(), status_scheduler.idle_seconds(), result_jobs.idle_seconds()]
+    return max(min(wait for wait in waits if wait is not None), 0.0)
+
+
+def configure_fastf1() -> None:
+    """Give FastF1 its persistent cache, or the HTTP cassette when record/replay mode is enabled."""
+    cassette = http_client.get_client().cassette
+    if cassette is not None:
+        enable_fastf1_cassette(cassette)
+    else:
+        configure_fastf1_cache()
+
+
 def main() -> None:
     logger.info("Pitwall Data Services starting up...")
+    configure_fastf1()
 
     historical_sync = os.getenv("HISTORICAL_SYNC")
     if historical_sync:
@@ -319,8 +351,9 @@ def main() -> None:
             logger.error("Invalid IMSA_HISTORICAL_SYNC format. Expected 'START-END' (e.g. '2014-2025').")
 
     run_initial_sync()
+    _refresh_session_windows()
 
-    schedule.every(5).minutes.do(scheduled_status_check)
+    status_scheduler = TransitionScheduler(session_windows, handle_session_boundary, STATUS_SAFETY_POLL_SECONDS)
     schedule.every(1).hours.do(scheduled_results_check)
     schedule.every(6).hours.do(scheduled_generate_previews)
     schedule.every(24).hours.do(scheduled_calendar_refresh)
@@ -329,7 +362,9 @@ def main() -> None:
 
     while True:
         schedule.run_pending()
-        time.sleep(30)
+        status_scheduler.run_pending()
+        result_jobs.run_pending()
+        time.sleep(_idle_seconds(status_scheduler))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,131 @@
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average with bursts of up to `burst` requests."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+    def defer(self, seconds: float) -> None:
+        """Hold all requests for `seconds`, e.g. after the provider answered 429 Retry-After."""
+        with self._lock:
+            now = self._clock()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = now
+
+
+class RateLimiter:
+    """Per-provider token buckets shared by every fetcher in the process."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, float]],
+        default: tuple[float, float],
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.limits = limits
+        self.default = default
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, provider: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(provider)
+            if bucket is None:
+                rate, burst = self.limits.get(provider, self.default)
+                bucket = TokenBucket(rate, burst, clock=self._clock, sleep=self._sleep)
+                self._buckets[provider] = bucket
+            return bucket
+
+    def acquire(self, provider: str) -> float:
+        return self.bucket(provider).acquire()
+
+    def defer(self, provider: str, seconds: float) -> None:
+        logger.warning("Provider %s asked us to back off for %.1fs", provider, seconds)
+        self.bucket(provider).defer(seconds)
+
+
+def parse_rate_limits(spec: str) -> dict[str, tuple[float, float]]:
+    """Parse "provider=rate[:burst],..." (rate in requests per second) into bucket settings."""
+    limits: dict[str, tuple[float, float]] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            provider, value = item.split("=", 1)
+            rate_str, _, burst_str = value.partition(":")
+            rate = float(rate_str)
+            burst = float(burst_str) if burst_str else max(rate, 1.0)
+        except ValueError:
+            logger.warning("Ignoring malformed rate limit %r", item)
+            continue
+        if rate <= 0:
+            logger.warning("Ignoring non-positive rate limit %r", item)
+            continue
+        limits[provider.strip()] = (rate, burst)
+    return limits
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header given either as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - (now or datetime.now(timezone.utc))).total_seconds(), 0.0)
@@ -0,0 +1,105 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Upstream statuses worth another attempt; everything else is the provider's final answer.
+TRANSIENT_STATUS_CODES = frozenset({500, 502, 503, 504})
+TRANSIENT_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of contacting a provider whose circuit breaker is open."""
+
+
+def is_transient_failure(response: requests.Response) -> bool:
+    return response.status_code in TRANSIENT_STATUS_CODES
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter between attempts."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def delay(self, attempt: int, rng: Callable[[float, float], float] = random.uniform) -> float:
+        """Seconds to wait before retrying after the given zero-based attempt failed."""
+        return rng(0.0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Opens after failure_threshold consecutive failures and rejects calls for cooldown_seconds,
+    then lets a single probe through to decide whether to close again."""
+
+    def __init__(
+        self, failure_threshold: int, cooldown_seconds: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.trips = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.cooldown_seconds:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            state = self._current_state()
+            if state == HALF_OPEN or (state == CLOSED and self._consecutive_failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+                self.trips += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._consecutive_failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
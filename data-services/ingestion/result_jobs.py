@@ -0,0 +1,113 @@
+import heapq
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from ingestion.config import (
+    RESULT_JOB_FIRST_RETRY_SECONDS,
+    RESULT_JOB_GIVE_UP_SECONDS,
+    RESULT_JOB_MAX_RETRY_SECONDS,
+)
+from ingestion.session_windows import SessionWindowIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(order=True)
+class ResultJob:
+    """A pending result fetch for one finished session."""
+
+    due: datetime
+    session_id: int = field(compare=False)
+    ended_at: datetime = field(compare=False)
+    attempts: int = field(default=0, compare=False)
+
+
+class ResultJobQueue:
+    """Fetches results for sessions right after they end, backing off until the provider publishes.
+
+    `fetch(session_id)` returns True once the session's results are stored (or can never be), and
+    False to be retried later. Jobs older than the give-up horizon are left to the hourly sweep."""
+
+    def __init__(
+        self,
+        fetch: Callable[[int], bool],
+        first_retry_seconds: float = RESULT_JOB_FIRST_RETRY_SECONDS,
+        max_retry_seconds: float = RESULT_JOB_MAX_RETRY_SECONDS,
+        give_up_seconds: float = RESULT_JOB_GIVE_UP_SECONDS,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self.fetch = fetch
+        self.first_retry = timedelta(seconds=first_retry_seconds)
+        self.max_retry = timedelta(seconds=max_retry_seconds)
+        self.give_up = timedelta(seconds=give_up_seconds)
+        self._clock = clock
+        self._heap: list[ResultJob] = []
+        self._pending: set[int] = set()
+        self._watched_until: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def enqueue(self, session_id: int, ended_at: datetime) -> None:
+        if session_id in self._pending:
+            return
+        self._pending.add(session_id)
+        heapq.heappush(self._heap, ResultJob(ended_at, session_id, ended_at))
+        logger.info("Queued result fetch for session %d (ended %s)", session_id, ended_at.isoformat())
+
+    def enqueue_ended(self, index: SessionWindowIndex, now: Optional[datetime] = None) -> None:
+        """Queue every session whose window closed since the previous call, up to `now`.
+
+        The first call only starts the watch; sessions that ended before it are the startup sync's."""
+        now = now or self._clock()
+        if self._watched_until is not None:
+            for window in index.ended_between(self._watched_until, now):
+                self.enqueue(window.session_id, window.end)
+        self._watched_until = now
+
+    def next_due(self) -> Optional[datetime]:
+        return self._heap[0].due if self._heap else None
+
+    def idle_seconds(self) -> Optional[float]:
+        due = self.next_due()
+        if due is None:
+            return None
+        return max((due - self._clock()).total_seconds(), 0.0)
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        return min(self.first_retry * (2 ** (attempts - 1)), self.max_retry)
+
+    def run_pending(self) -> int:
+        """Run every due job once; returns how many finished."""
+        now = self._clock()
+        finished = 0
+        while self._heap and self._heap[0].due <= now:
+            job = heapq.heappop(self._heap)
+            job.attempts += 1
+            try:
+                done = self.fetch(job.session_id)
+            except Exception:
+                logger.warning("Result fetch for session %d failed", job.session_id, exc_info=True)
+                done = False
+
+            if done:
+                logger.info("Results for session %d landed after %d attempt(s)", job.session_id, job.attempts)
+            elif now - job.ended_at >= self.give_up:
+                logger.warning(
+                    "Giving up on results for session %d after %d attempts; the hourly sweep will retry",
+                    job.session_id,
+                    job.attempts,
+                )
+            else:
+                job.due = now + self._retry_delay(job.attempts)
+                heapq.heappush(self._heap, job)
+                continue
+            self._pending.discard(job.session_id)
+            finished += 1
+        return finished
@@ -0,0 +1,81 @@
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import exists
+from sqlalchemy.orm import Session as DbSession
+
+from ingestion.models import Event, Result, Season, Series, Session
+
+# Session types that carry a classification; practice sessions never get results.
+RESULT_SESSION_TYPES = ("race", "qualifying", "sprint")
+
+
+def _has_no_results():
+    return ~exists().where(Result.session_id == Session.id)
+
+
+def _series_season_sessions(db: DbSession, columns, series_slug: str, year: int, session_types: Iterable[str]):
+    return (
+        db.query(*columns)
+        .join(Season, Event.season_id == Season.id)
+        .join(Series, Season.series_id == Series.id)
+        .join(Session, Session.event_id == Event.id)
+        .filter(Series.slug == series_slug, Season.year == year, Session.type.in_(list(session_types)))
+    )
+
+
+def events_missing_results(
+    db: DbSession,
+    series_slug: str,
+    year: int,
+    session_types: Iterable[str] = RESULT_SESSION_TYPES,
+    ended_before: Optional[date] = None,
+) -> list[str]:
+    """Slugs of events with at least one session of the given types that has no results, in one query."""
+    query = _series_season_sessions(db, (Event.slug,), series_slug, year, session_types).filter(_has_no_results())
+    if ended_before is not None:
+        query = query.filter(Event.end_date < ended_before)
+    return [slug for (slug,) in query.group_by(Event.id).order_by(Event.start_date, Event.slug).all()]
+
+
+def sessions_missing_results(
+    db: DbSession,
+    series_slug: str,
+    year: int,
+    session_types: Iterable[str] = RESULT_SESSION_TYPES,
+    event_slugs: Optional[Iterable[str]] = None,
+) -> list[tuple[Event, Session]]:
+    """(event, session) pairs for sessions of the given types that have no results, in one query."""
+    query = _series_season_sessions(db, (Event, Session), series_slug, year, session_types).filter(_has_no_results())
+    if event_slugs is not None:
+        query = query.filter(Event.slug.in_(list(event_slugs)))
+    return query.order_by(Event.start_date, Session.id).all()
+
+
+def session_has_results(db: DbSession, session_id: int) -> bool:
+    return bool(db.query(exists().where(Result.session_id == session_id)).scalar())
+
+
+def describe_session(db: DbSession, session_id: int) -> Optional[tuple[str, int, str, str, str]]:
+    """(series slug, season year, event slug, session type, session name) of a session, or None if it is gone."""
+    return (
+        db.query(Series.slug, Season.year, Event.slug, Session.type, Session.name)
+        .join(Season, Season.series_id == Series.id)
+        .join(Event, Event.season_id == Season.id)
+        .join(Session, Session.event_id == Event.id)
+        .filter(Session.id == session_id)
+        .first()
+    )
+
+
+def season_has_results(db: DbSession, series_slug: str, year: int) -> bool:
+    """Whether any session of the series' season has at least one result."""
+    has_results = (
+        exists()
+        .where(Result.session_id == Session.id)
+        .where(Session.event_id == Event.id)
+        .where(Event.season_id == Season.id)
+        .where(Season.series_id == Series.id)
+        .where(Series.slug == series_slug, Season.year == year)
+    )
+    return bool(db.query(has_results).scalar())
@@ -0,0 +1,61 @@
+import logging
+from dataclasses import dataclass
+from typing import Iterable
+
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session as DbSession
+
+from ingestion.models import Result
+
+logger = logging.getLogger(__name__)
+
+RESULT_CONFLICT_CONSTRAINT = "uq_results_session_driver_class_name"
+RESULT_KEY_COLUMNS = ("session_id", "driver_id", "class_name")
+RESULT_VALUE_COLUMNS = ("position", "time", "laps", "gap", "status")
+RESULT_DEFAULTS = {"status": "finished", "class_name": "Overall"}
+
+# Eight bind parameters per row keeps each statement far below Postgres' 65535 limit.
+RESULT_UPSERT_BATCH_SIZE = 1000
+
+
+@dataclass
+class UpsertCounts:
+    inserted: int = 0
+    updated: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated
+
+
+def _normalize_rows(rows: Iterable[dict]) -> list[dict]:
+    """Fill every column and keep the last row per unique key; one statement may not touch a key twice."""
+    by_key: dict[tuple, dict] = {}
+    for row in rows:
+        values = {
+            column: row.get(column) if row.get(column) is not None else RESULT_DEFAULTS.get(column)
+            for column in RESULT_KEY_COLUMNS + RESULT_VALUE_COLUMNS
+        }
+        by_key[tuple(values[column] for column in RESULT_KEY_COLUMNS)] = values
+    return list(by_key.values())
+
+
+def upsert_results(db: DbSession, rows: Iterable[dict], batch_size: int = RESULT_UPSERT_BATCH_SIZE) -> UpsertCounts:
+    """Insert or update results with multi-row INSERT ... ON CONFLICT on the session/driver/class key."""
+    counts = UpsertCounts()
+    values = _normalize_rows(rows)
+    for start in range(0, len(values), batch_size):
+        stmt = insert(Result).values(values[start:start + batch_size])
+        stmt = stmt.on_conflict_do_update(
+            constraint=RESULT_CONFLICT_CONSTRAINT,
+            set_={column: stmt.excluded[column] for column in RESULT_VALUE_COLUMNS},
+        ).returning(literal_column("xmax = 0").label("inserted"))
+        # xmax is zero only for rows this statement inserted; updated rows carry our transaction id.
+        for inserted, in db.execute(stmt):
+            if inserted:
+                counts.inserted += 1
+            else:
+                counts.updated += 1
+    logger.debug("Upserted %d results (%d inserted, %d updated)", counts.total, counts.inserted, counts.updated)
+    return counts
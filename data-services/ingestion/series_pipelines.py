@@ -0,0 +1,51 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ingestion.config import SERIES_PIPELINE_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineOutcome:
+    series_slug: str
+    seconds: float
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_pipeline(series_slug: str, pipeline: Callable[[], None]) -> PipelineOutcome:
+    started = time.monotonic()
+    try:
+        pipeline()
+    except Exception as exc:
+        logger.exception("%s pipeline failed", series_slug.upper())
+        return PipelineOutcome(series_slug, time.monotonic() - started, exc)
+    return PipelineOutcome(series_slug, time.monotonic() - started)
+
+
+def run_series_pipelines(
+    pipelines: dict[str, Callable[[], None]], max_workers: int = SERIES_PIPELINE_WORKERS
+) -> dict[str, PipelineOutcome]:
+    """Run independent per-series pipelines side by side; a failing series never stops the others.
+
+    Each pipeline builds its own ingesters and database sessions, so the threads share only the
+    HTTP client (whose pools, rate limiters and cache are locked) and the engine's connection pool."""
+    if max_workers <= 1 or len(pipelines) <= 1:
+        outcomes = [_run_pipeline(series_slug, pipeline) for series_slug, pipeline in pipelines.items()]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pipelines)), thread_name_prefix="series") as pool:
+            futures = [pool.submit(_run_pipeline, series_slug, pipeline) for series_slug, pipeline in pipelines.items()]
+            outcomes = [future.result() for future in futures]
+
+    for outcome in outcomes:
+        logger.info(
+            "%s pipeline %s in %.1fs", outcome.series_slug.upper(), "finished" if outcome.ok else "failed", outcome.seconds
+        )
+    return {outcome.series_slug: outcome for outcome in outcomes}
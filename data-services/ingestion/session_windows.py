@@ -0,0 +1,190 @@
+import logging
+import threading
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session as DbSession
+
+from ingestion.event_status import DEFAULT_SESSION_DURATION
+from ingestion.models import Event, Season, Series, Session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SessionWindow:
+    """The half-open interval [start, end) during which a session makes its event live."""
+
+    session_id: int
+    event_id: int
+    start: datetime
+    end: datetime
+
+
+def event_completion_time(end_date: date) -> datetime:
+    """The instant an event becomes completed: midnight UTC after its last day."""
+    return datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=timezone.utc)
+
+
+class SessionWindowIndex:
+    """Session windows cut into elementary segments between consecutive boundaries.
+
+    Each segment stores the events live throughout it, so "what is live now" and "when does that
+    next change" are a bisect over the sorted boundaries. Windows are replaced per event when a
+    calendar syncs; the segments are rebuilt from memory without touching the database."""
+
+    def __init__(self, windows: Iterable[SessionWindow] = (), completions: Optional[dict[int, datetime]] = None) -> None:
+        self._windows: dict[int, list[SessionWindow]] = {}
+        self._completions: dict[int, datetime] = {}
+        self._boundaries: list[datetime] = []
+        self._segments: list[frozenset[int]] = []
+        self._lock = threading.Lock()
+        self.replace_events(windows, completions or {})
+
+    def __len__(self) -> int:
+        return sum(len(windows) for windows in self._windows.values())
+
+    def replace_events(
+        self,
+        windows: Iterable[SessionWindow],
+        completions: dict[int, datetime],
+        event_ids: Iterable[int] = (),
+    ) -> None:
+        """Swap in the windows of the given events (plus any event the new windows mention)."""
+        by_event: dict[int, list[SessionWindow]] = {event_id: [] for event_id in event_ids}
+        by_event.update({event_id: [] for event_id in completions})
+        for window in windows:
+            by_event.setdefault(window.event_id, []).append(window)
+        with self._lock:
+            for event_id, event_windows in by_event.items():
+                if event_windows:
+                    self._windows[event_id] = event_windows
+                else:
+                    self._windows.pop(event_id, None)
+                if event_id in completions:
+                    self._completions[event_id] = completions[event_id]
+                else:
+                    self._completions.pop(event_id, None)
+            self._rebuild()
+
+    def replace_all(self, windows: Iterable[SessionWindow], completions: dict[int, datetime]) -> None:
+        with self._lock:
+            self._windows = {}
+            self._completions = {}
+        self.replace_events(windows, completions)
+
+    def prune(self, before: datetime) -> None:
+        """Forget windows and completions that ended before `before`."""
+        with self._lock:
+            for event_id in list(self._windows):
+                kept = [w for w in self._windows[event_id] if w.end >= before]
+                if kept:
+                    self._windows[event_id] = kept
+                else:
+                    del self._windows[event_id]
+            self._completions = {e: at for e, at in self._completions.items() if at >= before}
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        edges: dict[datetime, Counter] = {}
+        for event_windows in self._windows.values():
+            for window in event_windows:
+                if window.end <= window.start:
+                    continue
+                edges.setdefault(window.start, Counter())[window.event_id] += 1
+                edges.setdefault(window.end, Counter())[window.event_id] -= 1
+        for completed_at in self._completions.values():
+            edges.setdefault(completed_at, Counter())
+
+        boundaries = sorted(edges)
+        segments = []
+        open_windows: Counter = Counter()
+        for boundary in boundaries:
+            open_windows.update(edges[boundary])
+            segments.append(frozenset(event_id for event_id, count in open_windows.items() if count > 0))
+        self._boundaries = boundaries
+        self._segments = segments
+
+    def live_events(self, now: datetime) -> frozenset[int]:
+        with self._lock:
+            i = bisect_right(self._boundaries, now) - 1
+            return self._segments[i] if i >= 0 else frozenset()
+
+    def next_transition(self, now: datetime) -> Optional[datetime]:
+        """The first boundary strictly after `now` at which some event may change status."""
+        with self._lock:
+            i = bisect_right(self._boundaries, now)
+            return self._boundaries[i] if i < len(self._boundaries) else None
+
+    def ended_between(self, since: datetime, now: datetime) -> list[SessionWindow]:
+        """Windows whose end lies in (since, now], oldest first."""
+        with self._lock:
+            ended = [w for windows in self._windows.values() for w in windows if since < w.end <= now]
+        return sorted(ended, key=lambda w: (w.end, w.session_id))
+
+    def crossed_boundary(self, since: datetime, now: datetime) -> bool:
+        """Whether any boundary lies in (since, now]."""
+        upcoming = self.next_transition(since)
+        return upcoming is not None and upcoming <= now
+
+
+def _session_windows_query(db: DbSession, not_before: datetime):
+    return (
+        db.query(Session.id, Session.event_id, Session.start_time, Session.end_time)
+        .filter(
+            or_(
+                Session.end_time >= not_before,
+                and_(Session.end_time.is_(None), Session.start_time >= not_before - DEFAULT_SESSION_DURATION),
+            )
+        )
+    )
+
+
+def load_session_windows(
+    db: DbSession, not_before: datetime, event_ids: Optional[Iterable[int]] = None
+) -> tuple[list[SessionWindow], dict[int, datetime]]:
+    """Windows and completion instants of events still relevant at `not_before`, in two queries."""
+    sessions = _session_windows_query(db, not_before)
+    events = db.query(Event.id, Event.end_date).filter(Event.end_date >= not_before.date() - timedelta(days=1))
+    if event_ids is not None:
+        event_ids = list(event_ids)
+        sessions = sessions.filter(Session.event_id.in_(event_ids))
+        events = events.filter(Event.id.in_(event_ids))
+
+    windows = [
+        SessionWindow(session_id, event_id, start, end or start + DEFAULT_SESSION_DURATION)
+        for session_id, event_id, start, end in sessions.all()
+    ]
+    completions = {event_id: event_completion_time(end_date) for event_id, end_date in events.all() if end_date}
+    return windows, completions
+
+
+def refresh_session_windows(
+    index: SessionWindowIndex, db: DbSession, now: datetime, event_ids: Optional[Iterable[int]] = None
+) -> None:
+    """Reload windows for some events (or all, when event_ids is None) into the index."""
+    if event_ids is not None:
+        event_ids = list(event_ids)
+    windows, completions = load_session_windows(db, now, event_ids)
+    if event_ids is None:
+        index.replace_all(windows, completions)
+    else:
+        index.replace_events(windows, completions, event_ids=event_ids)
+    index.prune(now)
+    logger.info("Session window index holds %d sessions", len(index))
+
+
+def season_event_ids(db: DbSession, series_slug: str, year: int) -> list[int]:
+    return [
+        event_id
+        for (event_id,) in db.query(Event.id)
+        .join(Season, Event.season_id == Season.id)
+        .join(Series, Season.series_id == Series.id)
+        .filter(Series.slug == series_slug, Season.year == year)
+        .all()
+    ]
+
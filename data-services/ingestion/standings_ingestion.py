@@ -3,16 +3,20 @@ from collections import defaultdict
 from decimal import Decimal
 from typing import Iterable, Optional
 
-import requests
 from sqlalchemy.orm import Session as DbSession
 
+from ingestion import http_client
 from ingestion.config import db_session
+from ingestion.entity_cache import EntityCache
 from ingestion.f1_ingestion import _find_or_create_driver, _find_or_create_team
 from ingestion.models import ConstructorStanding, DriverStanding, Result, Season, Series, Session
 
 logger = logging.getLogger(__name__)
 
 F1_SERIES_SLUG = "f1"
+JOLPICA_DRIVER_STANDINGS_URL = "https://api.jolpi.ca/ergast/f1/{year}/driverstandings.json"
+JOLPICA_CONSTRUCTOR_STANDINGS_URL = "https://api.jolpi.ca/ergast/f1/{year}/constructorstandings.json"
+OFFICIAL_STANDINGS_CONSUMER = "f1-official-standings"
 
 # Simple fallback table for derived standings when official points are unavailable.
 DEFAULT_POINTS_TABLE = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
@@ -29,9 +33,9 @@ def _points_for_position(position: int, points_table: Iterable[int]) -> int:
 
 
 def _fetch_jolpica_driver_standings(year: int) -> Optional[list]:
-    url = f"https://api.jolpi.ca/ergast/f1/{year}/driverstandings.json"
+    url = JOLPICA_DRIVER_STANDINGS_URL.format(year=year)
     try:
-        response = requests.get(url, timeout=30)
+        response = http_client.get(url, conditional=True)
         response.raise_for_status()
         payload = response.json()
         lists = payload["MRData"]["StandingsTable"]["StandingsLists"]
@@ -44,9 +48,9 @@ def _fetch_jolpica_driver_standings(year: int) -> Optional[list]:
 
 
 def _fetch_jolpica_constructor_standings(year: int) -> Optional[list]:
-    url = f"https://api.jolpi.ca/ergast/f1/{year}/constructorstandings.json"
+    url = JOLPICA_CONSTRUCTOR_STANDINGS_URL.format(year=year)
     try:
-        response = requests.get(url, timeout=30)
+        response = http_client.get(url, conditional=True)
         response.raise_for_status()
         payload = response.json()
         lists = payload["MRData"]["StandingsTable"]["StandingsLists"]
@@ -138,6 +142,11 @@ class StandingsIngestion:
         if not driver_rows and not constructor_rows:
             return False
 
+        urls = [JOLPICA_DRIVER_STANDINGS_URL.format(year=year), JOLPICA_CONSTRUCTOR_STANDINGS_URL.format(year=year)]
+        if all(http_client.is_unchanged(url, OFFICIAL_STANDINGS_CONSUMER) for url in urls):
+            logger.info("Official F1 standings for %d unchanged since last sync", year)
+            return True
+
         with db_session() as db:
             series, season = _get_series_and_season(db, F1_SERIES_SLUG, year)
             if not series or not season:
@@ -147,6 +156,7 @@ class StandingsIngestion:
                 db.query(DriverStanding).filter(DriverStanding.season_id == season.id).delete(synchronize_session=False)
                 db.query(ConstructorStanding).filter(ConstructorStanding.season_id == season.id).delete(synchronize_session=False)
 
+            cache = EntityCache(db, series.id)
             if driver_rows:
                 for row in driver_rows:
                     driver_data = row.get("Driver", {})
@@ -158,8 +168,8 @@ class StandingsIngestion:
                     permanent_number = driver_data.get("permanentNumber")
                     driver_number = int(permanent_number) if str(permanent_number).isdigit() else None
 
-                    team = _find_or_create_team(db, series.id, team_name)
-                    driver = _find_or_create_driver(db, first_name, last_name, driver_number, team.id)
+                    team = _find_or_create_team(db, series.id, team_name, cache)
+                    driver = _find_or_create_driver(db, first_name, last_name, driver_number, team.id, cache)
 
                     position = int(str(row.get("position", "0")).strip() or 0)
                     points = float(str(row.get("points", "0")).strip() or 0)
@@ -173,7 +183,7 @@ class StandingsIngestion:
                 for row in constructor_rows:
                     constructor_data = row.get("Constructor", {})
                     team_name = str(constructor_data.get("name", "Unknown Team")).strip() or "Unknown Team"
-                    team = _find_or_create_team(db, series.id, team_name)
+                    team = _find_or_create_team(db, series.id, team_name, cache)
 
                     position = int(str(row.get("position", "0")).strip() or 0)
                     points = float(str(row.get("points", "0")).strip() or 0)
@@ -183,6 +193,8 @@ class StandingsIngestion:
 
                     _upsert_constructor_standing(db, season.id, team.id, "Overall", position, points, wins)
 
+        for url in urls:
+            http_client.mark_processed(url, OFFICIAL_STANDINGS_CONSUMER)
         logger.info("Synced official F1 standings for %d", year)
         return True
 
@@ -283,11 +295,13 @@ class StandingsIngestion:
         logger.info("Synced derived standings for %s %d", series_slug.upper(), year)
         return True
 
+    def sync_series_for_year(self, series_slug: str, year: int) -> None:
+        """Sync one series' standings; F1 prefers the official tables over derived ones."""
+        if series_slug == F1_SERIES_SLUG and self.sync_f1_official_standings(year):
+            return
+        self.sync_derived_standings_from_results(series_slug, year)
+
     def sync_all_for_year(self, year: int) -> None:
         """Sync standings for all supported series for a given year."""
-        f1_synced = self.sync_f1_official_standings(year)
-        if not f1_synced:
-            self.sync_derived_standings_from_results(F1_SERIES_SLUG, year)
-
-        self.sync_derived_standings_from_results("wec", year)
-        self.sync_derived_standings_from_results("imsa", year)
+        for series_slug in (F1_SERIES_SLUG, "wec", "imsa"):
+            self.sync_series_for_year(series_slug, year)
@@ -0,0 +1,52 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from ingestion.session_windows import SessionWindowIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class TransitionScheduler:
+    """Fires status updates exactly at the next session boundary, or after a coarse safety poll.
+
+    The next boundary is read from the session window index on every call, so windows added by a
+    calendar sync take effect without rescheduling anything."""
+
+    def __init__(
+        self,
+        index: SessionWindowIndex,
+        on_transition: Callable[[], object],
+        safety_poll_seconds: float,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self.index = index
+        self.on_transition = on_transition
+        self.safety_poll = timedelta(seconds=safety_poll_seconds)
+        self._clock = clock
+        self.last_run: Optional[datetime] = None
+        self.runs = 0
+
+    def next_due(self) -> datetime:
+        if self.last_run is None:
+            return self._clock()
+        due = self.last_run + self.safety_poll
+        boundary = self.index.next_transition(self.last_run)
+        return min(due, boundary) if boundary is not None else due
+
+    def idle_seconds(self) -> float:
+        return max((self.next_due() - self._clock()).total_seconds(), 0.0)
+
+    def run_pending(self) -> bool:
+        now = self._clock()
+        if now < self.next_due():
+            return False
+        self.last_run = now
+        self.runs += 1
+        self.on_transition()
+        logger.debug("Status transition check ran; next due at %s", self.next_due().isoformat())
+        return True
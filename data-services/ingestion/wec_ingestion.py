@@ -3,19 +3,31 @@ import re
 import unicodedata
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 from sqlalchemy.orm import Session as DbSession
 
-from ingestion.config import db_session
-from ingestion.models import Circuit, Driver, Event, Result, Season, Series, Session, Team
+from ingestion import http_client
+from ingestion.config import WEC_CALENDAR_CACHE_TTL_SECONDS, db_session
+from ingestion.entity_cache import EntityCache, find_or_create as _find_or_create
+from ingestion.models import Circuit, Driver, Event, Season, Series, Session, Team
+from ingestion.results_queries import sessions_missing_results
+from ingestion.results_writer import upsert_results
+from ingestion.ttl_cache import TtlCache
 
 logger = logging.getLogger(__name__)
 
 SERIES_SLUG = "wec"
 WEC_CALENDAR_URL = "https://api.fia.com/events/world-endurance-championship/season-{year}/races-calendar"
+CALENDAR_CONSUMER = "wec-calendar"
+
+# Classification pages are mostly navigation and scripts; only <table> subtrees are built,
+# with lxml when it is installed.
+CLASSIFICATION_PARSE_ONLY = SoupStrainer("table")
+CLASSIFICATION_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+CLASSIFICATION_HEADER_SIGNATURE = ("pos", "team", "drivers")
 
 MONTHS = {
     "Jan": 1,
@@ -76,9 +88,25 @@ def _normalize_key(text: str) -> str:
     return re.sub(r"\s+", " ", ascii_text).strip().lower()
 
 
-def _parse_wec_calendar_text(year: int, text: str) -> list[dict]:
-    # The FIA endpoint returns full HTML; parse visible text first.
-    visible_text = BeautifulSoup(text, "html.parser").get_text("\n", strip=True)
+@dataclass(frozen=True)
+class WecCalendarPage:
+    """The FIA season calendar page parsed once: event rows and race-classification links."""
+
+    year: int
+    events: list[dict]
+    result_links: dict[str, str]
+
+
+def _parse_wec_calendar_page(year: int, html: str) -> WecCalendarPage:
+    soup = BeautifulSoup(html, "html.parser")
+    return WecCalendarPage(
+        year=year,
+        events=_parse_wec_calendar_lines(year, soup.get_text("\n", strip=True)),
+        result_links=_extract_wec_result_links(year, soup),
+    )
+
+
+def _parse_wec_calendar_lines(year: int, visible_text: str) -> list[dict]:
     lines = [ln.strip() for ln in visible_text.splitlines() if ln.strip()]
 
     try:
@@ -124,6 +152,26 @@ def _parse_wec_calendar_text(year: int, text: str) -> list[dict]:
     return events
 
 
+def _extract_wec_result_links(year: int, soup: BeautifulSoup) -> dict[str, str]:
+    """Build a map of race slug -> classification URL from FIA calendar page links."""
+    link_map: dict[str, str] = {}
+    for a in soup.find_all("a", href=True):
+        href = a["href"]
+        if f"/season-{year}/" not in href:
+            continue
+        if "/race-classification" not in href and "/race" not in href:
+            continue
+        full = href if href.startswith("http") else f"https://www.fia.com{href}"
+        m = re.search(rf"/season-{year}/([^/]+)/", full)
+        if not m:
+            continue
+        slug = m.group(1)
+        # Prefer explicit race-classification URL when both links exist.
+        if slug not in link_map or "race-classification" in full:
+            link_map[slug] = full
+    return link_map
+
+
 def _get_series(db: DbSession) -> Optional[Series]:
     series = db.query(Series).filter(Series.slug == SERIES_SLUG).first()
     if not series:
@@ -131,16 +179,9 @@ def _get_series(db: DbSession) -> Optional[Series]:
     return series
 
 
-def _find_or_create(db: DbSession, model, filters: dict, defaults: dict):
-    instance = db.query(model).filter_by(**filters).first()
-    if not instance:
-        instance = model(**filters, **defaults)
-        db.add(instance)
-        db.flush()
-    return instance
-
-
-def _find_or_create_season(db: DbSession, series_id: int, year: int) -> Season:
+def _find_or_create_season(db: DbSession, series_id: int, year: int, cache: Optional[EntityCache] = None) -> Season:
+    if cache is not None:
+        return cache.season(year)
     return _find_or_create(db, Season, {"series_id": series_id, "year": year}, {})
 
 
@@ -158,18 +199,23 @@ def _find_or_create_circuit(db: DbSession, info: CircuitInfo) -> Circuit:
     )
 
 
-def _find_or_create_team(db: DbSession, series_id: int, team_name: str) -> Team:
-    short_name = team_name[:50]
-    return _find_or_create(
-        db,
-        Team,
-        {"series_id": series_id, "name": team_name},
-        {"short_name": short_name, "color": "#4D4D4D"},
-    )
+def _find_or_create_team(db: DbSession, series_id: int, team_name: str, cache: Optional[EntityCache] = None) -> Team:
+    defaults = {"short_name": team_name[:50], "color": "#4D4D4D"}
+    if cache is not None:
+        return cache.team(team_name, defaults)
+    return _find_or_create(db, Team, {"series_id": series_id, "name": team_name}, defaults)
+
+
+def _driver_slug(display_name: str, number: int) -> str:
+    return _slugify(f"wec-{display_name}-{number}")
 
 
-def _find_or_create_driver(db: DbSession, display_name: str, number: int, team_id: int) -> Driver:
-    slug = _slugify(f"wec-{display_name}-{number}")
+def _find_or_create_driver(
+    db: DbSession, display_name: str, number: int, team_id: int, cache: Optional[EntityCache] = None
+) -> Driver:
+    slug = _driver_slug(display_name, number)
+    if cache is not None:
+        return cache.driver(slug, display_name, number, team_id)
     driver = db.query(Driver).filter(Driver.slug == slug).first()
     if not driver:
         driver = Driver(name=display_name, slug=slug, number=number, team_id=team_id)
@@ -180,9 +226,9 @@ def _find_or_create_driver(db: DbSession, display_name: str, number: int, team_i
     return driver
 
 
-def _extract_wec_race_rows(html: str) -> list[dict]:
-    soup = BeautifulSoup(html, "html.parser")
-
+def _iter_classification_tables(html: str) -> Iterator[tuple[list[str], list]]:
+    """Yield (headers, data rows) for each table whose header row carries the classification signature."""
+    soup = BeautifulSoup(html, CLASSIFICATION_PARSER, parse_only=CLASSIFICATION_PARSE_ONLY)
     for table in soup.find_all("table"):
         rows = table.find_all("tr")
         if not rows:
@@ -191,11 +237,13 @@ def _extract_wec_race_rows(html: str) -> list[dict]:
         # FIA pages use first table row as headers inside <td>, not <th>.
         first_row_cells = rows[0].find_all(["td", "th"])
         headers = [c.get_text(" ", strip=True).lower() for c in first_row_cells]
-        if not headers:
-            continue
-        if "pos" not in headers or "team" not in headers or "drivers" not in headers:
+        if not all(column in headers for column in CLASSIFICATION_HEADER_SIGNATURE):
             continue
+        yield headers, rows[1:]
+
 
+def _extract_wec_race_rows(html: str) -> list[dict]:
+    for headers, rows in _iter_classification_tables(html):
         index_map = {name: idx for idx, name in enumerate(headers)}
 
         def idx_for(keyword: str) -> Optional[int]:
@@ -217,7 +265,7 @@ def _extract_wec_race_rows(html: str) -> list[dict]:
             continue
 
         parsed_rows: list[dict] = []
-        for tr in rows[1:]:
+        for tr in rows:
             cells = tr.find_all("td")
             if not cells:
                 continue
@@ -261,40 +309,36 @@ def _extract_wec_race_rows(html: str) -> list[dict]:
 
 
 class WecIngestion:
+    def __init__(self, calendar_ttl_seconds: float = WEC_CALENDAR_CACHE_TTL_SECONDS) -> None:
+        self._calendar_cache: TtlCache[Optional[WecCalendarPage]] = TtlCache(calendar_ttl_seconds)
+
     def _fetch_calendar_html(self, year: int) -> Optional[str]:
         url = WEC_CALENDAR_URL.format(year=year)
         try:
-            response = requests.get(url, timeout=30)
+            response = http_client.get(url, conditional=True)
             response.raise_for_status()
             return response.text
         except Exception:
             logger.exception("Failed to fetch WEC %d calendar", year)
             return None
 
-    def _fetch_result_link_map(self, year: int) -> dict[str, str]:
-        """Build a map of race slug -> classification URL from FIA calendar page links."""
+    def _calendar_page(self, year: int) -> Optional[WecCalendarPage]:
+        """Fetch and parse a season's calendar page at most once per TTL."""
+        page = self._calendar_cache.get_or_load(year, lambda: self._load_calendar_page(year))
+        if page is None:
+            # A failed fetch should be retried on the next call rather than remembered.
+            self._calendar_cache.invalidate(year)
+        return page
+
+    def _load_calendar_page(self, year: int) -> Optional[WecCalendarPage]:
+        html = self._fetch_calendar_html(year)
+        if not html:
+            return None
         try:
-            calendar_html = requests.get(WEC_CALENDAR_URL.format(year=year), timeout=30).text
-            soup = BeautifulSoup(calendar_html, "html.parser")
-            link_map: dict[str, str] = {}
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                if f"/season-{year}/" not in href:
-                    continue
-                if "/race-classification" not in href and "/race" not in href:
-                    continue
-                full = href if href.startswith("http") else f"https://www.fia.com{href}"
-                m = re.search(rf"/season-{year}/([^/]+)/", full)
-                if not m:
-                    continue
-                slug = m.group(1)
-                # Prefer explicit race-classification URL when both links exist.
-                if slug not in link_map or "race-classification" in full:
-                    link_map[slug] = full
-            return link_map
+            return _parse_wec_calendar_page(year, html)
         except Exception:
-            logger.exception("Failed to build WEC result link map for %d", year)
-            return {}
+            logger.exception("Failed to parse WEC %d calendar page", year)
+            return None
 
     def _fetch_race_classification_html(self, year: int, race_slug: str, link_map: dict[str, str]) -> Optional[str]:
         url = link_map.get(
@@ -302,7 +346,7 @@ class WecIngestion:
             f"https://www.fia.com/events/world-endurance-championship/season-{year}/{race_slug}/race-classification",
         )
         try:
-            response = requests.get(url, timeout=30)
+            response = http_client.get(url, conditional=True)
             response.raise_for_status()
             return response.text
         except Exception:
@@ -311,11 +355,16 @@ class WecIngestion:
 
     def sync_calendar(self, year: int) -> None:
         logger.info("Syncing WEC %d calendar...", year)
-        html = self._fetch_calendar_html(year)
-        if not html:
+        page = self._calendar_page(year)
+        if not page:
+            return
+
+        calendar_url = WEC_CALENDAR_URL.format(year=year)
+        if http_client.is_unchanged(calendar_url, CALENDAR_CONSUMER):
+            logger.info("WEC %d calendar unchanged since last sync", year)
             return
 
-        events = _parse_wec_calendar_text(year, html)
+        events = page.events
         if not events:
             logger.warning("No WEC events parsed for year %d", year)
             return
@@ -375,11 +424,13 @@ class WecIngestion:
                         )
                     )
 
+        http_client.mark_processed(calendar_url, CALENDAR_CONSUMER)
         logger.info("WEC %d calendar sync complete (%d events).", year, len(events))
 
-    def sync_results_for_year(self, year: int) -> None:
+    def sync_results_for_year(self, year: int, event_slugs: Optional[Iterable[str]] = None) -> None:
         logger.info("Syncing WEC %d race results...", year)
-        link_map = self._fetch_result_link_map(year)
+        page = self._calendar_page(year)
+        link_map = page.result_links if page else {}
 
         with db_session() as db:
             series = _get_series(db)
@@ -395,20 +446,8 @@ class WecIngestion:
                 logger.warning("WEC season %d not found, skipping results sync", year)
                 return
 
-            events = db.query(Event).filter(Event.season_id == season.id).all()
-            for event in events:
-                race_session = (
-                    db.query(Session)
-                    .filter(Session.event_id == event.id, Session.type == "race")
-                    .first()
-                )
-                if not race_session:
-                    continue
-
-                existing_count = db.query(Result).filter(Result.session_id == race_session.id).count()
-                if existing_count > 0:
-                    continue
-
+            cache = EntityCache(db, series.id)
+            for event, race_session in sessions_missing_results(db, SERIES_SLUG, year, ("race",), event_slugs):
                 info = WEC_CIRCUIT_MAP.get(_normalize_key(event.name))
                 if not info:
                     logger.warning("No WEC result mapping for event '%s'", event.name)
@@ -423,26 +462,31 @@ class WecIngestion:
                     logger.warning("No WEC result rows parsed for %s", event.slug)
                     continue
 
+                cache.prefetch_drivers(_driver_slug(row["driver_name"], row["car_number"]) for row in rows)
+                result_rows = []
                 for row in rows:
-                    team = _find_or_create_team(db, series.id, row["team_name"])
-                    driver = _find_or_create_driver(db, row["driver_name"], row["car_number"], team.id)
-                    db.add(
-                        Result(
-                            session_id=race_session.id,
-                            driver_id=driver.id,
-                            position=row["position"],
-                            laps=row["laps"],
-                            time=row["time"],
-                            gap=row["gap"],
-                            status=row["status"] or "Classified",
-                            class_name=row["class_name"],
-                        )
+                    team = _find_or_create_team(db, series.id, row["team_name"], cache)
+                    driver = _find_or_create_driver(db, row["driver_name"], row["car_number"], team.id, cache)
+                    result_rows.append(
+                        {
+                            "session_id": race_session.id,
+                            "driver_id": driver.id,
+                            "position": row["position"],
+                            "laps": row["laps"],
+                            "time": row["time"],
+                            "gap": row["gap"],
+                            "status": row["status"] or "Classified",
+                            "class_name": row["class_name"],
+                        }
                     )
+                counts = upsert_results(db, result_rows)
 
                 race_session.status = "completed"
                 if event.end_date and event.end_date <= datetime.now(timezone.utc).date():
                     event.status = "completed"
-                logger.info("Synced WEC results for %s (%d rows)", event.slug, len(rows))
+                logger.info(
+                    "Synced WEC results for %s (%d inserted, %d updated)", event.slug, counts.inserted, counts.updated
+                )
 
     def sync_results(self, event_slug: str) -> None:
         logger.info("WEC results sync not yet implemented (event_slug=%s)", event_slug)
@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from ingestion.cassette import Cassette, CassetteMissError, open_cassette
+from ingestion.http_client import HttpClient
+
+URL = "https://api.jolpi.ca/ergast/f1/2025.json"
+
+
+def _response(status, body, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class TestCassette(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        Cassette(self._tmp.name, "record").record(
+            URL, _response(200, b'{"ok": true}', {"Content-Type": "application/json", "Content-Length": "12"})
+        )
+
+        response = Cassette(self._tmp.name, "replay").replay(URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(response.headers["Content-Type"], "application/json")
+        self.assertNotIn("Content-Length", response.headers)
+
+    def test_missing_recording_raises(self):
+        cassette = Cassette(self._tmp.name, "replay")
+        with self.assertRaises(CassetteMissError):
+            cassette.replay(URL)
+        self.assertEqual(cassette.snapshot()["misses"], 1)
+
+    def test_open_cassette(self):
+        self.assertIsNone(open_cassette(self._tmp.name, ""))
+        self.assertTrue(open_cassette(self._tmp.name, "REPLAY").replaying)
+        with self.assertRaises(ValueError):
+            open_cassette(self._tmp.name, "rewind")
+
+
+class TestHttpClientCassette(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_records_then_replays_without_network(self):
+        recorder = HttpClient(cassette=Cassette(self._tmp.name, "record"))
+        with patch.object(recorder._session_for("jolpica"), "get", return_value=_response(200, b"[1, 2]")):
+            recorder.get(URL)
+
+        player = HttpClient(cassette=Cassette(self._tmp.name, "replay"))
+        with patch.object(player._session_for("jolpica"), "get") as mock_get:
+            self.assertEqual(player.get(URL, conditional=True).json(), [1, 2])
+
+        mock_get.assert_not_called()
+        self.assertEqual(player.stats()["jolpica"]["requests"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import MagicMock
+
+from ingestion.entity_cache import EntityCache
+from ingestion.models import Driver, Season, Team
+
+
+def _make_db(seasons=(), teams=(), drivers=(), lookup=None):
+    """Mock session whose preload queries return the given rows."""
+    db = MagicMock()
+
+    def query_side_effect(model):
+        q = MagicMock()
+        if model is Season:
+            q.filter.return_value = list(seasons)
+        elif model is Team:
+            q.filter.return_value = list(teams)
+        elif model is Driver:
+            q.join.return_value.filter.return_value = list(drivers)
+            q.filter.return_value.__iter__.side_effect = lambda: iter(lookup or [])
+            q.filter.return_value.first.return_value = None
+        return q
+
+    db.query.side_effect = query_side_effect
+    return db
+
+
+class TestEntityCache(unittest.TestCase):
+
+    def test_preloaded_entities_are_served_from_memory(self):
+        team = MagicMock(id=3)
+        team.name = "Wayne Taylor Racing"
+        driver = MagicMock(id=7, slug="imsa-ricky-taylor-10", team_id=3)
+        db = _make_db(seasons=[MagicMock(year=2025)], teams=[team], drivers=[driver])
+
+        cache = EntityCache(db, series_id=2)
+        for _ in range(800):
+            self.assertIs(cache.team("Wayne Taylor Racing", {}), team)
+            self.assertIs(cache.driver("imsa-ricky-taylor-10", "Ricky Taylor", 10, 3), driver)
+        cache.season(2025)
+
+        self.assertEqual(cache.queries, 3)
+        self.assertEqual(db.query.call_count, 3)
+        db.add.assert_not_called()
+
+    def test_unseen_entities_are_created_once(self):
+        db = _make_db()
+        cache = EntityCache(db, series_id=2)
+
+        team = cache.team("Porsche Penske", {"short_name": "Porsche Penske", "color": "#4D4D4D"})
+        driver = cache.driver("imsa-felipe-nasr-7", "Felipe Nasr", 7, team.id)
+        self.assertIs(cache.team("Porsche Penske", {}), team)
+        self.assertIs(cache.driver("imsa-felipe-nasr-7", "Felipe Nasr", 7, team.id), driver)
+
+        self.assertIsInstance(team, Team)
+        self.assertEqual(team.series_id, 2)
+        self.assertIsInstance(driver, Driver)
+        self.assertEqual(driver.slug, "imsa-felipe-nasr-7")
+        self.assertEqual(cache.created, 2)
+        self.assertEqual(db.add.call_count, 2)
+        # Three preloads plus one slug lookup for the driver that was not attached to a series team.
+        self.assertEqual(cache.queries, 4)
+
+    def test_prefetch_resolves_drivers_in_one_query(self):
+        unassigned = MagicMock(id=9, slug="wec-kevin-estre-6", team_id=None)
+        db = _make_db(lookup=[unassigned])
+        cache = EntityCache(db, series_id=3)
+
+        cache.prefetch_drivers(["wec-kevin-estre-6", "wec-laurens-vanthoor-6", "wec-kevin-estre-6"])
+        self.assertIs(cache.driver("wec-kevin-estre-6", "Kevin Estre", 6, 4), unassigned)
+        new_driver = cache.driver("wec-laurens-vanthoor-6", "Laurens Vanthoor", 6, 4)
+
+        self.assertEqual(unassigned.team_id, 4)
+        self.assertEqual(new_driver.team_id, 4)
+        self.assertEqual(cache.queries, 4)
+        self.assertEqual(cache.created, 1)
+
+    def test_driver_moves_to_new_team(self):
+        driver = MagicMock(id=7, slug="max-verstappen", team_id=1)
+        db = _make_db(drivers=[driver])
+        cache = EntityCache(db, series_id=1)
+
+        cache.driver("max-verstappen", "Max Verstappen", 1, 2)
+
+        self.assertEqual(driver.team_id, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
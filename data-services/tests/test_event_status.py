@@ -0,0 +1,98 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session as DbSession
+
+from ingestion.event_status import apply_status_transitions
+from ingestion.models import Base, Circuit, Event, Season, Series, Session
+
+NOW = datetime(2025, 3, 16, 5, 30)
+
+
+class TestApplyStatusTransitions(unittest.TestCase):
+    """Runs the transitions against an in-memory SQLite copy of the schema."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: self.statements.append(args[2]))
+        self.db = DbSession(self.engine)
+        self.addCleanup(self.db.close)
+        self.db.add_all([
+            Series(id=1, name="Formula 1", slug="f1", color_primary="#E10600", color_secondary="#FFFFFF"),
+            Season(id=1, series_id=1, year=2025),
+            Circuit(id=1, name="Albert Park", country="Australia", city="Melbourne", timezone="UTC"),
+        ])
+
+    def _event(self, event_id, status, end_date, *sessions):
+        self.db.add(Event(
+            id=event_id, season_id=1, circuit_id=1, name=f"Event {event_id}", slug=f"event-{event_id}",
+            start_date=end_date - timedelta(days=2), end_date=end_date, status=status,
+        ))
+        for offset, (start_time, end_time) in enumerate(sessions):
+            self.db.add(Session(
+                id=event_id * 10 + offset, event_id=event_id, type="race", name="Race",
+                start_time=start_time, end_time=end_time,
+            ))
+
+    def _apply(self):
+        self.db.commit()
+        self.statements.clear()
+        changes = apply_status_transitions(self.db, NOW)
+        self.db.commit()
+        return changes
+
+    def _status(self, event_id):
+        return self.db.get(Event, event_id).status
+
+    def test_marks_past_events_completed(self):
+        self._event(1, "upcoming", date(2025, 3, 9))
+        self._event(2, "completed", date(2025, 3, 2))
+
+        changes = self._apply()
+
+        self.assertEqual(changes.completed, [1])
+        self.assertEqual(self._status(1), "completed")
+
+    def test_session_in_progress_makes_event_live(self):
+        self._event(1, "upcoming", date(2025, 3, 16), (NOW - timedelta(hours=1), NOW + timedelta(hours=1)))
+        # No end_time: assumed to run three hours from its start.
+        self._event(2, "upcoming", date(2025, 3, 16), (NOW - timedelta(hours=2), None))
+        self._event(3, "upcoming", date(2025, 3, 16), (NOW - timedelta(hours=4), None))
+        self._event(4, "upcoming", date(2025, 3, 23), (NOW + timedelta(days=7), None))
+
+        changes = self._apply()
+
+        self.assertEqual(sorted(changes.live), [1, 2])
+        self.assertEqual([self._status(i) for i in (1, 2, 3, 4)], ["live", "live", "upcoming", "upcoming"])
+
+    def test_event_with_several_live_sessions_changes_once(self):
+        window = (NOW - timedelta(minutes=30), NOW + timedelta(minutes=30))
+        self._event(1, "upcoming", date(2025, 3, 16), window, window)
+
+        self.assertEqual(self._apply().live, [1])
+
+    def test_live_event_between_sessions_goes_back_to_upcoming(self):
+        self._event(1, "live", date(2025, 3, 16), (NOW - timedelta(hours=5), NOW - timedelta(hours=4)))
+        self._event(2, "live", date(2025, 3, 16), (NOW - timedelta(minutes=5), NOW + timedelta(hours=1)))
+
+        changes = self._apply()
+
+        self.assertEqual(changes.upcoming, [1])
+        self.assertEqual(changes.live, [])
+        self.assertEqual([self._status(1), self._status(2)], ["upcoming", "live"])
+
+    def test_runs_a_constant_number_of_statements(self):
+        for event_id in range(1, 40):
+            self._event(event_id, "upcoming", date(2025, 3, 16) + timedelta(days=event_id), (NOW + timedelta(days=event_id), None))
+
+        changes = self._apply()
+
+        self.assertEqual(changes.total, 0)
+        self.assertEqual(len(self.statements), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
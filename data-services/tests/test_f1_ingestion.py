@@ -1,19 +1,30 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock, PropertyMock
 from contextlib import contextmanager
+from datetime import date, datetime
 
 import pandas as pd
 import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session as DbSession
 
 from ingestion.f1_ingestion import (
     slugify,
     _derive_positions_from_laps,
+    _load_session_results,
     _fetch_jolpica_results,
     _fetch_jolpica_schedule,
+    _fetch_jolpica_season_results,
     _find_or_create,
     _find_or_create_driver,
+    configure_fastf1_cache,
     F1Ingestion,
+    F1ScheduleProvider,
+    SessionResultJob,
 )
+from ingestion.models import Base, Circuit, Event, Season, Series, Session
 
 
 def _make_mock_db_session(mock_db):
@@ -100,6 +111,36 @@ class TestDerivePositionsFromLaps(unittest.TestCase):
         self.assertTrue(result["Position"].isna().all())
 
 
+class TestLoadSessionResults(unittest.TestCase):
+    """Tests for profile-based FastF1 session loading."""
+
+    def test_loads_results_only_when_positions_present(self):
+        mock_session = MagicMock()
+        mock_session.results = pd.DataFrame({"DriverNumber": ["1", "4"], "Position": [1.0, 2.0]})
+
+        result = _load_session_results(mock_session)
+
+        mock_session.load.assert_called_once_with(laps=False, telemetry=False, weather=False, messages=False)
+        self.assertEqual(list(result["Position"]), [1.0, 2.0])
+
+    def test_loads_laps_to_derive_missing_positions(self):
+        mock_session = MagicMock()
+        mock_session.results = pd.DataFrame({"DriverNumber": ["1", "4"], "Position": [float("nan"), float("nan")]})
+        mock_session.laps = pd.DataFrame({"DriverNumber": ["4", "1"], "LapNumber": [1, 1], "Position": [1.0, 2.0]})
+
+        result = _load_session_results(mock_session)
+
+        self.assertEqual(mock_session.load.call_count, 2)
+        self.assertEqual(mock_session.load.call_args.kwargs, {"laps": True, "telemetry": False, "weather": False, "messages": False})
+        self.assertEqual(list(result["Position"]), [2, 1])
+
+    def test_returns_none_for_empty_results(self):
+        mock_session = MagicMock()
+        mock_session.results = pd.DataFrame()
+        self.assertIsNone(_load_session_results(mock_session))
+        mock_session.load.assert_called_once()
+
+
 class TestFindOrCreate(unittest.TestCase):
     """Tests for the generic _find_or_create helper."""
 
@@ -187,10 +228,48 @@ class TestResolveRoundNumber(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestF1ScheduleProvider(unittest.TestCase):
+    """Tests for the memoized FastF1 schedule."""
+
+    def _frame(self):
+        return pd.DataFrame({
+            "EventName": ["Pre-Season Testing", "Australian Grand Prix", "Chinese Grand Prix"],
+            "RoundNumber": [0, 1, 2],
+        })
+
+    def test_loads_each_season_once(self):
+        loader = MagicMock(return_value=self._frame())
+        ingestion = F1Ingestion(schedules=F1ScheduleProvider(loader=loader))
+
+        self.assertEqual(ingestion.resolve_round_number(2025, "2025-chinese-grand-prix"), 2)
+        self.assertEqual(ingestion.resolve_round_number(2025, "2025-australian-grand-prix"), 1)
+        self.assertEqual(ingestion.schedules.get(2025).event_name(2), "Chinese Grand Prix")
+
+        loader.assert_called_once_with(2025)
+
+    def test_testing_events_have_no_round(self):
+        schedule = F1ScheduleProvider(loader=MagicMock(return_value=self._frame())).get(2025)
+        self.assertIsNone(schedule.round_for_slug("2025-pre-season-testing"))
+
+    def test_reloads_after_ttl(self):
+        loader = MagicMock(return_value=self._frame())
+        provider = F1ScheduleProvider(ttl_seconds=0, loader=loader)
+        provider.get(2025)
+        provider.get(2025)
+        self.assertEqual(loader.call_count, 2)
+
+    @patch("ingestion.f1_ingestion.fastf1")
+    def test_configure_fastf1_cache(self, mock_fastf1):
+        with tempfile.TemporaryDirectory() as tmp:
+            configure_fastf1_cache(os.path.join(tmp, "fastf1"))
+            mock_fastf1.Cache.enable_cache.assert_called_once_with(os.path.join(tmp, "fastf1"))
+            self.assertTrue(os.path.isdir(os.path.join(tmp, "fastf1")))
+
+
 class TestFetchJolpicaResults(unittest.TestCase):
     """Tests for fetching race results from the Jolpica API."""
 
-    @patch("ingestion.f1_ingestion.requests.get")
+    @patch("ingestion.f1_ingestion.http_client.get")
     def test_returns_results_for_valid_race(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
@@ -227,7 +306,7 @@ class TestFetchJolpicaResults(unittest.TestCase):
         self.assertEqual(results[0]["Driver"]["familyName"], "Norris")
         self.assertEqual(results[1]["position"], "2")
 
-    @patch("ingestion.f1_ingestion.requests.get")
+    @patch("ingestion.f1_ingestion.http_client.get")
     def test_returns_none_for_empty_races(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
@@ -237,14 +316,14 @@ class TestFetchJolpicaResults(unittest.TestCase):
         results = _fetch_jolpica_results(2025, 99)
         self.assertIsNone(results)
 
-    @patch("ingestion.f1_ingestion.requests.get")
+    @patch("ingestion.f1_ingestion.http_client.get")
     def test_returns_none_on_http_error(self, mock_get):
         mock_get.return_value.raise_for_status.side_effect = Exception("404")
 
         results = _fetch_jolpica_results(2025, 1)
         self.assertIsNone(results)
 
-    @patch("ingestion.f1_ingestion.requests.get")
+    @patch("ingestion.f1_ingestion.http_client.get")
     def test_calls_correct_url(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
@@ -253,10 +332,53 @@ class TestFetchJolpicaResults(unittest.TestCase):
 
         _fetch_jolpica_results(2025, 3)
         mock_get.assert_called_once_with(
-            "https://api.jolpi.ca/ergast/f1/2025/3/results.json", timeout=30
+            "https://api.jolpi.ca/ergast/f1/2025/3/results.json", conditional=True
         )
 
 
+class TestFetchJolpicaSeasonResults(unittest.TestCase):
+    """Tests for the paginated season results fetch."""
+
+    def _page(self, total, offset, races):
+        page = MagicMock()
+        page.json.return_value = {
+            "MRData": {"total": str(total), "limit": "100", "offset": str(offset), "RaceTable": {"Races": races}}
+        }
+        return page
+
+    @patch("ingestion.f1_ingestion.http_client.get")
+    def test_merges_races_split_across_pages(self, mock_get):
+        mock_get.side_effect = [
+            self._page(150, 0, [
+                {"round": "1", "Results": [{"position": "1"}]},
+                {"round": "2", "Results": [{"position": "1"}]},
+            ]),
+            self._page(150, 100, [
+                {"round": "2", "Results": [{"position": "2"}]},
+                {"round": "3", "Results": [{"position": "1"}]},
+            ]),
+        ]
+
+        results = _fetch_jolpica_season_results(2025)
+
+        self.assertEqual(sorted(results), [1, 2, 3])
+        self.assertEqual([r["position"] for r in results[2]], ["1", "2"])
+        self.assertEqual(mock_get.call_count, 2)
+        mock_get.assert_called_with(
+            "https://api.jolpi.ca/ergast/f1/2025/results.json?limit=100&offset=100", conditional=True
+        )
+
+    @patch("ingestion.f1_ingestion.http_client.get")
+    def test_returns_none_on_http_error(self, mock_get):
+        mock_get.return_value.raise_for_status.side_effect = Exception("500")
+        self.assertIsNone(_fetch_jolpica_season_results(2025))
+
+    @patch("ingestion.f1_ingestion.http_client.get")
+    def test_returns_none_for_empty_season(self, mock_get):
+        mock_get.return_value = self._page(0, 0, [])
+        self.assertIsNone(_fetch_jolpica_season_results(1949))
+
+
 class TestCreateResultsFromJolpica(unittest.TestCase):
     """Tests for creating Result records from Jolpica API data."""
 
@@ -277,9 +399,10 @@ class TestCreateResultsFromJolpica(unittest.TestCase):
             entry["Time"] = {"time": gap}
         return entry
 
+    @patch("ingestion.f1_ingestion.upsert_results")
     @patch("ingestion.f1_ingestion._find_or_create_driver")
     @patch("ingestion.f1_ingestion._find_or_create_team")
-    def test_creates_results_with_correct_positions(self, mock_team, mock_driver):
+    def test_creates_results_with_correct_positions(self, mock_team, mock_driver, mock_upsert):
         mock_team.return_value = MagicMock(id=1)
         mock_driver.return_value = MagicMock(id=10)
         mock_db = MagicMock()
@@ -295,22 +418,26 @@ class TestCreateResultsFromJolpica(unittest.TestCase):
         ingestion = F1Ingestion()
         ingestion._create_results_from_jolpica(mock_db, mock_series, entries, mock_session)
 
-        self.assertEqual(mock_db.add.call_count, 3)
-
-        # Verify the Result objects passed to db.add
-        added_results = [call.args[0] for call in mock_db.add.call_args_list]
-        self.assertEqual(added_results[0].position, 1)
-        self.assertEqual(added_results[0].gap, "1:42:06.304")
-        self.assertEqual(added_results[0].status, "Finished")
-        self.assertEqual(added_results[1].position, 2)
-        self.assertEqual(added_results[1].gap, "+0.895")
-        self.assertEqual(added_results[2].position, 20)
-        self.assertEqual(added_results[2].status, "Retired")
-        self.assertIsNone(added_results[2].gap)
-
+        mock_upsert.assert_called_once()
+        self.assertIs(mock_upsert.call_args.args[0], mock_db)
+
+        # Verify the result rows handed to the bulk upsert
+        added_results = mock_upsert.call_args.args[1]
+        self.assertEqual(len(added_results), 3)
+        self.assertEqual(added_results[0]["position"], 1)
+        self.assertEqual(added_results[0]["gap"], "1:42:06.304")
+        self.assertEqual(added_results[0]["status"], "Finished")
+        self.assertEqual(added_results[0]["session_id"], 100)
+        self.assertEqual(added_results[1]["position"], 2)
+        self.assertEqual(added_results[1]["gap"], "+0.895")
+        self.assertEqual(added_results[2]["position"], 20)
+        self.assertEqual(added_results[2]["status"], "Retired")
+        self.assertIsNone(added_results[2]["gap"])
+
+    @patch("ingestion.f1_ingestion.upsert_results")
     @patch("ingestion.f1_ingestion._find_or_create_driver")
     @patch("ingestion.f1_ingestion._find_or_create_team")
-    def test_retired_driver_has_no_gap(self, mock_team, mock_driver):
+    def test_retired_driver_has_no_gap(self, mock_team, mock_driver, mock_upsert):
         mock_team.return_value = MagicMock(id=1)
         mock_driver.return_value = MagicMock(id=10)
         mock_db = MagicMock()
@@ -323,13 +450,14 @@ class TestCreateResultsFromJolpica(unittest.TestCase):
         ingestion = F1Ingestion()
         ingestion._create_results_from_jolpica(mock_db, MagicMock(id=1), entries, MagicMock(id=1))
 
-        result = mock_db.add.call_args.args[0]
-        self.assertIsNone(result.gap)
-        self.assertEqual(result.status, "Retired")
+        result = mock_upsert.call_args.args[1][0]
+        self.assertIsNone(result["gap"])
+        self.assertEqual(result["status"], "Retired")
 
+    @patch("ingestion.f1_ingestion.upsert_results")
     @patch("ingestion.f1_ingestion._find_or_create_driver")
     @patch("ingestion.f1_ingestion._find_or_create_team")
-    def test_laps_field_populated(self, mock_team, mock_driver):
+    def test_laps_field_populated(self, mock_team, mock_driver, mock_upsert):
         mock_team.return_value = MagicMock(id=1)
         mock_driver.return_value = MagicMock(id=10)
         mock_db = MagicMock()
@@ -342,14 +470,14 @@ class TestCreateResultsFromJolpica(unittest.TestCase):
         ingestion = F1Ingestion()
         ingestion._create_results_from_jolpica(mock_db, MagicMock(id=1), entries, MagicMock(id=1))
 
-        result = mock_db.add.call_args.args[0]
-        self.assertEqual(result.laps, 57)
+        result = mock_upsert.call_args.args[1][0]
+        self.assertEqual(result["laps"], 57)
 
 
 class TestFetchJolpicaSchedule(unittest.TestCase):
     """Tests for fetching season schedule from the Jolpica API."""
 
-    @patch("ingestion.f1_ingestion.requests.get")
+    @patch("ingestion.f1_ingestion.http_client.get")
     def test_returns_races_for_valid_year(self, mock_get):
         mock_get.return_value.json.return_value = {
             "MRData": {
@@ -374,7 +502,7 @@ class TestFetchJolpicaSchedule(unittest.TestCase):
         self.assertEqual(len(races), 1)
         self.assertEqual(races[0]["raceName"], "British Grand Prix")
 
-    @patch("ingestion.f1_ingestion.requests.get")
+    @patch("ingestion.f1_ingestion.http_client.get")
     def test_calls_correct_url(self, mock_get):
         mock_get.return_value.json.return_value = {
             "MRData": {"RaceTable": {"Races": []}}
@@ -382,10 +510,10 @@ class TestFetchJolpicaSchedule(unittest.TestCase):
 
         _fetch_jolpica_schedule(1950)
         mock_get.assert_called_once_with(
-            "https://api.jolpi.ca/ergast/f1/1950.json", timeout=30
+            "https://api.jolpi.ca/ergast/f1/1950.json", conditional=True
         )
 
-    @patch("ingestion.f1_ingestion.requests.get")
+    @patch("ingestion.f1_ingestion.http_client.get")
     def test_returns_none_for_empty_races(self, mock_get):
         mock_get.return_value.json.return_value = {
             "MRData": {"RaceTable": {"Races": []}}
@@ -394,7 +522,7 @@ class TestFetchJolpicaSchedule(unittest.TestCase):
         result = _fetch_jolpica_schedule(1949)
         self.assertIsNone(result)
 
-    @patch("ingestion.f1_ingestion.requests.get")
+    @patch("ingestion.f1_ingestion.http_client.get")
     def test_returns_none_on_error(self, mock_get):
         mock_get.return_value.raise_for_status.side_effect = Exception("500")
 
@@ -455,115 +583,13 @@ class TestSyncCalendarFromJolpica(unittest.TestCase):
         ingestion.sync_calendar_from_jolpica(1949)
 
 
-class TestSyncRaceResults(unittest.TestCase):
-    """Tests for sync_race_results."""
-
-    @patch("ingestion.f1_ingestion._fetch_jolpica_results")
-    @patch("ingestion.f1_ingestion._find_or_create_driver")
-    @patch("ingestion.f1_ingestion._find_or_create_team")
-    @patch("ingestion.f1_ingestion.db_session")
-    def test_syncs_results_for_event(self, mock_db_session_fn, mock_team, mock_driver, mock_fetch_results):
-        mock_db = MagicMock()
-        mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
-
-        mock_series = MagicMock(id=1)
-        mock_event = MagicMock(id=5, slug="1950-british-grand-prix")
-        mock_race_session = MagicMock(id=20)
-        mock_team.return_value = MagicMock(id=1)
-        mock_driver.return_value = MagicMock(id=10)
-
-        # Queries: _get_series, event lookup, race session lookup, result count
-        def query_side_effect(model):
-            model_name = getattr(model, "__name__", "")
-            mock_q = MagicMock()
-            if model_name == "Series":
-                mock_q.filter.return_value.first.return_value = mock_series
-            elif model_name == "Event":
-                mock_q.filter.return_value.first.return_value = mock_event
-            elif model_name == "Session":
-                mock_q.filter.return_value.first.return_value = mock_race_session
-            elif model_name == "Result":
-                mock_q.filter.return_value.count.return_value = 0
-            return mock_q
-
-        mock_db.query.side_effect = query_side_effect
-
-        mock_fetch_results.return_value = [
-            {
-                "position": "1",
-                "Driver": {"givenName": "Nino", "familyName": "Farina", "permanentNumber": None},
-                "Constructor": {"name": "Alfa Romeo"},
-                "laps": "70",
-                "status": "Finished",
-                "Time": {"time": "2:13:23.6"},
-            }
-        ]
-
-        ingestion = F1Ingestion()
-        ingestion.sync_race_results(1950, 1, "British Grand Prix")
-
-        mock_fetch_results.assert_called_once_with(1950, 1)
-        self.assertEqual(mock_event.status, "completed")
-
-    @patch("ingestion.f1_ingestion.db_session")
-    def test_skips_when_event_not_found(self, mock_db_session_fn):
-        mock_db = MagicMock()
-        mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
-
-        mock_series = MagicMock(id=1)
-
-        def query_side_effect(model):
-            model_name = getattr(model, "__name__", "")
-            mock_q = MagicMock()
-            if model_name == "Series":
-                mock_q.filter.return_value.first.return_value = mock_series
-            else:
-                mock_q.filter.return_value.first.return_value = None
-            return mock_q
-
-        mock_db.query.side_effect = query_side_effect
-
-        ingestion = F1Ingestion()
-        ingestion.sync_race_results(1950, 1, "Nonexistent Grand Prix")
-
-    @patch("ingestion.f1_ingestion._fetch_jolpica_results")
-    @patch("ingestion.f1_ingestion.db_session")
-    def test_skips_when_results_already_exist(self, mock_db_session_fn, mock_fetch_results):
-        mock_db = MagicMock()
-        mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
-
-        mock_series = MagicMock(id=1)
-        mock_event = MagicMock(id=5)
-        mock_race_session = MagicMock(id=20)
-
-        def query_side_effect(model):
-            model_name = getattr(model, "__name__", "")
-            mock_q = MagicMock()
-            if model_name == "Series":
-                mock_q.filter.return_value.first.return_value = mock_series
-            elif model_name == "Event":
-                mock_q.filter.return_value.first.return_value = mock_event
-            elif model_name == "Session":
-                mock_q.filter.return_value.first.return_value = mock_race_session
-            elif model_name == "Result":
-                mock_q.filter.return_value.count.return_value = 22  # Already has results
-            return mock_q
-
-        mock_db.query.side_effect = query_side_effect
-
-        ingestion = F1Ingestion()
-        ingestion.sync_race_results(1950, 1, "British Grand Prix")
-
-        mock_fetch_results.assert_not_called()
-
-
 class TestSyncHistoricalSeason(unittest.TestCase):
     """Tests for sync_historical_season."""
 
-    @patch("ingestion.f1_ingestion.time.sleep")
+    @patch("ingestion.f1_ingestion._fetch_jolpica_season_results")
     @patch("ingestion.f1_ingestion._fetch_jolpica_schedule")
-    def test_calls_calendar_and_results(self, mock_fetch_schedule, mock_sleep):
-        mock_fetch_schedule.return_value = [
+    def test_fetches_schedule_and_results_once(self, mock_fetch_schedule, mock_fetch_season):
+        races = [
             {
                 "round": "1",
                 "raceName": "British Grand Prix",
@@ -583,26 +609,194 @@ class TestSyncHistoricalSeason(unittest.TestCase):
                 "date": "1950-05-21",
             },
         ]
+        mock_fetch_schedule.return_value = races
+        mock_fetch_season.return_value = {1: [{"position": "1"}], 2: [{"position": "1"}]}
 
         ingestion = F1Ingestion()
         with patch.object(ingestion, "sync_calendar_from_jolpica") as mock_cal, \
-             patch.object(ingestion, "sync_race_results") as mock_results:
+             patch.object(ingestion, "_sync_season_results") as mock_write:
             ingestion.sync_historical_season(1950)
 
-            mock_cal.assert_called_once_with(1950)
-            self.assertEqual(mock_results.call_count, 2)
-            mock_results.assert_any_call(1950, 1, "British Grand Prix")
-            mock_results.assert_any_call(1950, 2, "Monaco Grand Prix")
-            self.assertEqual(mock_sleep.call_count, 2)
+            mock_fetch_schedule.assert_called_once_with(1950)
+            mock_cal.assert_called_once_with(1950, races=races)
+            mock_fetch_season.assert_called_once_with(1950)
+            mock_write.assert_called_once_with(1950, races, mock_fetch_season.return_value)
+
+    @patch("ingestion.f1_ingestion.db_session")
+    def test_writes_missing_rounds_in_one_transaction(self, mock_db_session):
+        mock_db = MagicMock()
+        mock_db_session.side_effect = _make_mock_db_session(mock_db)
+
+        british = MagicMock(id=1, slug="1950-british-grand-prix")
+        monaco = MagicMock(id=2, slug="1950-monaco-grand-prix")
+        british_race = MagicMock(id=10, event_id=1)
+        monaco_race = MagicMock(id=20, event_id=2)
+        mock_db.query.return_value.filter.return_value.first.return_value = MagicMock()
+        mock_db.query.return_value.filter.return_value.all.side_effect = [
+            [british, monaco],
+            [british_race, monaco_race],
+        ]
+        mock_db.query.return_value.filter.return_value.distinct.return_value.all.return_value = [(20,)]
+
+        races = [
+            {"round": "1", "raceName": "British Grand Prix"},
+            {"round": "2", "raceName": "Monaco Grand Prix"},
+        ]
+        ingestion = F1Ingestion()
+        with patch.object(ingestion, "_create_results_from_jolpica") as mock_create:
+            ingestion._sync_season_results(1950, races, {1: [{"position": "1"}], 2: [{"position": "1"}]})
+
+        mock_create.assert_called_once()
+        self.assertIs(mock_create.call_args.args[3], british_race)
+        self.assertEqual(british_race.status, "completed")
+        self.assertEqual(british.status, "completed")
+        mock_db_session.assert_called_once()
 
     @patch("ingestion.f1_ingestion._fetch_jolpica_schedule")
     def test_handles_no_schedule(self, mock_fetch_schedule):
-        # First call (in sync_calendar_from_jolpica) and second call return None
         mock_fetch_schedule.return_value = None
 
         ingestion = F1Ingestion()
-        with patch.object(ingestion, "sync_calendar_from_jolpica"):
+        with patch.object(ingestion, "sync_calendar_from_jolpica") as mock_cal:
             ingestion.sync_historical_season(1949)
+            mock_cal.assert_not_called()
+
+
+class TestSyncMissingResults(unittest.TestCase):
+    """Tests for the batched, process-pool F1 results path."""
+
+    @patch("ingestion.f1_ingestion.db_session")
+    def test_pending_jobs_skip_completed_and_duplicate_sessions(self, mock_db_session):
+        mock_db = MagicMock()
+        mock_db_session.side_effect = _make_mock_db_session(mock_db)
+        event = MagicMock(id=1, slug="2025-chinese-grand-prix")
+        race = MagicMock(id=10, event_id=1, type="race")
+        race.name = "Race"
+        quali = MagicMock(id=11, event_id=1, type="qualifying")
+        quali.name = "Qualifying"
+        sprint = MagicMock(id=12, event_id=1, type="sprint")
+        sprint.name = "Sprint"
+        mock_db.query.return_value.filter.return_value.all.return_value = [event]
+        mock_db.query.return_value.filter.return_value.order_by.return_value.all.return_value = [race, quali, sprint]
+        mock_db.query.return_value.filter.return_value.distinct.return_value.all.return_value = [(10,)]
+
+        jobs = F1Ingestion()._pending_session_jobs({"2025-chinese-grand-prix": 2})
+
+        self.assertEqual(
+            jobs,
+            [
+                SessionResultJob("2025-chinese-grand-prix", 2, "Q", 11),
+                SessionResultJob("2025-chinese-grand-prix", 2, "S", 12),
+            ],
+        )
+
+    @patch("ingestion.f1_ingestion.db_session")
+    def test_pending_jobs_match_sprint_weekend_sessions_by_name(self, mock_db_session):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        db = DbSession(engine)
+        self.addCleanup(db.close)
+        db.add_all([
+            Series(id=1, name="Formula 1", slug="f1", color_primary="#E10600", color_secondary="#FFFFFF"),
+            Season(id=1, series_id=1, year=2025),
+            Circuit(id=1, name="Shanghai", country="China", city="Shanghai", timezone="UTC"),
+            Event(id=1, season_id=1, circuit_id=1, name="Chinese Grand Prix", slug="2025-chinese-grand-prix",
+                  start_date=date(2025, 3, 23), end_date=date(2025, 3, 23)),
+            Session(id=10, event_id=1, type="practice", name="Practice 1", start_time=datetime(2025, 3, 21, 3)),
+            Session(id=11, event_id=1, type="qualifying", name="Sprint Qualifying", start_time=datetime(2025, 3, 21, 7)),
+            Session(id=12, event_id=1, type="sprint", name="Sprint", start_time=datetime(2025, 3, 22, 3)),
+            Session(id=13, event_id=1, type="qualifying", name="Qualifying", start_time=datetime(2025, 3, 22, 7)),
+            Session(id=14, event_id=1, type="race", name="Race", start_time=datetime(2025, 3, 23, 7)),
+        ])
+        db.commit()
+        mock_db_session.side_effect = _make_mock_db_session(db)
+
+        jobs = F1Ingestion()._pending_session_jobs({"2025-chinese-grand-prix": 2})
+
+        self.assertEqual(
+            {(job.session_code, job.session_id) for job in jobs},
+            {("R", 14), ("Q", 13), ("S", 12), ("SQ", 11)},
+        )
+
+    @patch("ingestion.f1_ingestion.ProcessPoolExecutor")
+    def test_loads_sessions_in_spawned_worker_pool(self, mock_pool_cls):
+        pool = mock_pool_cls.return_value.__enter__.return_value
+        ok, failed = MagicMock(), MagicMock()
+        ok.result.return_value = [{"FirstName": "Lando", "Position": 1.0}]
+        failed.result.side_effect = Exception("no data")
+        pool.submit.side_effect = [ok, failed]
+        jobs = [SessionResultJob("a", 1, "Q", 11), SessionResultJob("a", 1, "S", 12)]
+
+        loaded = F1Ingestion(max_workers=4)._load_session_records(2025, jobs)
+
+        self.assertEqual(list(loaded), [jobs[0]])
+        kwargs = mock_pool_cls.call_args.kwargs
+        self.assertEqual(kwargs["max_workers"], 2)
+        self.assertEqual(kwargs["mp_context"].get_start_method(), "spawn")
+
+    @patch("ingestion.f1_ingestion._load_session_records")
+    def test_single_worker_loads_in_process(self, mock_load):
+        mock_load.return_value = [{"FirstName": "Lando"}]
+        jobs = [SessionResultJob("a", 1, "Q", 11), SessionResultJob("a", 1, "S", 12)]
+
+        with patch("ingestion.f1_ingestion.ProcessPoolExecutor") as mock_pool_cls:
+            loaded = F1Ingestion(max_workers=1)._load_session_records(2025, jobs)
+
+        mock_pool_cls.assert_not_called()
+        self.assertEqual(len(loaded), 2)
+
+    @patch("ingestion.f1_ingestion._fetch_jolpica_results")
+    def test_writes_everything_in_one_transaction(self, mock_jolpica):
+        mock_jolpica.return_value = [{"position": "1"}]
+        jobs = [SessionResultJob("a", 1, "R", 10), SessionResultJob("a", 1, "Q", 11)]
+        ingestion = F1Ingestion()
+
+        with patch.object(ingestion, "resolve_round_number", return_value=1), \
+             patch.object(ingestion, "_pending_session_jobs", return_value=jobs), \
+             patch.object(ingestion, "_load_session_records", return_value={jobs[1]: [{"FirstName": "Lando"}]}) as mock_load, \
+             patch.object(ingestion, "_write_session_results") as mock_write:
+            ingestion.sync_missing_results(2025, ["a"])
+
+        mock_load.assert_called_once_with(2025, [jobs[1]])
+        mock_write.assert_called_once_with(2025, {jobs[0]: [{"position": "1"}]}, {jobs[1]: [{"FirstName": "Lando"}]})
+
+
+
+class TestSyncSessionResults(unittest.TestCase):
+    """Runs against an in-memory SQLite copy of the schema with a sprint weekend's two qualifying sessions."""
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.db = DbSession(engine)
+        self.addCleanup(self.db.close)
+        self.db.add_all([
+            Series(id=1, name="Formula 1", slug="f1", color_primary="#E10600", color_secondary="#FFFFFF"),
+            Season(id=1, series_id=1, year=2025),
+            Circuit(id=1, name="Shanghai", country="China", city="Shanghai", timezone="UTC"),
+            Event(id=1, season_id=1, circuit_id=1, name="Chinese Grand Prix", slug="2025-chinese-grand-prix",
+                  start_date=date(2025, 3, 23), end_date=date(2025, 3, 23)),
+            Session(id=11, event_id=1, type="qualifying", name="Sprint Qualifying", start_time=datetime(2025, 3, 21, 7)),
+            Session(id=12, event_id=1, type="qualifying", name="Qualifying", start_time=datetime(2025, 3, 22, 7)),
+        ])
+        self.db.commit()
+
+    @patch("ingestion.f1_ingestion._load_session_results")
+    @patch("ingestion.f1_ingestion.fastf1")
+    @patch("ingestion.f1_ingestion.db_session")
+    def test_writes_to_the_given_session(self, mock_db_session, mock_fastf1, mock_load):
+        mock_db_session.side_effect = _make_mock_db_session(self.db)
+        mock_load.return_value = pd.DataFrame([{"FirstName": "Lando"}])
+        ingestion = F1Ingestion(schedules=MagicMock())
+        ingestion.schedules.get.return_value.event_name.return_value = "Chinese Grand Prix"
+
+        with patch.object(ingestion, "_create_results") as mock_create:
+            ingestion._sync_session_results(2025, 2, "Q", 12)
+
+        mock_fastf1.get_session.assert_called_once_with(2025, 2, "Q")
+        self.assertEqual(mock_create.call_args.args[3].id, 12)
+        self.assertEqual(self.db.get(Session, 12).status, "completed")
+        self.assertEqual(self.db.get(Session, 11).status, "scheduled")
 
 
 if __name__ == "__main__":
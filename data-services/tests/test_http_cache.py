@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+import requests
+
+from ingestion.http_cache import HttpCache, conditional_headers, response_from_entry
+
+
+def _make_response(body: bytes, status: int = 200, headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(self._tmp.name, max_bytes=1024)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_store_and_get_round_trip(self):
+        url = "https://api.jolpi.ca/ergast/f1/2025.json"
+        self.cache.store(url, _make_response(b'{"a": 1}', headers={"ETag": '"v1"', "Content-Type": "application/json"}))
+
+        entry = self.cache.get(url)
+        self.assertEqual(entry.body, b'{"a": 1}')
+        self.assertEqual(entry.etag, '"v1"')
+        self.assertEqual(conditional_headers(entry), {"If-None-Match": '"v1"'})
+
+    def test_skips_responses_without_validators(self):
+        url = "https://www.fia.com/page"
+        self.cache.store(url, _make_response(b"<html></html>"))
+        self.assertIsNone(self.cache.get(url))
+
+    def test_evicts_least_recently_used_when_over_budget(self):
+        headers = {"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        self.cache.store("https://a/1", _make_response(b"x" * 500, headers=headers))
+        os.utime(self.cache._paths("https://a/1")[1], (0, 0))
+        self.cache.store("https://a/2", _make_response(b"y" * 500, headers=headers))
+        self.cache.store("https://a/3", _make_response(b"z" * 500, headers=headers))
+
+        self.assertIsNone(self.cache.get("https://a/1"))
+        self.assertIsNotNone(self.cache.get("https://a/3"))
+        self.assertGreaterEqual(self.cache.stats.evictions, 1)
+        self.assertLessEqual(self.cache.snapshot()["size_bytes"], 1024)
+
+    def test_response_from_entry_serves_cached_body(self):
+        url = "https://imsa.results.alkamelcloud.com/Results/"
+        self.cache.store(url, _make_response(b"<a href='x/'>x</a>", headers={"ETag": '"v1"', "Content-Type": "text/html"}))
+        entry = self.cache.get(url)
+
+        response = response_from_entry(entry, _make_response(b"", status=304, headers={"Content-Length": "0"}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "<a href='x/'>x</a>")
+        self.assertNotIn("Content-Length", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+import io
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+import urllib3
+
+from ingestion.http_cache import HttpCache
+from ingestion.http_client import HttpClient, provider_for_url
+from ingestion.resilience import CircuitOpenError, RetryPolicy
+
+
+class TestProviderForUrl(unittest.TestCase):
+
+    def test_known_hosts(self):
+        self.assertEqual(provider_for_url("https://api.jolpi.ca/ergast/f1/2025.json"), "jolpica")
+        self.assertEqual(provider_for_url("https://www.fia.com/events/x"), "fia")
+        self.assertEqual(provider_for_url("https://imsa.results.alkamelcloud.com/Results/"), "alkamel")
+
+    def test_unknown_host(self):
+        self.assertEqual(provider_for_url("https://example.com/"), "other")
+
+
+class TestHttpClient(unittest.TestCase):
+
+    def test_reuses_session_per_provider(self):
+        client = HttpClient()
+        first = client._session_for("jolpica")
+        self.assertIs(client._session_for("jolpica"), first)
+        self.assertIsNot(client._session_for("fia"), first)
+
+    def test_caps_connections_per_host(self):
+        client = HttpClient(max_connections_per_host=2)
+        adapter = client._session_for("alkamel").get_adapter("https://imsa.results.alkamelcloud.com/")
+        self.assertEqual(adapter._pool_maxsize, 2)
+        self.assertTrue(adapter._pool_block)
+
+    def test_get_records_stats(self):
+        client = HttpClient(connect_timeout=5, read_timeout=20)
+        response = MagicMock(status_code=200, content=b"{}")
+        with patch.object(client._session_for("jolpica"), "get", return_value=response) as mock_get:
+            client.get("https://api.jolpi.ca/ergast/f1/2025.json")
+
+        mock_get.assert_called_once_with("https://api.jolpi.ca/ergast/f1/2025.json", timeout=(5, 20))
+        stats = client.stats()["jolpica"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["errors"], 0)
+        self.assertEqual(stats["bytes_received"], 2)
+
+    def test_get_counts_errors(self):
+        client = HttpClient()
+        with patch.object(client._session_for("fia"), "get", side_effect=Exception("boom")):
+            with self.assertRaises(Exception):
+                client.get("https://www.fia.com/events/x")
+
+        self.assertEqual(client.stats()["fia"]["errors"], 1)
+
+
+class TestOpenStream(unittest.TestCase):
+
+    def test_streams_body_without_preloading(self):
+        client = HttpClient()
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = urllib3.HTTPResponse(body=io.BytesIO(b"\xef\xbb\xbf{}"), preload_content=False)
+        with patch.object(client._session_for("alkamel"), "get", return_value=response) as mock_get:
+            with client.open_stream("https://imsa.results.alkamelcloud.com/x.JSON") as stream:
+                self.assertEqual(stream.peek(3)[:3], b"\xef\xbb\xbf")
+                self.assertEqual(stream.read(), b"\xef\xbb\xbf{}")
+
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+
+    def test_raises_for_error_status(self):
+        client = HttpClient()
+        response = requests.Response()
+        response.status_code = 404
+        response._content = b""
+        with patch.object(client._session_for("alkamel"), "get", return_value=response):
+            with self.assertRaises(requests.HTTPError):
+                with client.open_stream("https://imsa.results.alkamelcloud.com/x.JSON"):
+                    pass
+
+
+class TestRateLimiting(unittest.TestCase):
+
+    def _response(self, status, headers=None):
+        response = requests.Response()
+        response.status_code = status
+        response._content = b""
+        response.headers.update(headers or {})
+        return response
+
+    def test_waits_out_retry_after_then_retries(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = 0.0
+        client = HttpClient(rate_limiter=limiter)
+        responses = [self._response(429, {"Retry-After": "7"}), self._response(200)]
+        with patch.object(client._session_for("jolpica"), "get", side_effect=responses):
+            response = client.get("https://api.jolpi.ca/ergast/f1/2025.json")
+
+        self.assertEqual(response.status_code, 200)
+        limiter.defer.assert_called_once_with("jolpica", 7.0)
+        self.assertEqual(limiter.acquire.call_count, 2)
+        self.assertEqual(client.stats()["jolpica"]["rate_limited"], 1)
+
+    def test_gives_up_when_retry_after_is_too_long(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = 0.0
+        client = HttpClient(rate_limiter=limiter, retry_after_max_seconds=60)
+        with patch.object(client._session_for("jolpica"), "get", return_value=self._response(429, {"Retry-After": "3600"})):
+            response = client.get("https://api.jolpi.ca/ergast/f1/2025.json")
+
+        self.assertEqual(response.status_code, 429)
+        limiter.defer.assert_not_called()
+
+
+class TestResilience(unittest.TestCase):
+    URL = "https://www.fia.com/events/x"
+
+    def _response(self, status):
+        response = requests.Response()
+        response.status_code = status
+        response._content = b""
+        return response
+
+    def _client(self, **kwargs):
+        self.sleeps = []
+        return HttpClient(retry_policy=RetryPolicy(3, 0.5, 10.0), sleep=self.sleeps.append, **kwargs)
+
+    def test_retries_transient_failures_then_succeeds(self):
+        client = self._client()
+        side_effect = [requests.ConnectionError("reset"), self._response(503), self._response(200)]
+        with patch.object(client._session_for("fia"), "get", side_effect=side_effect) as mock_get:
+            response = client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertEqual(client.stats()["fia"]["retries"], 2)
+
+    def test_does_not_retry_client_errors(self):
+        client = self._client()
+        with patch.object(client._session_for("fia"), "get", return_value=self._response(404)) as mock_get:
+            self.assertEqual(client.get(self.URL).status_code, 404)
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_open_breaker_skips_provider_without_network(self):
+        client = self._client(breaker_failure_threshold=3)
+        with patch.object(client._session_for("fia"), "get", side_effect=requests.Timeout("slow")) as mock_get:
+            with self.assertRaises(requests.Timeout):
+                client.get(self.URL)
+            with self.assertRaises(CircuitOpenError):
+                client.get(self.URL)
+
+        self.assertEqual(mock_get.call_count, 3)
+        circuit = client.stats()["fia"]["circuit"]
+        self.assertEqual(circuit["state"], "open")
+        self.assertEqual(circuit["rejected"], 1)
+
+    def test_breakers_are_per_provider(self):
+        client = self._client(breaker_failure_threshold=1)
+        with patch.object(client._session_for("fia"), "get", side_effect=requests.ConnectionError("down")):
+            with self.assertRaises(CircuitOpenError):
+                client.get(self.URL)
+        with patch.object(client._session_for("jolpica"), "get", return_value=self._response(200)):
+            self.assertEqual(client.get("https://api.jolpi.ca/ergast/f1/2025.json").status_code, 200)
+
+
+class TestConditionalGet(unittest.TestCase):
+    URL = "https://api.jolpi.ca/ergast/f1/2025/driverstandings.json"
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.client = HttpClient(cache=HttpCache(self._tmp.name, max_bytes=1024 * 1024))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _response(self, status, body=b"", headers=None):
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.headers.update(headers or {})
+        return response
+
+    def test_304_serves_cached_body_and_tracks_processing(self):
+        session = self.client._session_for("jolpica")
+        first = self._response(200, b'{"v": 1}', {"ETag": '"abc"'})
+        with patch.object(session, "get", side_effect=[first, self._response(304)]) as mock_get:
+            self.client.get(self.URL, conditional=True)
+            self.assertFalse(self.client.is_unchanged(self.URL, "standings"))
+            self.client.mark_processed(self.URL, "standings")
+
+            second = self.client.get(self.URL, conditional=True)
+
+        self.assertEqual(mock_get.call_args.kwargs["headers"], {"If-None-Match": '"abc"'})
+        self.assertEqual(second.json(), {"v": 1})
+        self.assertTrue(self.client.is_unchanged(self.URL, "standings"))
+        self.assertFalse(self.client.is_unchanged(self.URL, "other-consumer"))
+        self.assertEqual(self.client.cache.stats.hits, 1)
+        self.assertEqual(self.client.cache.stats.misses, 1)
+
+    def test_changed_body_resets_processed_consumers(self):
+        session = self.client._session_for("jolpica")
+        responses = [
+            self._response(200, b"1", {"ETag": '"a"'}),
+            self._response(200, b"2", {"ETag": '"b"'}),
+        ]
+        with patch.object(session, "get", side_effect=responses):
+            self.client.get(self.URL, conditional=True)
+            self.client.mark_processed(self.URL, "standings")
+            self.client.get(self.URL, conditional=True)
+
+        self.assertFalse(self.client.is_unchanged(self.URL, "standings"))
+        self.assertEqual(self.client.cache.get(self.URL).body, b"2")
+
+    def test_revalidation_state_is_bounded(self):
+        self.client.max_tracked_urls = 2
+        urls = [f"{self.URL}?page={i}" for i in range(3)]
+        for url in urls:
+            self.client.mark_processed(url, "standings")
+        # The third URL evicts the first; processing the first again brings it back as most recent.
+        self.client.mark_processed(urls[0], "calendar")
+        self.client.mark_processed(f"{self.URL}?page=3", "standings")
+
+        self.assertEqual(list(self.client._processed), [urls[0], f"{self.URL}?page=3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from ingestion.imsa_crawler import ImsaCrawler, _extract_index_links, _parse_event_name_from_dir, year_dir_url
+
+YEAR_URL = year_dir_url(2025)
+SERIES_DIR = "04_IMSA%20WeatherTech%20SportsCar%20Championship/"
+DAYTONA_URL = f"{YEAR_URL}02_Daytona%20International%20Speedway/"
+SEBRING_URL = f"{YEAR_URL}03_Sebring%20International%20Raceway/"
+
+TREE = {
+    YEAR_URL: ["02_Daytona%20International%20Speedway/", "03_Sebring%20International%20Raceway/", "README.txt"],
+    DAYTONA_URL: [SERIES_DIR, "01_Michelin%20Pilot%20Challenge/"],
+    SEBRING_URL: ["01_Michelin%20Pilot%20Challenge/"],
+    f"{DAYTONA_URL}{SERIES_DIR}": ["202501250140_Race/", "202501230900_Practice%201/"],
+    f"{DAYTONA_URL}{SERIES_DIR}202501250140_Race/": [
+        "03_Results_Race_Provisional.JSON",
+        "01_Hour%201/",
+        "24_Hour%2024/",
+    ],
+    f"{DAYTONA_URL}{SERIES_DIR}202501250140_Race/01_Hour%201/": [
+        "05_Results_Race_Official.JSON",
+        "23_Time%20Cards_Race.JSON",
+    ],
+    f"{DAYTONA_URL}{SERIES_DIR}202501250140_Race/24_Hour%2024/": [
+        "05_Results_Race_Official.JSON",
+        "03_Results%20by%20Hour_Race_Official.JSON",
+        "23_Time%20Cards_Race.JSON",
+        "12_Lap%20Chart_Race.JSON",
+    ],
+}
+
+
+class FakeTree:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str) -> list[str]:
+        with self._lock:
+            self.calls.append(url)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return TREE.get(url, [])
+
+
+class TestExtractIndexLinks(unittest.TestCase):
+
+    def _soup_links(self, page):
+        return [a["href"] for a in BeautifulSoup(page, "html.parser").find_all("a", href=True)]
+
+    def test_matches_beautifulsoup_on_apache_index(self):
+        page = (
+            '<table><tr><th><a href="?C=N;O=D">Name</a></th></tr>'
+            '<tr><td><a href="/Results/">Parent Directory</a></td></tr>'
+            '<tr><td><A HREF="02_Daytona%20International%20Speedway/">02_Daytona...</A></td></tr>'
+            "<tr><td><a class='f' href='Results&amp;Stats.JSON'>x</a></td></tr>"
+            "<tr><td><a href=README.txt>README.txt</a></td></tr></table>"
+        )
+
+        links = _extract_index_links(page)
+
+        self.assertEqual(links, self._soup_links(page))
+        self.assertIn("Results&Stats.JSON", links)
+
+    def test_falls_back_for_anchors_without_href(self):
+        page = '<a name="top"></a><a href="01_Race/">01_Race/</a><abbr>x</abbr>'
+        self.assertEqual(_extract_index_links(page), ["01_Race/"])
+
+
+class TestImsaCrawler(unittest.TestCase):
+
+    def test_parse_event_name_from_dir(self):
+        self.assertEqual(
+            _parse_event_name_from_dir("02_Daytona%20International%20Speedway/"),
+            "Daytona International Speedway",
+        )
+
+    def test_discover_events(self):
+        crawler = ImsaCrawler(fetch_links=FakeTree())
+        events = asyncio.run(crawler.discover_events(2025))
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["name"], "Daytona International Speedway")
+        self.assertEqual(events[0]["race_dir"], "202501250140_Race/")
+        self.assertEqual(events[0]["start_date"], date(2025, 1, 25))
+
+    def test_find_race_artifacts_prefers_final_hour_official_files(self):
+        crawler = ImsaCrawler(fetch_links=FakeTree())
+        artifacts = asyncio.run(crawler.find_race_artifacts(f"{DAYTONA_URL}{SERIES_DIR}", "202501250140_Race/"))
+
+        race_url = f"{DAYTONA_URL}{SERIES_DIR}202501250140_Race/"
+        self.assertEqual(artifacts["results"], f"{race_url}24_Hour%2024/05_Results_Race_Official.JSON")
+        self.assertEqual(artifacts["timecards"], f"{race_url}24_Hour%2024/23_Time%20Cards_Race.JSON")
+        self.assertEqual(artifacts["lapchart"], f"{race_url}24_Hour%2024/12_Lap%20Chart_Race.JSON")
+
+    def test_crawl_year_fetches_siblings_concurrently_within_host_limit(self):
+        tree = FakeTree(delay=0.05)
+        crawler = ImsaCrawler(fetch_links=tree, max_concurrency_per_host=2)
+        events = asyncio.run(crawler.crawl_year(2025))
+
+        self.assertEqual(len(events), 1)
+        self.assertIn("results", events[0]["artifacts"])
+        self.assertEqual(tree.max_in_flight, 2)
+
+    def test_discover_events_reuses_known_track_folders(self):
+        tree = FakeTree()
+        crawler = ImsaCrawler(fetch_links=tree)
+        known = {"02_Daytona%20International%20Speedway/": {"name": "Daytona (indexed)"}}
+
+        events = asyncio.run(crawler.discover_events(2025, known=known))
+
+        self.assertEqual(events[0]["name"], "Daytona (indexed)")
+        self.assertNotIn(DAYTONA_URL, tree.calls)
+        self.assertIn(SEBRING_URL, tree.calls)
+
+    def test_crawler_can_run_in_successive_event_loops(self):
+        crawler = ImsaCrawler(fetch_links=FakeTree())
+        asyncio.run(crawler.discover_events(2025))
+        self.assertEqual(len(asyncio.run(crawler.discover_events(2025))), 1)
+
+    def test_failed_listing_is_counted_and_crawl_continues(self):
+        tree = FakeTree()
+
+        def fetch(url):
+            if url == DAYTONA_URL:
+                raise ConnectionError("alkamel down")
+            return tree(url)
+
+        crawler = ImsaCrawler(fetch_links=fetch)
+        events = asyncio.run(crawler.discover_events(2025))
+
+        self.assertEqual(crawler.failed_listings, 1)
+        self.assertEqual(events, [])
+        self.assertIn(SEBRING_URL, tree.calls)
+
+    @patch("ingestion.imsa_crawler._extract_index_links")
+    @patch("ingestion.imsa_crawler.http_client")
+    def test_parsed_listings_are_reused_per_crawler(self, mock_http_client, mock_extract):
+        mock_http_client.is_unchanged.return_value = True
+        mock_extract.return_value = ["02_Daytona/"]
+        crawler = ImsaCrawler()
+
+        self.assertEqual(crawler._fetch_directory_links(YEAR_URL), ["02_Daytona/"])
+        self.assertEqual(crawler._fetch_directory_links(YEAR_URL), ["02_Daytona/"])
+        self.assertEqual(mock_extract.call_count, 1)
+
+        # A new crawler (the next sync cycle) starts without the previous cycle's listings.
+        ImsaCrawler()._fetch_directory_links(YEAR_URL)
+        self.assertEqual(mock_extract.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,20 +1,64 @@
+import codecs
+import io
+import json
 import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
 
 from ingestion.imsa_ingestion import (
+    ImsaIngestion,
     _extract_imsa_lap_telemetry_from_json,
     _extract_imsa_result_rows_from_csv,
     _extract_imsa_result_rows_from_json,
-    _parse_event_name_from_dir,
+    _imsa_lapchart_positions,
+    _iter_imsa_lap_telemetry,
+    _is_sealed_season,
+    _iter_json_items,
 )
 
 
-class TestImsaParsing(unittest.TestCase):
-    def test_parse_event_name_from_dir(self):
-        self.assertEqual(
-            _parse_event_name_from_dir("02_Daytona%20International%20Speedway/"),
-            "Daytona International Speedway",
-        )
+TIMECARDS = {
+    "participants": [
+        {
+            "number": "007",
+            "team": "Aston Martin THOR Team",
+            "drivers": [
+                {"number": 1, "firstname": "Harry", "surname": "Tincknell"},
+            ],
+            "laps": [
+                {
+                    "number": 1,
+                    "driver_number": "1",
+                    "time": "1:40.100",
+                    "average_speed_kph": "180.0",
+                    "top_speed_kph": "295.0",
+                    "session_elapsed": "1:40.100",
+                    "hour": "1/25/2025 1:42:36 PM",
+                    "is_valid": True,
+                    "crossing_pit_finish_lane": False,
+                    "sector_times": [
+                        {"index": 1, "time": "30.0"},
+                        {"index": 2, "time": "35.0"},
+                        {"index": 3, "time": "35.1"},
+                    ],
+                }
+            ],
+        }
+    ]
+}
+LAPCHART = {
+    "laps": [
+        {
+            "lap_number": 1,
+            "positions": [
+                {"position": 5, "number": "007"},
+            ],
+        }
+    ]
+}
+
 
+class TestImsaParsing(unittest.TestCase):
     def test_extract_imsa_result_rows_from_json(self):
         payload = {
             "classification": [
@@ -80,46 +124,7 @@ class TestImsaParsing(unittest.TestCase):
         self.assertEqual(rows[0]["team_name"], "Konica Minolta Cadillac DPi-V.R")
 
     def test_extract_imsa_lap_telemetry_from_json(self):
-        timecards = {
-            "participants": [
-                {
-                    "number": "007",
-                    "team": "Aston Martin THOR Team",
-                    "drivers": [
-                        {"number": 1, "firstname": "Harry", "surname": "Tincknell"},
-                    ],
-                    "laps": [
-                        {
-                            "number": 1,
-                            "driver_number": "1",
-                            "time": "1:40.100",
-                            "average_speed_kph": "180.0",
-                            "top_speed_kph": "295.0",
-                            "session_elapsed": "1:40.100",
-                            "hour": "1/25/2025 1:42:36 PM",
-                            "is_valid": True,
-                            "crossing_pit_finish_lane": False,
-                            "sector_times": [
-                                {"index": 1, "time": "30.0"},
-                                {"index": 2, "time": "35.0"},
-                                {"index": 3, "time": "35.1"},
-                            ],
-                        }
-                    ],
-                }
-            ]
-        }
-        lapchart = {
-            "laps": [
-                {
-                    "lap_number": 1,
-                    "positions": [
-                        {"position": 5, "number": "007"},
-                    ],
-                }
-            ]
-        }
-
+        timecards, lapchart = TIMECARDS, LAPCHART
         rows = _extract_imsa_lap_telemetry_from_json(timecards, lapchart)
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["car_number"], "007")
@@ -128,6 +133,191 @@ class TestImsaParsing(unittest.TestCase):
         self.assertEqual(rows[0]["sector1_time"], "30.0")
         self.assertEqual(rows[0]["sector3_time"], "35.1")
 
+    def test_streamed_lap_telemetry_matches_parsed_json(self):
+        def bom_stream(payload):
+            return io.BufferedReader(io.BytesIO(codecs.BOM_UTF8 + json.dumps(payload).encode("utf-8")))
+
+        position_map = _imsa_lapchart_positions(_iter_json_items(bom_stream(LAPCHART), "laps.item"))
+        rows = list(_iter_imsa_lap_telemetry(_iter_json_items(bom_stream(TIMECARDS), "participants.item"), position_map))
+
+        self.assertEqual(rows, _extract_imsa_lap_telemetry_from_json(TIMECARDS, LAPCHART))
+
+
+def _indexed_event(track_dir, name, results, crawled_at):
+    return {
+        "name": name,
+        "track_dir": track_dir,
+        "start_date": date(2024, 1, 27),
+        "end_date": date(2024, 1, 27),
+        "circuit_name": name,
+        "series_url": f"https://example/{track_dir}series/",
+        "race_dir": "202401271340_Race/",
+        "artifacts": {
+            "results": results,
+            "timecards": "https://example/23_Time%20Cards_Race.JSON",
+            "lapchart": "https://example/12_Lap%20Chart_Race.JSON",
+        },
+        "crawled_at": crawled_at,
+    }
+
+
+class TestImsaCrawlMemoization(unittest.TestCase):
+    def _crawler(self):
+        crawler = MagicMock()
+        event = {
+            "name": "Daytona International Speedway",
+            "track_dir": "02_Daytona%20International%20Speedway/",
+            "start_date": date(2025, 1, 25),
+            "series_url": "https://example/series/",
+            "race_dir": "202501250140_Race/",
+        }
+
+        async def discover_events(year, known=None):
+            return [event]
+
+        async def attach_artifacts(events):
+            return [{**e, "artifacts": {"results": "https://example/results.json"}} for e in events]
+
+        crawler.discover_events = MagicMock(side_effect=discover_events)
+        crawler.attach_artifacts = MagicMock(side_effect=attach_artifacts)
+        return crawler
+
+    def test_tree_is_walked_once_per_year_across_stages(self):
+        crawler = self._crawler()
+        ingestion = ImsaIngestion(crawler=crawler, artifact_index=MagicMock(load=MagicMock(return_value=[])))
+
+        events = ingestion._discover_weathertech_events(2025)
+        crawled = ingestion._crawl_year(2025)
+        ingestion._crawl_year(2025)
+
+        self.assertEqual(events[0]["slug"], "2025-daytona-international-speedway")
+        self.assertEqual(crawled[0]["artifacts"]["results"], "https://example/results.json")
+        crawler.discover_events.assert_called_once_with(2025, known={})
+        crawler.attach_artifacts.assert_called_once()
+        ingestion.artifact_index.save.assert_called_once()
+
+    def test_expired_crawl_is_repeated(self):
+        crawler = self._crawler()
+        ingestion = ImsaIngestion(
+            crawler=crawler, crawl_ttl_seconds=0, artifact_index=MagicMock(load=MagicMock(return_value=[]))
+        )
+
+        ingestion._discover_weathertech_events(2025)
+        ingestion._discover_weathertech_events(2025)
+
+        self.assertEqual(crawler.discover_events.call_count, 2)
+
+    def test_crawl_with_failed_listing_is_not_memoized(self):
+        crawler = self._crawler()
+        crawler.failed_listings = 0
+        discover = crawler.discover_events.side_effect
+
+        async def flaky_discover(year, known=None):
+            crawler.failed_listings += 1
+            return await discover(year, known)
+
+        crawler.discover_events.side_effect = flaky_discover
+        ingestion = ImsaIngestion(crawler=crawler, artifact_index=MagicMock(load=MagicMock(return_value=[])))
+
+        ingestion._discover_weathertech_events(2025)
+        crawler.discover_events.side_effect = discover
+        ingestion._discover_weathertech_events(2025)
+        ingestion._discover_weathertech_events(2025)
+
+        self.assertEqual(crawler.discover_events.call_count, 2)
+
+
+class TestImsaArtifactIndex(unittest.TestCase):
+    def test_sealed_season_is_served_without_http(self):
+        crawler = MagicMock()
+        index = MagicMock()
+        index.load.return_value = [
+            _indexed_event(
+                "02_Daytona/",
+                "Daytona International Speedway",
+                "https://example/05_Results_Race_Official.JSON",
+                datetime(2025, 2, 1, tzinfo=timezone.utc),
+            )
+        ]
+        ingestion = ImsaIngestion(crawler=crawler, artifact_index=index)
+
+        events = ingestion._crawl_year(2024)
+
+        self.assertEqual(events[0]["slug"], "2024-daytona-international-speedway")
+        self.assertEqual(events[0]["artifacts"]["results"], "https://example/05_Results_Race_Official.JSON")
+        crawler.discover_events.assert_not_called()
+        crawler.attach_artifacts.assert_not_called()
+        index.save.assert_not_called()
+
+    def test_open_season_recrawls_only_events_without_final_artifacts(self):
+        in_season = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        final = _indexed_event("02_Daytona/", "Daytona", "https://example/05_Results_Race_Official.JSON", in_season)
+        provisional = _indexed_event("03_Sebring/", "Sebring", "https://example/05_Results_Race_Provisional.JSON", in_season)
+        index = MagicMock()
+        index.load.return_value = [final, provisional]
+
+        crawler = MagicMock()
+        fresh_sebring = {k: v for k, v in provisional.items() if k != "artifacts"}
+
+        async def discover_events(year, known=None):
+            return [known["02_Daytona/"], fresh_sebring]
+
+        async def attach_artifacts(events):
+            return [{**e, "artifacts": {"results": "https://example/sebring-official.json"}} for e in events]
+
+        crawler.discover_events = MagicMock(side_effect=discover_events)
+        crawler.attach_artifacts = MagicMock(side_effect=attach_artifacts)
+        ingestion = ImsaIngestion(crawler=crawler, artifact_index=index)
+
+        events = ingestion._crawl_year(2024)
+
+        self.assertEqual(set(crawler.discover_events.call_args.kwargs["known"]), {"02_Daytona/"})
+        self.assertEqual([e["name"] for e in crawler.attach_artifacts.call_args.args[0]], ["Sebring"])
+        self.assertEqual([e["name"] for e in events], ["Daytona", "Sebring"])
+        self.assertEqual(events[1]["artifacts"]["results"], "https://example/sebring-official.json")
+        # 2024 is over, so the reused Daytona folder is re-stamped alongside the re-crawled one.
+        index.save.assert_called_once_with(2024, events)
+
+    def test_season_indexed_while_running_seals_after_it_ends(self):
+        in_season = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        rows = {
+            "02_Daytona/": _indexed_event("02_Daytona/", "Daytona", "https://example/05_Results_Race_Official.JSON", in_season),
+            "03_Sebring/": _indexed_event("03_Sebring/", "Sebring", "https://example/05_Results_Race_Official.JSON", in_season),
+        }
+        index = MagicMock()
+        index.load.side_effect = lambda year: [dict(row) for row in rows.values()]
+
+        def save(year, events):
+            for event in events:
+                rows[event["track_dir"]] = {**event, "crawled_at": datetime.now(timezone.utc)}
+
+        index.save.side_effect = save
+        crawler = MagicMock()
+
+        async def discover_events(year, known=None):
+            return list(known.values())
+
+        crawler.discover_events = MagicMock(side_effect=discover_events)
+
+        ImsaIngestion(crawler=crawler, artifact_index=index)._crawl_year(2024)
+        crawler.attach_artifacts.assert_not_called()
+        self.assertEqual(len(index.save.call_args.args[1]), 2)
+
+        # The next cycle serves the season from the index without touching Alkamel.
+        crawler.discover_events.reset_mock()
+        events = ImsaIngestion(crawler=crawler, artifact_index=index)._crawl_year(2024)
+
+        crawler.discover_events.assert_not_called()
+        self.assertEqual([e["name"] for e in events], ["Daytona", "Sebring"])
+
+    def test_season_with_unlisted_race_folder_is_not_sealed(self):
+        after_season = datetime(2025, 2, 1, tzinfo=timezone.utc)
+        final = _indexed_event("02_Daytona/", "Daytona", "https://example/05_Results_Race_Official.JSON", after_season)
+        failed = {**_indexed_event("03_Sebring/", "Sebring", None, after_season), "artifacts": {}}
+
+        self.assertTrue(_is_sealed_season(2024, [final]))
+        self.assertFalse(_is_sealed_season(2024, [final, failed]))
+
 
 if __name__ == "__main__":
     unittest.main()
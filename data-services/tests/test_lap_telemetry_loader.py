@@ -0,0 +1,78 @@
+import io
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from ingestion.lap_telemetry_loader import (
+    LAP_TELEMETRY_COPY_SQL,
+    LAP_TELEMETRY_MERGE_SQL,
+    LAP_TELEMETRY_STAGING_DDL,
+    copy_lap_telemetry,
+    encode_lap_telemetry_rows,
+)
+
+
+def _lap(lap_number, **extra):
+    return {"session_id": 10, "driver_id": 4, "car_number": "31", "lap_number": lap_number, **extra}
+
+
+class TestEncodeLapTelemetryRows(unittest.TestCase):
+
+    def test_encodes_copy_text_format(self):
+        out = io.BytesIO()
+        count = encode_lap_telemetry_rows(
+            [_lap(
+                1,
+                lap_time="1:36.1\t",
+                lap_timestamp=datetime(2025, 1, 25, 13, 40, tzinfo=timezone.utc),
+                is_valid=True,
+                crossing_pit_finish_lane=False,
+            )],
+            out,
+        )
+
+        fields = out.getvalue().decode("utf-8").rstrip("\n").split("\t")
+        self.assertEqual(count, 1)
+        self.assertEqual(len(fields), 16)
+        self.assertEqual(fields[:5], ["10", "4", "31", "1", "\\N"])
+        self.assertEqual(fields[5], "1:36.1\\t")
+        self.assertEqual(fields[13], "2025-01-25T13:40:00+00:00")
+        self.assertEqual(fields[14:], ["t", "f"])
+
+
+class TestCopyLapTelemetry(unittest.TestCase):
+
+    def test_copies_into_staging_then_merges(self):
+        db = MagicMock()
+        cursor = db.connection.return_value.connection.cursor.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, f: copied.append(f.read())
+        db.execute.return_value.rowcount = 2
+
+        merged = copy_lap_telemetry(db, iter([_lap(1), _lap(2)]))
+
+        self.assertEqual(merged, 2)
+        executed = [c.args[0] for c in db.execute.call_args_list]
+        self.assertIs(executed[0], LAP_TELEMETRY_STAGING_DDL)
+        self.assertIs(executed[-1], LAP_TELEMETRY_MERGE_SQL)
+        cursor.copy_expert.assert_called_once()
+        self.assertEqual(cursor.copy_expert.call_args.args[0], LAP_TELEMETRY_COPY_SQL)
+        self.assertEqual(copied[0].count(b"\n"), 2)
+        cursor.close.assert_called_once()
+
+    def test_merge_keeps_last_staged_copy_of_a_lap(self):
+        sql = str(LAP_TELEMETRY_MERGE_SQL)
+        self.assertIn("DISTINCT ON (session_id, car_number, lap_number)", sql)
+        self.assertIn("ordinal DESC", sql)
+        self.assertIn("ON CONFLICT (session_id, car_number, lap_number) DO UPDATE", sql)
+        self.assertNotIn("session_id = EXCLUDED", sql)
+
+    def test_no_rows_skips_the_database(self):
+        db = MagicMock()
+        self.assertEqual(copy_lap_telemetry(db, iter([])), 0)
+        db.execute.assert_not_called()
+        db.connection.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
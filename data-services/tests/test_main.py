@@ -1,8 +1,9 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from contextlib import contextmanager
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, timezone
 
+from ingestion.event_status import StatusChanges
 from ingestion.main import (
     get_event_slugs_needing_results,
     update_event_statuses,
@@ -10,6 +11,11 @@ from ingestion.main import (
     previous_year,
     run_historical_sync,
     _season_has_results,
+    _idle_seconds,
+    fetch_session_results,
+    scheduled_results_check,
+    _refresh_session_windows,
+    run_initial_sync,
 )
 
 
@@ -31,52 +37,28 @@ class TestCurrentAndPreviousYear(unittest.TestCase):
 
 class TestGetEventSlugsNeedingResults(unittest.TestCase):
 
+    @patch("ingestion.main.events_missing_results")
     @patch("ingestion.main.db_session")
-    def test_returns_empty_when_no_events(self, mock_db_session_fn):
+    def test_returns_empty_when_no_events(self, mock_db_session_fn, mock_missing):
         mock_db = MagicMock()
         mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
-        mock_db.query.return_value.join.return_value.join.return_value.filter.return_value.all.return_value = []
+        mock_missing.return_value = []
 
         result = get_event_slugs_needing_results(2025)
         self.assertEqual(result, [])
 
+    @patch("ingestion.main.events_missing_results")
     @patch("ingestion.main.db_session")
-    def test_returns_slugs_for_events_missing_results(self, mock_db_session_fn):
+    def test_returns_slugs_for_events_missing_results(self, mock_db_session_fn, mock_missing):
         mock_db = MagicMock()
         mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
-
-        mock_event = MagicMock()
-        mock_event.id = 1
-        mock_event.slug = "2025-australian-grand-prix"
-
-        mock_session = MagicMock()
-        mock_session.id = 10
-        mock_session.type = "race"
-
-        # Build separate mock return values for each model query
-        event_query = MagicMock()
-        event_query.join.return_value.join.return_value.filter.return_value.all.return_value = [mock_event]
-
-        session_query = MagicMock()
-        session_query.filter.return_value.all.return_value = [mock_session]
-
-        result_query = MagicMock()
-        result_query.filter.return_value.count.return_value = 0
-
-        def query_side_effect(model):
-            name = getattr(model, "__name__", "")
-            if name == "Event":
-                return event_query
-            elif name == "Session":
-                return session_query
-            elif name == "Result":
-                return result_query
-            return MagicMock()
-
-        mock_db.query.side_effect = query_side_effect
+        mock_missing.return_value = ["2025-australian-grand-prix"]
 
         result = get_event_slugs_needing_results(2025)
+
         self.assertIn("2025-australian-grand-prix", result)
+        mock_missing.assert_called_once_with(mock_db, "f1", 2025, ended_before=date.today())
+        mock_db.query.assert_not_called()
 
     @patch("ingestion.main.db_session")
     def test_returns_empty_list_on_exception(self, mock_db_session_fn):
@@ -88,93 +70,64 @@ class TestGetEventSlugsNeedingResults(unittest.TestCase):
 
 class TestUpdateEventStatuses(unittest.TestCase):
 
+    @patch("ingestion.main.apply_status_transitions")
     @patch("ingestion.main.db_session")
-    def test_marks_past_events_as_completed(self, mock_db_session_fn):
+    def test_applies_transitions_in_one_session(self, mock_db_session_fn, mock_apply):
         mock_db = MagicMock()
         mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
+        mock_apply.return_value = StatusChanges(completed=[3], live=[7])
 
-        past_event = MagicMock()
-        past_event.status = "upcoming"
-        past_event.end_date = date.today() - timedelta(days=5)
-
-        # First query returns past events, second returns active events
-        call_count = {"n": 0}
+        changes = update_event_statuses()
 
-        def query_side_effect(model):
-            mock_q = MagicMock()
-            if call_count["n"] == 0:
-                # Past events query
-                mock_q.filter.return_value.all.return_value = [past_event]
-                call_count["n"] += 1
-            else:
-                # Active events query
-                mock_q.filter.return_value.all.return_value = []
-            return mock_q
+        self.assertEqual(changes.completed, [3])
+        self.assertEqual(changes.live, [7])
+        self.assertIs(mock_apply.call_args.args[0], mock_db)
+        self.assertIsNotNone(mock_apply.call_args.args[1].tzinfo)
 
-        mock_db.query.side_effect = query_side_effect
+    @patch("ingestion.main.db_session")
+    def test_returns_none_on_exception(self, mock_db_session_fn):
+        mock_db_session_fn.side_effect = Exception("DB error")
 
-        update_event_statuses()
-        self.assertEqual(past_event.status, "completed")
+        self.assertIsNone(update_event_statuses())
 
 
 class TestSeasonHasResults(unittest.TestCase):
     """Tests for _season_has_results helper."""
 
+    @patch("ingestion.main.season_has_results")
     @patch("ingestion.main.db_session")
-    def test_returns_false_when_no_season(self, mock_db_session_fn):
+    def test_returns_false_when_no_results(self, mock_db_session_fn, mock_has_results):
         mock_db = MagicMock()
         mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_has_results.return_value = False
 
         self.assertFalse(_season_has_results(1950))
+        mock_has_results.assert_called_once_with(mock_db, "f1", 1950)
 
+    @patch("ingestion.main.season_has_results")
     @patch("ingestion.main.db_session")
-    def test_returns_false_when_no_events(self, mock_db_session_fn):
+    def test_returns_true_when_results_exist(self, mock_db_session_fn, mock_has_results):
         mock_db = MagicMock()
         mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
+        mock_has_results.return_value = True
 
-        mock_season = MagicMock(id=1)
-
-        call_count = {"n": 0}
-
-        def query_side_effect(model):
-            model_name = getattr(model, "__name__", "")
-            mock_q = MagicMock()
-            if model_name == "Season":
-                mock_q.filter.return_value.first.return_value = mock_season
-            elif model_name == "Event":
-                mock_q.filter.return_value.all.return_value = []
-            return mock_q
-
-        mock_db.query.side_effect = query_side_effect
-
-        self.assertFalse(_season_has_results(1950))
+        self.assertTrue(_season_has_results(1950))
 
+    @patch("ingestion.main.season_has_results")
     @patch("ingestion.main.db_session")
-    def test_returns_true_when_results_exist(self, mock_db_session_fn):
+    def test_scoped_to_series(self, mock_db_session_fn, mock_has_results):
         mock_db = MagicMock()
         mock_db_session_fn.side_effect = _make_mock_db_session(mock_db)
+        mock_has_results.return_value = False
 
-        mock_season = MagicMock(id=1)
-        mock_event = MagicMock(id=5)
-        mock_session = MagicMock(id=20)
-
-        def query_side_effect(model):
-            model_name = getattr(model, "__name__", "")
-            mock_q = MagicMock()
-            if model_name == "Season":
-                mock_q.filter.return_value.first.return_value = mock_season
-            elif model_name == "Event":
-                mock_q.filter.return_value.all.return_value = [mock_event]
-            elif model_name == "Session":
-                mock_q.filter.return_value.all.return_value = [mock_session]
-            elif model_name == "Result":
-                mock_q.filter.return_value.count.return_value = 22
-            return mock_q
-
-        mock_db.query.side_effect = query_side_effect
+        _season_has_results(2012, series_slug="wec")
+        mock_has_results.assert_called_once_with(mock_db, "wec", 2012)
 
-        self.assertTrue(_season_has_results(1950))
+    @patch("ingestion.main.db_session")
+    def test_returns_false_on_exception(self, mock_db_session_fn):
+        mock_db_session_fn.side_effect = Exception("DB error")
+
+        self.assertFalse(_season_has_results(1950))
 
 
 class TestRunHistoricalSync(unittest.TestCase):
@@ -219,5 +172,143 @@ class TestRunHistoricalSync(unittest.TestCase):
         run_historical_sync(1950, 1950)
 
 
+class TestFetchSessionResults(unittest.TestCase):
+
+    @patch("ingestion.main.session_has_results")
+    @patch("ingestion.main.describe_session")
+    @patch("ingestion.main.db_session")
+    def test_done_when_results_already_exist(self, mock_db_session, mock_describe, mock_has_results):
+        mock_db_session.side_effect = _make_mock_db_session(MagicMock())
+        mock_describe.return_value = ("f1", 2025, "2025-australian-grand-prix", "race", "Race")
+        mock_has_results.return_value = True
+
+        self.assertTrue(fetch_session_results(1))
+
+    @patch("ingestion.main.F1Ingestion")
+    @patch("ingestion.main.session_has_results")
+    @patch("ingestion.main.describe_session")
+    @patch("ingestion.main.db_session")
+    def test_f1_session_syncs_only_that_session(self, mock_db_session, mock_describe, mock_has_results, mock_f1_cls):
+        mock_db_session.side_effect = _make_mock_db_session(MagicMock())
+        mock_describe.return_value = ("f1", 2025, "2025-australian-grand-prix", "qualifying", "Qualifying")
+        mock_has_results.side_effect = [False, True]
+        mock_f1 = mock_f1_cls.return_value
+        mock_f1.resolve_round_number.return_value = 1
+
+        self.assertTrue(fetch_session_results(2))
+        mock_f1._sync_session_results.assert_called_once_with(2025, 1, "Q", 2)
+
+    @patch("ingestion.main.F1Ingestion")
+    @patch("ingestion.main.session_has_results")
+    @patch("ingestion.main.describe_session")
+    @patch("ingestion.main.db_session")
+    def test_f1_sprint_qualifying_uses_its_own_code(self, mock_db_session, mock_describe, mock_has_results, mock_f1_cls):
+        mock_db_session.side_effect = _make_mock_db_session(MagicMock())
+        mock_describe.return_value = ("f1", 2025, "2025-chinese-grand-prix", "qualifying", "Sprint Qualifying")
+        mock_has_results.side_effect = [False, True]
+        mock_f1 = mock_f1_cls.return_value
+        mock_f1.resolve_round_number.return_value = 2
+
+        self.assertTrue(fetch_session_results(11))
+        mock_f1._sync_session_results.assert_called_once_with(2025, 2, "SQ", 11)
+
+    @patch("ingestion.main.WecIngestion")
+    @patch("ingestion.main.session_has_results")
+    @patch("ingestion.main.describe_session")
+    @patch("ingestion.main.db_session")
+    def test_wec_race_not_yet_published(self, mock_db_session, mock_describe, mock_has_results, mock_wec_cls):
+        mock_db_session.side_effect = _make_mock_db_session(MagicMock())
+        mock_describe.return_value = ("wec", 2025, "2025-qatar-1812km", "race", "Race")
+        mock_has_results.return_value = False
+
+        self.assertFalse(fetch_session_results(7))
+        mock_wec_cls.return_value.sync_results_for_year.assert_called_once_with(2025, event_slugs=["2025-qatar-1812km"])
+
+    @patch("ingestion.main.ImsaIngestion")
+    @patch("ingestion.main.session_has_results")
+    @patch("ingestion.main.describe_session")
+    @patch("ingestion.main.db_session")
+    def test_sessions_without_classification_are_dropped(self, mock_db_session, mock_describe, mock_has_results, mock_imsa_cls):
+        mock_db_session.side_effect = _make_mock_db_session(MagicMock())
+        mock_describe.return_value = ("imsa", 2025, "2025-rolex-24", "practice", "Practice 1")
+        mock_has_results.return_value = False
+
+        self.assertTrue(fetch_session_results(8))
+        mock_imsa_cls.assert_not_called()
+
+
+class TestScheduledResultsCheck(unittest.TestCase):
+
+    @patch("ingestion.main.http_client")
+    @patch("ingestion.main.run_series_pipelines")
+    def test_runs_one_pipeline_per_series(self, mock_run_pipelines, _mock_http_client):
+        scheduled_results_check()
+
+        pipelines = mock_run_pipelines.call_args.args[0]
+        self.assertEqual(sorted(pipelines), ["f1", "imsa", "wec"])
+
+
+class TestRunInitialSync(unittest.TestCase):
+
+    @patch("ingestion.main.http_client")
+    @patch("ingestion.main.FeedGenerator")
+    @patch("ingestion.main.update_event_statuses")
+    @patch("ingestion.main._sync_calendar_safely")
+    @patch("ingestion.main.run_series_pipelines")
+    @patch("ingestion.main.ImsaIngestion")
+    @patch("ingestion.main.WecIngestion")
+    @patch("ingestion.main.F1Ingestion")
+    def test_pipelines_reuse_the_calendar_ingesters(
+        self, mock_f1_cls, mock_wec_cls, mock_imsa_cls, mock_run_pipelines, mock_sync_calendar, *_
+    ):
+        run_initial_sync()
+
+        calendar_ingesters = {c.args[1]: c.args[0] for c in mock_sync_calendar.call_args_list}
+        pipelines = mock_run_pipelines.call_args.args[0]
+        for series_slug, ingester_cls in (("f1", mock_f1_cls), ("wec", mock_wec_cls), ("imsa", mock_imsa_cls)):
+            ingester_cls.assert_called_once_with()
+            self.assertIs(pipelines[series_slug].args[0], calendar_ingesters[series_slug])
+
+
+class TestRefreshSessionWindows(unittest.TestCase):
+
+    @patch("ingestion.main.refresh_session_windows")
+    @patch("ingestion.main.result_jobs")
+    @patch("ingestion.main.db_session")
+    def test_queues_ended_sessions_before_pruning(self, mock_db_session, mock_result_jobs, mock_refresh):
+        mock_db_session.side_effect = _make_mock_db_session(MagicMock())
+        calls = MagicMock()
+        calls.attach_mock(mock_result_jobs.enqueue_ended, "enqueue_ended")
+        calls.attach_mock(mock_refresh, "refresh")
+
+        _refresh_session_windows()
+
+        self.assertEqual([c[0] for c in calls.mock_calls], ["enqueue_ended", "refresh"])
+        queued_until = mock_result_jobs.enqueue_ended.call_args.args[1]
+        self.assertEqual(mock_refresh.call_args.args[2], queued_until)
+
+
+class TestIdleSeconds(unittest.TestCase):
+
+    @patch("ingestion.main.schedule")
+    def test_sleeps_until_the_earlier_of_job_and_boundary(self, mock_schedule):
+        mock_schedule.idle_seconds.return_value = 3600.0
+        status_scheduler = MagicMock()
+        status_scheduler.idle_seconds.return_value = 120.0
+
+        self.assertEqual(_idle_seconds(status_scheduler), 120.0)
+
+        mock_schedule.idle_seconds.return_value = -5.0
+        self.assertEqual(_idle_seconds(status_scheduler), 0.0)
+
+    @patch("ingestion.main.schedule")
+    def test_no_jobs_scheduled(self, mock_schedule):
+        mock_schedule.idle_seconds.return_value = None
+        status_scheduler = MagicMock()
+        status_scheduler.idle_seconds.return_value = 900.0
+
+        self.assertEqual(_idle_seconds(status_scheduler), 900.0)
+
+
 if __name__ == "__main__":
     unittest.main()
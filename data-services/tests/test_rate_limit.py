@@ -0,0 +1,74 @@
+import unittest
+from datetime import datetime, timezone
+
+from ingestion.rate_limit import RateLimiter, TokenBucket, parse_rate_limits, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_allows_burst_then_paces_at_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.5)
+        self.assertAlmostEqual(waits[4], 0.5)
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_defer_blocks_until_retry_after_elapses(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=10, clock=clock, sleep=clock.sleep)
+
+        bucket.defer(30)
+        bucket.acquire()
+
+        self.assertGreaterEqual(clock.now, 30)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_buckets_are_per_provider(self):
+        clock = FakeClock()
+        limiter = RateLimiter({"jolpica": (1, 1)}, default=(100, 100), clock=clock, sleep=clock.sleep)
+
+        limiter.acquire("jolpica")
+        limiter.acquire("alkamel")
+        self.assertEqual(clock.sleeps, [])
+
+        limiter.acquire("jolpica")
+        self.assertEqual(clock.sleeps, [1.0])
+
+
+class TestParsing(unittest.TestCase):
+
+    def test_parse_rate_limits(self):
+        self.assertEqual(
+            parse_rate_limits("jolpica=4:4, alkamel=8,bogus,fia=0"),
+            {"jolpica": (4.0, 4.0), "alkamel": (8.0, 8.0)},
+        )
+
+    def test_parse_retry_after_seconds_and_date(self):
+        now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        self.assertEqual(parse_retry_after("120"), 120.0)
+        self.assertEqual(parse_retry_after("Wed, 01 Jan 2025 12:00:30 GMT", now=now), 30.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
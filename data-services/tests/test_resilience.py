@@ -0,0 +1,72 @@
+import unittest
+
+from ingestion.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_delay_is_capped_exponential_with_jitter(self):
+        policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=5.0)
+        upper = lambda low, high: high
+
+        self.assertEqual([policy.delay(a, rng=upper) for a in range(5)], [1.0, 2.0, 4.0, 5.0, 5.0])
+        self.assertEqual(policy.delay(3, rng=lambda low, high: low), 0.0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=3, cooldown_seconds=60, clock=self.clock)
+
+    def _fail(self, times):
+        for _ in range(times):
+            self.breaker.record_failure()
+
+    def test_trips_after_threshold_consecutive_failures(self):
+        self._fail(2)
+        self.breaker.record_success()
+        self._fail(2)
+        self.assertEqual(self.breaker.state, CLOSED)
+
+        self._fail(1)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.snapshot()["rejected"], 1)
+        self.assertEqual(self.breaker.snapshot()["trips"], 1)
+
+    def test_half_open_lets_one_probe_through(self):
+        self._fail(3)
+        self.clock.now = 61
+
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_reopens_for_a_full_cooldown(self):
+        self._fail(3)
+        self.clock.now = 61
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.clock.now = 100
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.snapshot()["trips"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from ingestion.result_jobs import ResultJobQueue
+from ingestion.session_windows import SessionWindow, SessionWindowIndex
+
+T0 = datetime(2025, 3, 16, 4, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+class TestResultJobQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock(T0)
+        self.fetch = MagicMock(return_value=False)
+        self.queue = ResultJobQueue(
+            self.fetch, first_retry_seconds=60, max_retry_seconds=300, give_up_seconds=3600, clock=self.clock
+        )
+
+    def test_runs_immediately_at_session_end(self):
+        self.fetch.return_value = True
+        self.queue.enqueue(7, T0)
+
+        self.assertEqual(self.queue.idle_seconds(), 0.0)
+        self.assertEqual(self.queue.run_pending(), 1)
+        self.fetch.assert_called_once_with(7)
+        self.assertEqual(len(self.queue), 0)
+        self.assertIsNone(self.queue.idle_seconds())
+
+    def test_backs_off_until_results_are_published(self):
+        self.queue.enqueue(7, T0)
+        due_times = []
+        for _ in range(5):
+            self.queue.run_pending()
+            due_times.append(self.queue.next_due() - self.clock.now)
+            self.clock.now = self.queue.next_due()
+
+        self.assertEqual([d.total_seconds() for d in due_times], [60, 120, 240, 300, 300])
+
+        self.fetch.return_value = True
+        self.assertEqual(self.queue.run_pending(), 1)
+        self.assertEqual(self.fetch.call_count, 6)
+
+    def test_does_not_run_before_due(self):
+        self.queue.enqueue(7, T0 + timedelta(minutes=5))
+        self.assertEqual(self.queue.run_pending(), 0)
+        self.fetch.assert_not_called()
+
+    def test_failures_are_retried(self):
+        self.fetch.side_effect = [RuntimeError("provider down"), True]
+        self.queue.enqueue(7, T0)
+
+        self.assertEqual(self.queue.run_pending(), 0)
+        self.clock.advance(minutes=1)
+        self.assertEqual(self.queue.run_pending(), 1)
+
+    def test_gives_up_after_horizon(self):
+        self.queue.enqueue(7, T0)
+        self.clock.advance(hours=1)
+
+        self.assertEqual(self.queue.run_pending(), 1)
+        self.assertEqual(len(self.queue), 0)
+
+    def test_same_session_is_queued_once(self):
+        self.queue.enqueue(7, T0)
+        self.queue.enqueue(7, T0)
+        self.assertEqual(len(self.queue), 1)
+
+    def test_enqueue_ended_queues_sessions_closed_since_last_call(self):
+        index = SessionWindowIndex([
+            SessionWindow(1, 1, T0 - timedelta(hours=2), T0 - timedelta(hours=1)),
+            SessionWindow(2, 1, T0, T0 + timedelta(hours=2)),
+        ])
+        self.queue.enqueue_ended(index)
+        self.assertEqual(len(self.queue), 0)
+
+        self.clock.advance(hours=2)
+        self.queue.enqueue_ended(index)
+        self.queue.enqueue_ended(index)
+
+        self.assertEqual(len(self.queue), 1)
+        self.assertEqual(self.queue.next_due(), T0 + timedelta(hours=2))
+
+    def test_sessions_ended_before_a_prune_are_queued(self):
+        index = SessionWindowIndex([SessionWindow(2, 1, T0, T0 + timedelta(hours=2))])
+        self.queue.enqueue_ended(index)
+
+        refreshed_at = T0 + timedelta(hours=2, minutes=1)
+        self.queue.enqueue_ended(index, refreshed_at)
+        index.prune(refreshed_at)
+        self.clock.now = refreshed_at + timedelta(seconds=1)
+        self.queue.enqueue_ended(index)
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(len(self.queue), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+from datetime import date, datetime
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session as DbSession
+
+from ingestion.models import Base, Circuit, Driver, Event, Result, Season, Series, Session
+from ingestion.results_queries import (
+    describe_session,
+    events_missing_results,
+    season_has_results,
+    session_has_results,
+    sessions_missing_results,
+)
+
+
+class ResultsQueriesTestCase(unittest.TestCase):
+    """Runs the queries against an in-memory SQLite copy of the schema (ids are explicit: no BIGSERIAL)."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: self.statements.append(args[2]))
+        self.db = DbSession(self.engine)
+        self.addCleanup(self.db.close)
+
+        self.db.add_all([
+            Series(id=1, name="Formula 1", slug="f1", color_primary="#E10600", color_secondary="#FFFFFF"),
+            Series(id=2, name="WEC", slug="wec", color_primary="#00A0E0", color_secondary="#FFFFFF"),
+            Season(id=1, series_id=1, year=2025),
+            Season(id=2, series_id=2, year=2025),
+            Circuit(id=1, name="Albert Park", country="Australia", city="Melbourne", timezone="UTC"),
+            Driver(id=1, name="Lando Norris", slug="lando-norris"),
+        ])
+        self._event(1, 1, "2025-australian-grand-prix", date(2025, 3, 16))
+        self._event(2, 1, "2025-chinese-grand-prix", date(2025, 3, 23))
+        self._event(3, 1, "2025-japanese-grand-prix", date(2025, 4, 6))
+        self._event(4, 2, "2025-qatar-1812km", date(2025, 2, 28))
+        self._session(1, 1, "race", with_result=True)
+        self._session(2, 1, "qualifying", with_result=True)
+        self._session(3, 2, "race", with_result=True)
+        self._session(4, 2, "sprint")
+        self._session(5, 2, "practice")
+        self._session(6, 3, "race")
+        self._session(7, 4, "race")
+        self.db.commit()
+        self.statements.clear()
+
+    def _event(self, event_id, season_id, slug, end_date):
+        self.db.add(Event(
+            id=event_id, season_id=season_id, circuit_id=1, name=slug, slug=slug,
+            start_date=end_date, end_date=end_date,
+        ))
+
+    def _session(self, session_id, event_id, session_type, with_result=False):
+        self.db.add(Session(
+            id=session_id, event_id=event_id, type=session_type, name=session_type, start_time=datetime(2025, 1, 1),
+        ))
+        if with_result:
+            self.db.add(Result(id=session_id, session_id=session_id, driver_id=1, position=1))
+
+
+class TestEventsMissingResults(ResultsQueriesTestCase):
+
+    def test_returns_events_with_any_result_session_missing(self):
+        slugs = events_missing_results(self.db, "f1", 2025)
+        self.assertEqual(slugs, ["2025-chinese-grand-prix", "2025-japanese-grand-prix"])
+        self.assertEqual(len(self.statements), 1)
+
+    def test_only_considers_requested_session_types(self):
+        # The Chinese GP is only missing sprint (and practice, which never counts) results.
+        slugs = events_missing_results(self.db, "f1", 2025, session_types=("race", "qualifying"))
+        self.assertEqual(slugs, ["2025-japanese-grand-prix"])
+
+    def test_only_events_that_have_ended(self):
+        slugs = events_missing_results(self.db, "f1", 2025, ended_before=date(2025, 4, 1))
+        self.assertEqual(slugs, ["2025-chinese-grand-prix"])
+
+    def test_scoped_to_series_and_year(self):
+        self.assertEqual(events_missing_results(self.db, "wec", 2025), ["2025-qatar-1812km"])
+        self.assertEqual(events_missing_results(self.db, "f1", 2024), [])
+
+
+class TestSessionsMissingResults(ResultsQueriesTestCase):
+
+    def test_returns_event_and_session_pairs(self):
+        pairs = sessions_missing_results(self.db, "f1", 2025, ("race",))
+        self.assertEqual([(e.slug, s.id) for e, s in pairs], [("2025-japanese-grand-prix", 6)])
+        self.assertEqual(len(self.statements), 1)
+
+    def test_limited_to_given_events(self):
+        pairs = sessions_missing_results(self.db, "f1", 2025, event_slugs=["2025-chinese-grand-prix"])
+        self.assertEqual([s.id for _, s in pairs], [4])
+        self.assertEqual(sessions_missing_results(self.db, "f1", 2025, event_slugs=[]), [])
+
+
+class TestSingleSession(ResultsQueriesTestCase):
+
+    def test_session_has_results(self):
+        self.assertTrue(session_has_results(self.db, 1))
+        self.assertFalse(session_has_results(self.db, 4))
+
+    def test_describe_session(self):
+        self.assertEqual(tuple(describe_session(self.db, 7)), ("wec", 2025, "2025-qatar-1812km", "race", "race"))
+        self.assertIsNone(describe_session(self.db, 99))
+
+
+class TestSeasonHasResults(ResultsQueriesTestCase):
+
+    def test_true_when_any_session_has_results(self):
+        self.assertTrue(season_has_results(self.db, "f1", 2025))
+        self.assertEqual(len(self.statements), 1)
+
+    def test_false_for_series_without_results(self):
+        self.assertFalse(season_has_results(self.db, "wec", 2025))
+        self.assertFalse(season_has_results(self.db, "f1", 1950))
+
+
+if __name__ == "__main__":
+    unittest.main()
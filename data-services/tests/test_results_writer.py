@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from ingestion.results_writer import _normalize_rows, upsert_results
+
+
+def _row(driver_id, position, **extra):
+    return {"session_id": 1, "driver_id": driver_id, "position": position, **extra}
+
+
+class TestNormalizeRows(unittest.TestCase):
+
+    def test_fills_missing_columns_with_defaults(self):
+        (row,) = _normalize_rows([_row(7, 3)])
+        self.assertEqual(row["status"], "finished")
+        self.assertEqual(row["class_name"], "Overall")
+        self.assertIsNone(row["gap"])
+        self.assertIsNone(row["laps"])
+
+    def test_keeps_last_row_per_unique_key(self):
+        rows = _normalize_rows([
+            _row(7, 3, class_name="GTP"),
+            _row(7, 1, class_name="GTP"),
+            _row(7, 5, class_name="Overall"),
+        ])
+        self.assertEqual([(r["class_name"], r["position"]) for r in rows], [("GTP", 1), ("Overall", 5)])
+
+
+class TestUpsertResults(unittest.TestCase):
+
+    def test_counts_inserted_and_updated_rows(self):
+        db = MagicMock()
+        db.execute.return_value = [(True,), (False,), (True,)]
+
+        counts = upsert_results(db, [_row(1, 1), _row(2, 2), _row(3, 3)])
+
+        self.assertEqual((counts.inserted, counts.updated, counts.total), (2, 1, 3))
+        db.execute.assert_called_once()
+
+    def test_statement_upserts_on_unique_constraint(self):
+        db = MagicMock()
+        db.execute.return_value = []
+
+        upsert_results(db, [_row(1, 1, gap="+1.2")])
+
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT ON CONSTRAINT uq_results_session_driver_class_name DO UPDATE", sql)
+        self.assertIn("gap = excluded.gap", sql)
+        self.assertNotIn("driver_id = excluded", sql)
+        self.assertIn("RETURNING xmax = 0 AS inserted", sql)
+
+    def test_splits_large_writes_into_batches(self):
+        db = MagicMock()
+        db.execute.return_value = []
+
+        upsert_results(db, [_row(driver_id, driver_id) for driver_id in range(5)], batch_size=2)
+
+        self.assertEqual(db.execute.call_count, 3)
+
+    def test_no_rows_skips_the_database(self):
+        db = MagicMock()
+        counts = upsert_results(db, [])
+        self.assertEqual(counts.total, 0)
+        db.execute.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
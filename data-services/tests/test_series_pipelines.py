@@ -0,0 +1,40 @@
+import threading
+import unittest
+
+from ingestion.series_pipelines import run_series_pipelines
+
+
+class TestRunSeriesPipelines(unittest.TestCase):
+
+    def test_series_run_concurrently(self):
+        # Each pipeline waits for the other two; run one after another this would time out.
+        barrier = threading.Barrier(3, timeout=5)
+        outcomes = run_series_pipelines({slug: barrier.wait for slug in ("f1", "wec", "imsa")}, max_workers=3)
+
+        self.assertTrue(all(outcome.ok for outcome in outcomes.values()))
+
+    def test_failure_is_captured_per_series(self):
+        ran = []
+
+        def broken():
+            raise RuntimeError("provider down")
+
+        outcomes = run_series_pipelines({"f1": broken, "wec": lambda: ran.append("wec")}, max_workers=2)
+
+        self.assertFalse(outcomes["f1"].ok)
+        self.assertIsInstance(outcomes["f1"].error, RuntimeError)
+        self.assertTrue(outcomes["wec"].ok)
+        self.assertEqual(ran, ["wec"])
+
+    def test_single_worker_runs_in_order(self):
+        ran = []
+        outcomes = run_series_pipelines(
+            {slug: (lambda slug=slug: ran.append(slug)) for slug in ("f1", "wec", "imsa")}, max_workers=1
+        )
+
+        self.assertEqual(ran, ["f1", "wec", "imsa"])
+        self.assertEqual(list(outcomes), ["f1", "wec", "imsa"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session as DbSession
+
+from ingestion.models import Base, Circuit, Event, Season, Series, Session
+from ingestion.session_windows import (
+    SessionWindow,
+    SessionWindowIndex,
+    event_completion_time,
+    load_session_windows,
+    season_event_ids,
+)
+
+T0 = datetime(2025, 3, 16, 4, 0, tzinfo=timezone.utc)
+
+
+def _window(session_id, event_id, start_hours, end_hours):
+    return SessionWindow(session_id, event_id, T0 + timedelta(hours=start_hours), T0 + timedelta(hours=end_hours))
+
+
+class TestSessionWindowIndex(unittest.TestCase):
+
+    def setUp(self):
+        # Event 1: qualifying 0-1h, race 2-4h. Event 2 overlaps the race from 3-5h.
+        self.index = SessionWindowIndex([_window(1, 1, 0, 1), _window(2, 1, 2, 4), _window(3, 2, 3, 5)])
+
+    def test_live_events_uses_half_open_windows(self):
+        self.assertEqual(self.index.live_events(T0 - timedelta(minutes=1)), frozenset())
+        self.assertEqual(self.index.live_events(T0), {1})
+        self.assertEqual(self.index.live_events(T0 + timedelta(hours=1)), frozenset())
+        self.assertEqual(self.index.live_events(T0 + timedelta(hours=3, minutes=30)), {1, 2})
+        self.assertEqual(self.index.live_events(T0 + timedelta(hours=4)), {2})
+        self.assertEqual(self.index.live_events(T0 + timedelta(hours=5)), frozenset())
+
+    def test_next_transition(self):
+        self.assertEqual(self.index.next_transition(T0 - timedelta(days=1)), T0)
+        self.assertEqual(self.index.next_transition(T0), T0 + timedelta(hours=1))
+        self.assertEqual(self.index.next_transition(T0 + timedelta(hours=1, minutes=5)), T0 + timedelta(hours=2))
+        self.assertIsNone(self.index.next_transition(T0 + timedelta(hours=5)))
+
+    def test_crossed_boundary(self):
+        self.assertFalse(self.index.crossed_boundary(T0 + timedelta(minutes=10), T0 + timedelta(minutes=40)))
+        self.assertTrue(self.index.crossed_boundary(T0 + timedelta(minutes=40), T0 + timedelta(hours=1)))
+
+    def test_ended_between(self):
+        ended = self.index.ended_between(T0 + timedelta(minutes=30), T0 + timedelta(hours=4))
+        self.assertEqual([w.session_id for w in ended], [1, 2])
+        self.assertEqual(self.index.ended_between(T0 + timedelta(hours=4), T0 + timedelta(hours=4, minutes=59)), [])
+
+    def test_overlapping_windows_of_one_event(self):
+        index = SessionWindowIndex([_window(1, 1, 0, 2), _window(2, 1, 1, 3)])
+        self.assertEqual(index.live_events(T0 + timedelta(hours=2, minutes=30)), {1})
+
+    def test_completion_is_a_transition(self):
+        index = SessionWindowIndex(completions={1: event_completion_time(date(2025, 3, 16))})
+        self.assertEqual(index.next_transition(T0), datetime(2025, 3, 17, tzinfo=timezone.utc))
+        self.assertEqual(index.live_events(T0 + timedelta(days=1)), frozenset())
+
+    def test_replace_events_only_touches_given_events(self):
+        self.index.replace_events([_window(4, 2, 6, 7)], {}, event_ids=[2])
+
+        self.assertEqual(self.index.live_events(T0 + timedelta(hours=4, minutes=30)), frozenset())
+        self.assertEqual(self.index.live_events(T0 + timedelta(hours=6)), {2})
+        self.assertEqual(self.index.live_events(T0), {1})
+        self.assertEqual(len(self.index), 3)
+
+    def test_replace_events_drops_events_without_windows(self):
+        self.index.replace_events([], {}, event_ids=[1])
+        self.assertEqual(self.index.live_events(T0), frozenset())
+        self.assertEqual(len(self.index), 1)
+
+    def test_prune_forgets_finished_windows(self):
+        self.index.prune(T0 + timedelta(hours=4, minutes=30))
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.live_events(T0 + timedelta(hours=4, minutes=30)), {2})
+
+
+class TestLoadSessionWindows(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.db = DbSession(engine)
+        self.addCleanup(self.db.close)
+        now = T0.replace(tzinfo=None)
+        self.now = now
+        self.db.add_all([
+            Series(id=1, name="WEC", slug="wec", color_primary="#00A0E0", color_secondary="#FFFFFF"),
+            Season(id=1, series_id=1, year=2025),
+            Circuit(id=1, name="Sebring", country="United States", city="Sebring", timezone="UTC"),
+            Event(id=1, season_id=1, circuit_id=1, name="Old", slug="old", start_date=date(2025, 1, 1), end_date=date(2025, 1, 2)),
+            Event(id=2, season_id=1, circuit_id=1, name="Now", slug="now", start_date=date(2025, 3, 15), end_date=date(2025, 3, 16)),
+            Session(id=1, event_id=1, type="race", name="Race", start_time=datetime(2025, 1, 2, 12)),
+            Session(id=2, event_id=2, type="race", name="Race", start_time=now - timedelta(hours=1)),
+            Session(id=3, event_id=2, type="qualifying", name="Q", start_time=now - timedelta(days=1),
+                    end_time=now - timedelta(days=1) + timedelta(hours=1)),
+        ])
+        self.db.commit()
+
+    def test_loads_current_windows_with_assumed_end(self):
+        windows, completions = load_session_windows(self.db, self.now)
+
+        self.assertEqual([w.session_id for w in windows], [2])
+        self.assertEqual(windows[0].end, self.now + timedelta(hours=2))
+        self.assertEqual(completions, {2: datetime(2025, 3, 17, tzinfo=timezone.utc)})
+
+    def test_season_event_ids(self):
+        self.assertEqual(sorted(season_event_ids(self.db, "wec", 2025)), [1, 2])
+        self.assertEqual(season_event_ids(self.db, "imsa", 2025), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
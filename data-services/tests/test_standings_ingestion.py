@@ -17,7 +17,7 @@ class TestStandingsHelpers(unittest.TestCase):
         self.assertEqual(_points_for_position(4, table), 0)
         self.assertEqual(_points_for_position(0, table), 0)
 
-    @patch("ingestion.standings_ingestion.requests.get")
+    @patch("ingestion.standings_ingestion.http_client.get")
     def test_fetch_jolpica_driver_standings(self, mock_get):
         mock_get.return_value.json.return_value = {
             "MRData": {
@@ -32,7 +32,7 @@ class TestStandingsHelpers(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["position"], "1")
 
-    @patch("ingestion.standings_ingestion.requests.get")
+    @patch("ingestion.standings_ingestion.http_client.get")
     def test_fetch_jolpica_constructor_standings(self, mock_get):
         mock_get.return_value.json.return_value = {
             "MRData": {
@@ -63,6 +63,19 @@ class TestStandingsSyncRouting(unittest.TestCase):
         mock_derived.assert_any_call("wec", 2025)
         mock_derived.assert_any_call("imsa", 2025)
 
+    @patch.object(StandingsIngestion, "sync_derived_standings_from_results")
+    @patch.object(StandingsIngestion, "sync_f1_official_standings")
+    def test_sync_series_for_year_only_touches_that_series(self, mock_f1_official, mock_derived):
+        mock_f1_official.return_value = True
+        ingestion = StandingsIngestion()
+
+        ingestion.sync_series_for_year("f1", 2025)
+        mock_derived.assert_not_called()
+
+        ingestion.sync_series_for_year("wec", 2025)
+        mock_f1_official.assert_called_once_with(2025)
+        mock_derived.assert_called_once_with("wec", 2025)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from ingestion.session_windows import SessionWindow, SessionWindowIndex
+from ingestion.status_scheduler import TransitionScheduler
+
+T0 = datetime(2025, 3, 16, 4, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+class TestTransitionScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock(T0)
+        # Race from 05:00 to 07:00.
+        self.index = SessionWindowIndex([SessionWindow(1, 1, T0 + timedelta(hours=1), T0 + timedelta(hours=3))])
+        self.on_transition = MagicMock()
+        self.scheduler = TransitionScheduler(self.index, self.on_transition, safety_poll_seconds=900, clock=self.clock)
+
+    def test_runs_immediately_the_first_time(self):
+        self.assertTrue(self.scheduler.run_pending())
+        self.on_transition.assert_called_once()
+
+    def test_sleeps_until_the_safety_poll_when_no_boundary_is_near(self):
+        self.scheduler.run_pending()
+        self.assertEqual(self.scheduler.idle_seconds(), 900)
+
+        self.clock.advance(minutes=14, seconds=59)
+        self.assertFalse(self.scheduler.run_pending())
+        self.clock.advance(seconds=1)
+        self.assertTrue(self.scheduler.run_pending())
+        self.assertEqual(self.on_transition.call_count, 2)
+
+    def test_wakes_exactly_at_session_start_and_end(self):
+        self.clock.advance(minutes=50)
+        self.scheduler.run_pending()
+        self.assertEqual(self.scheduler.next_due(), T0 + timedelta(hours=1))
+        self.assertEqual(self.scheduler.idle_seconds(), 600)
+
+        self.clock.now = T0 + timedelta(hours=1)
+        self.assertTrue(self.scheduler.run_pending())
+
+        self.clock.now = T0 + timedelta(hours=2, minutes=50)
+        self.scheduler.run_pending()
+        self.assertEqual(self.scheduler.next_due(), T0 + timedelta(hours=3))
+
+    def test_picks_up_windows_added_after_scheduling(self):
+        self.scheduler.run_pending()
+        self.index.replace_events([SessionWindow(2, 2, T0 + timedelta(minutes=5), T0 + timedelta(minutes=35))], {})
+
+        self.assertEqual(self.scheduler.next_due(), T0 + timedelta(minutes=5))
+
+    def test_queries_far_fewer_times_than_a_fixed_poll(self):
+        for _ in range(24 * 60):
+            self.scheduler.run_pending()
+            self.clock.advance(minutes=1)
+
+        # One run per 15-minute safety poll (the race boundaries land on poll ticks), instead of
+        # 2,880 runs of a 30-second poll.
+        self.assertEqual(self.on_transition.call_count, 24 * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from ingestion.ttl_cache import TtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTtlCache(unittest.TestCase):
+
+    def test_reuses_value_within_ttl(self):
+        clock = FakeClock()
+        cache = TtlCache(60, clock=clock)
+        calls = []
+
+        def load():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(cache.get_or_load("k", load), 1)
+        clock.now = 59
+        self.assertEqual(cache.get_or_load("k", load), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_reloads_after_expiry(self):
+        clock = FakeClock()
+        cache = TtlCache(60, clock=clock)
+        values = iter(["first", "second"])
+
+        self.assertEqual(cache.get_or_load("k", lambda: next(values)), "first")
+        clock.now = 61
+        self.assertEqual(cache.get_or_load("k", lambda: next(values)), "second")
+
+    def test_invalidate(self):
+        cache = TtlCache(60)
+        values = iter([1, 2])
+        cache.get_or_load("k", lambda: next(values))
+        cache.invalidate("k")
+        self.assertEqual(cache.get_or_load("k", lambda: next(values)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
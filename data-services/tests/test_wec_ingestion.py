@@ -1,6 +1,12 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
-from ingestion.wec_ingestion import _extract_wec_race_rows, _normalize_key, _parse_wec_calendar_text
+from ingestion.wec_ingestion import (
+    WecIngestion,
+    _extract_wec_race_rows,
+    _normalize_key,
+    _parse_wec_calendar_page,
+)
 
 
 SAMPLE_WEC_TEXT = """
@@ -24,11 +30,20 @@ Jun
 24 Hours of Le Mans LE MANS 24 HEURES
 """
 
+SAMPLE_WEC_HTML = (
+    "<html><body><p>Sport competitions</p>"
+    "<div>26</div><div>Feb</div><div>28</div><div>Feb</div>"
+    '<a href="/events/world-endurance-championship/season-2025/qatar-1812km/race">Qatar 1812Km</a>'
+    '<a href="/events/world-endurance-championship/season-2025/qatar-1812km/race-classification">Results</a>'
+    '<a href="/events/world-endurance-championship/season-2024/qatar-1812km/race">2024</a>'
+    "</body></html>"
+)
+
 
 class TestWecParsing(unittest.TestCase):
 
-    def test_parse_wec_calendar_text(self):
-        events = _parse_wec_calendar_text(2025, SAMPLE_WEC_TEXT)
+    def test_parse_wec_calendar_events(self):
+        events = _parse_wec_calendar_page(2025, SAMPLE_WEC_TEXT).events
 
         self.assertEqual(len(events), 3)
         self.assertEqual(events[0]["name"], "Qatar 1812Km")
@@ -58,6 +73,58 @@ class TestWecParsing(unittest.TestCase):
         self.assertEqual(rows[0]["team_name"], "FERRARI AF CORSE")
         self.assertEqual(rows[1]["gap"], "8.491")
 
+    def test_extract_wec_race_rows_selects_table_by_header_signature(self):
+        html = """
+        <html><head><script>var t = "<table><tr><td>Pos</td></tr></table>";</script></head>
+        <body><nav><a href="/x">Nav</a></nav>
+        <table><tr><td>Pos</td><td>Points</td></tr><tr><td>1</td><td>25</td></tr></table>
+        <table>
+          <tr><td>Pos</td><td>Team</td><td>Drivers</td><td>Class</td></tr>
+          <tr><td>1</td><td>6 PORSCHE PENSKE</td><td>K.Estre/Vanthoor</td><td>HYPERCAR</td></tr>
+        </table></body></html>
+        """
+        for parser in ("html.parser", "lxml"):
+            with self.subTest(parser=parser), patch("ingestion.wec_ingestion.CLASSIFICATION_PARSER", parser):
+                rows = _extract_wec_race_rows(html)
+                self.assertEqual(len(rows), 1)
+                self.assertEqual(rows[0]["car_number"], 6)
+                self.assertEqual(rows[0]["class_name"], "HYPERCAR")
+
+    def test_parse_wec_calendar_page(self):
+        page = _parse_wec_calendar_page(2025, SAMPLE_WEC_HTML)
+
+        self.assertEqual([e["name"] for e in page.events], ["Qatar 1812Km"])
+        self.assertEqual(
+            page.result_links,
+            {
+                "qatar-1812km": "https://www.fia.com/events/world-endurance-championship/season-2025/qatar-1812km/race-classification"
+            },
+        )
+
+
+class TestWecCalendarPageCache(unittest.TestCase):
+
+    @patch("ingestion.wec_ingestion.http_client.get")
+    def test_calendar_is_fetched_and_parsed_once_per_ttl(self, mock_get):
+        mock_get.return_value = MagicMock(text=SAMPLE_WEC_HTML)
+        ingestion = WecIngestion()
+
+        with patch("ingestion.wec_ingestion._parse_wec_calendar_page", wraps=_parse_wec_calendar_page) as mock_parse:
+            first = ingestion._calendar_page(2025)
+            second = ingestion._calendar_page(2025)
+
+        self.assertIs(first, second)
+        mock_get.assert_called_once()
+        mock_parse.assert_called_once()
+
+    @patch("ingestion.wec_ingestion.http_client.get")
+    def test_failed_fetch_is_not_cached(self, mock_get):
+        mock_get.side_effect = [Exception("down"), MagicMock(text=SAMPLE_WEC_HTML)]
+        ingestion = WecIngestion()
+
+        self.assertIsNone(ingestion._calendar_page(2025))
+        self.assertIsNotNone(ingestion._calendar_page(2025))
+
 
 if __name__ == "__main__":
     unittest.main()